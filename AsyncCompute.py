@@ -0,0 +1,305 @@
+"""
+API asyncio untuk menghitung diagram Voronoi tanpa memblokir event loop.
+
+Sweep dijalankan di executor (thread pool atau process pool) per potongan event
+lewat FortunesAlgo.advance(). Di antara potongan, sweep memeriksa flag pembatalan
+yang di-set saat task asyncio pemanggil dibatalkan, lalu melaporkan progres.
+
+Contoh:
+    progress = ComputeProgress()
+    task = asyncio.create_task(compute(sites, rect, progress=progress))
+    async for events, total in progress:
+        print(f"{events}/{total}")
+    diagram = await task
+
+Pada process pool, flag pembatalan dan progres dibagi lewat multiprocessing.Manager
+(dibuat sekali saat pertama dibutuhkan) dan diagram dikirim kembali dalam encoding
+biner DiagramCache. Jumlah total event adalah perkiraan (n site event ditambah
+sekitar 2n - 5 circle event) yang disesuaikan dengan jumlah sebenarnya saat selesai.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from Diagram import Diagram
+from DiagramCache import decode_diagram, encode_diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+
+PROGRESS_POLL_INTERVAL = 0.05  # Interval pembacaan progres dari process pool (detik)
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+class SweepCancelled(Exception):
+    """Dilempar di dalam executor saat sweep dihentikan karena task-nya dibatalkan."""
+
+
+def estimate_events(site_count: int) -> int:
+    """Perkiraan jumlah event sweep: n site event ditambah sekitar 2n - 5 circle event."""
+    return site_count + max(0, 2 * site_count - 5)
+
+
+def run_sweep(sites: List[Site], clipping_rect: Rectangle, chunk_events: int,
+              is_cancelled: Callable[[], bool],
+              report: Optional[Callable[[int, int], None]] = None) -> Diagram:
+    """
+    Menjalankan sweep lengkap per potongan event dengan pemeriksaan pembatalan.
+
+    Args:
+        sites: Titik-titik input
+        clipping_rect: Rectangle clipping
+        chunk_events: Jumlah event per potongan
+        is_cancelled: Fungsi yang mengembalikan True jika sweep harus berhenti
+        report: Callback (event diproses, perkiraan total) setelah setiap potongan
+
+    Raises:
+        SweepCancelled: Jika is_cancelled() bernilai True di antara potongan
+    """
+    sweep = FortunesAlgo()
+    diagram = Diagram()
+    if sweep.begin(sites, clipping_rect, diagram):
+        total = estimate_events(len(sweep.event_queue))
+        while not sweep.advance(chunk_events):
+            if is_cancelled():
+                raise SweepCancelled()
+            if report is not None:
+                # Total tidak boleh lebih kecil dari event yang sudah ada
+                total = max(total, sweep.current_step + len(sweep.event_queue))
+                report(sweep.current_step, total)
+        sweep.terminate()
+    if report is not None:
+        report(sweep.current_step, sweep.current_step)
+    return diagram
+
+
+def _run_sweep_in_process(sites: List[Tuple[float, float]], clip: Tuple[float, float, float, float],
+                          chunk_events: int, cancel_event, done_value, total_value) -> bytes:
+    """Dijalankan di worker process; progres ditulis ke Value milik manager."""
+    def report(done: int, total: int) -> None:
+        total_value.value = total
+        done_value.value = done
+
+    diagram = run_sweep([Site(x, y) for x, y in sites], Rectangle(*clip), chunk_events,
+                        cancel_event.is_set, report)
+    return encode_diagram(diagram)
+
+
+def _get_manager():
+    """multiprocessing.Manager bersama untuk flag pembatalan dan progres di process pool."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from multiprocessing import Manager
+            _manager = Manager()
+        return _manager
+
+
+class ComputeProgress:
+    """
+    Progres satu atau beberapa perhitungan, dapat dibaca sebagai async iterator.
+
+    Setiap iterasi menghasilkan (event diproses, perkiraan total) terbaru; update yang
+    datang lebih cepat dari konsumen digabung. Iterasi berhenti saat semua
+    perhitungan yang terdaftar selesai, gagal, atau dibatalkan.
+
+    Attributes:
+        events: Jumlah event yang sudah diproses (dijumlahkan untuk semua perhitungan)
+        total: Perkiraan jumlah total event
+        finished: True jika semua perhitungan sudah berakhir
+    """
+
+    def __init__(self):
+        self._parts: Dict[int, Tuple[int, int]] = {}
+        self._active = 0
+        self._started = False
+        self._listeners: List[asyncio.Queue] = []
+
+    @property
+    def events(self) -> int:
+        return sum(done for done, _ in self._parts.values())
+
+    @property
+    def total(self) -> int:
+        return sum(total for _, total in self._parts.values())
+
+    @property
+    def finished(self) -> bool:
+        return self._started and self._active == 0
+
+    def _begin(self, key: int, total: int) -> None:
+        self._started = True
+        self._active += 1
+        self._parts[key] = (0, total)
+        self._notify()
+
+    def _update(self, key: int, done: int, total: int) -> None:
+        if key in self._parts:
+            self._parts[key] = (done, total)
+            self._notify()
+
+    def _end(self, key: int) -> None:
+        self._active -= 1
+        self._notify()
+
+    def _notify(self) -> None:
+        state = (self.events, self.total, self.finished)
+        for listener in self._listeners:
+            if listener.full():
+                listener.get_nowait()
+            listener.put_nowait(state)
+
+    async def __aiter__(self):
+        listener: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._listeners.append(listener)
+        try:
+            if self._started:
+                yield self.events, self.total
+                if self.finished:
+                    return
+            while True:
+                events, total, finished = await listener.get()
+                yield events, total
+                if finished:
+                    return
+        finally:
+            self._listeners.remove(listener)
+
+
+async def _compute_in_thread(sites: List[Site], clipping_rect: Rectangle, executor: Optional[Executor],
+                             chunk_events: int, report: Callable[[int, int], None]) -> Diagram:
+    loop = asyncio.get_running_loop()
+    cancel = threading.Event()
+
+    def report_threadsafe(done: int, total: int) -> None:
+        loop.call_soon_threadsafe(report, done, total)
+
+    future = loop.run_in_executor(executor, run_sweep, sites, clipping_rect, chunk_events,
+                                  cancel.is_set, report_threadsafe)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+
+
+async def _compute_in_process(sites: List[Site], clipping_rect: Rectangle, executor: ProcessPoolExecutor,
+                              chunk_events: int, report: Callable[[int, int], None]) -> Diagram:
+    loop = asyncio.get_running_loop()
+    manager = await loop.run_in_executor(None, _get_manager)
+    cancel, done_value, total_value = manager.Event(), manager.Value("q", 0), manager.Value("q", 0)
+    coords = [(s.x, s.y) for s in sites]
+    clip = (clipping_rect.x, clipping_rect.y, clipping_rect.width, clipping_rect.height)
+    future = loop.run_in_executor(executor, _run_sweep_in_process, coords, clip, chunk_events,
+                                  cancel, done_value, total_value)
+    try:
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=PROGRESS_POLL_INTERVAL)
+            if done:
+                break
+            total = total_value.value
+            if total:
+                report(done_value.value, total)
+        data = future.result()
+    except asyncio.CancelledError:
+        cancel.set()
+        future.cancel()
+        raise
+    # Decode membangun ulang objek DCEL; dijalankan di thread agar loop tidak tertahan
+    diagram, _ = await loop.run_in_executor(None, decode_diagram, data)
+    report(done_value.value, done_value.value)
+    return diagram
+
+
+async def _compute(sites: List[Site], clipping_rect: Rectangle, executor: Optional[Executor],
+                   progress: Optional[ComputeProgress], chunk_events: int, key: int) -> Diagram:
+    """Menjalankan satu perhitungan; progres sudah didaftarkan pemanggil dengan key."""
+    def report(done: int, total: int) -> None:
+        if progress is not None:
+            progress._update(key, done, total)
+
+    try:
+        if isinstance(executor, ProcessPoolExecutor):
+            return await _compute_in_process(sites, clipping_rect, executor, chunk_events, report)
+        return await _compute_in_thread(sites, clipping_rect, executor, chunk_events, report)
+    finally:
+        if progress is not None:
+            progress._end(key)
+
+
+async def compute(sites: Iterable[Site], clipping_rect: Rectangle, *, executor: Optional[Executor] = None,
+                  progress: Optional[ComputeProgress] = None, chunk_events: int = 2048) -> Diagram:
+    """
+    Menghitung diagram Voronoi di executor tanpa memblokir event loop.
+
+    Membatalkan task yang menjalankan coroutine ini menghentikan sweep di executor
+    pada batas potongan event berikutnya.
+
+    Args:
+        sites: Titik-titik input
+        clipping_rect: Rectangle clipping
+        executor: Executor tujuan; None memakai thread pool default event loop,
+                  ProcessPoolExecutor menjalankan sweep di process lain
+        progress: Objek ComputeProgress untuk melaporkan progres (opsional)
+        chunk_events: Jumlah event per potongan antara pemeriksaan pembatalan
+
+    Returns:
+        Diagram hasil perhitungan
+    """
+    sites = list(sites)
+    if progress is not None:
+        progress._begin(0, estimate_events(len(sites)))
+    return await _compute(sites, clipping_rect, executor, progress, chunk_events, 0)
+
+
+async def compute_many(jobs: Iterable[Tuple[Iterable[Site], Rectangle]], *, executor: Optional[Executor] = None,
+                       progress: Optional[ComputeProgress] = None, limit: Optional[int] = None,
+                       chunk_events: int = 2048) -> List[Diagram]:
+    """
+    Menghitung banyak diagram secara bersamaan.
+
+    Jika satu perhitungan gagal atau task pemanggil dibatalkan, semua perhitungan
+    lain ikut dibatalkan.
+
+    Args:
+        jobs: Pasangan (sites, clipping_rect)
+        executor: Executor tujuan (lihat compute)
+        progress: ComputeProgress yang menjumlahkan progres semua perhitungan (opsional)
+        limit: Jumlah perhitungan maksimum yang berjalan bersamaan (None = tidak dibatasi)
+        chunk_events: Jumlah event per potongan
+
+    Returns:
+        List diagram dengan urutan yang sama dengan jobs
+    """
+    jobs = [(list(sites), rect) for sites, rect in jobs]
+    if progress is not None:
+        for key, (sites, _) in enumerate(jobs):
+            progress._begin(key, estimate_events(len(sites)))
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(key: int, sites: List[Site], clipping_rect: Rectangle) -> Diagram:
+        if semaphore is None:
+            return await _compute(sites, clipping_rect, executor, progress, chunk_events, key)
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            if progress is not None:
+                progress._end(key)
+            raise
+        try:
+            return await _compute(sites, clipping_rect, executor, progress, chunk_events, key)
+        finally:
+            semaphore.release()
+
+    tasks = [asyncio.ensure_future(run(key, sites, rect)) for key, (sites, rect) in enumerate(jobs)]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -29,6 +29,9 @@ class Arc:
         self.left_half_edge = None  # Half-edge kiri dari cell Voronoi
         self.right_half_edge = None # Half-edge kanan dari cell Voronoi
         self.cell = None            # Cell Voronoi yang terkait dengan arc
+        
+        # Id arc pada EventTrace (-1 jika belum direkam)
+        self.trace_id = -1
 
     def bounds(self, directrix_y):
         """
@@ -66,11 +69,24 @@ class Beachline:
     Implementasi beachline menggunakan Red-Black Tree.
     Beachline menyimpan urutan arc parabolik yang terbentuk saat sweep line bergerak.
     """
-    def __init__(self):
-        """Inisialisasi beachline kosong."""
+    def __init__(self, arc_pool=None):
+        """
+        Inisialisasi beachline kosong.
+        
+        Args:
+            arc_pool: ObjectPool opsional untuk mengambil objek Arc (None = selalu membuat baru)
+        """
         self.sweepline_y = 0
         self.sentinel = Arc()  # Node sentinel untuk Red-Black Tree
         self.root = None
+        self.size = 0  # Jumlah arc pada beachline
+        self.arc_pool = arc_pool
+    
+    def _new_arc(self, point):
+        """Membuat arc baru, dari pool jika tersedia."""
+        if self.arc_pool is not None:
+            return self.arc_pool.acquire(point)
+        return Arc(point=point)
         
     def _minimum(self, x):
         """Mencari node dengan nilai minimum dalam subtree."""
@@ -293,11 +309,12 @@ class Beachline:
         Returns:
             Arc: Arc yang baru disisipkan
         """
-        self.root = Arc(point=point)
+        self.root = self._new_arc(point)
         self.root.left = self.sentinel
         self.root.right = self.sentinel
         self.root.parent = self.sentinel
         self.root.is_black = True
+        self.size = 1
         return self.root
 
     def update_sweepline_y(self, y):
@@ -352,7 +369,7 @@ class Beachline:
             tuple: (arc_baru, is_edge_case) 
                    is_edge_case = True jika titik berada di breakpoint
         """
-        mid = Arc(point=p)  # Arc baru yang akan disisipkan
+        mid = self._new_arc(p)  # Arc baru yang akan disisipkan
         x = self.root
         found = False
         is_edge_case = False
@@ -392,7 +409,7 @@ class Beachline:
                 # 2. Arc tengah (arc baru)
                 # 3. Arc kanan (copy dari arc yang ada)
                 self.insert_successor(x, mid)
-                right = Arc(point=x.point)
+                right = self._new_arc(x.point)
                 self.insert_successor(mid, right)
                 is_edge_case = False
                 found = True
@@ -416,7 +433,7 @@ class Beachline:
             Arc: Arc yang baru disisipkan yang akan membagi arc yang ada
         """
         # Buat arc baru untuk site baru
-        arc = Arc(point=p)
+        arc = self._new_arc(p)
         
         # Mulai dari root
         current = self.root
@@ -444,6 +461,8 @@ class Beachline:
             p: Arc sebelumnya
             s: Arc yang akan disisipkan
         """
+        self.size += 1
+        
         # Update pointer untuk urutan beachline
         s.prev = p
         s.next = p.next
@@ -477,6 +496,22 @@ class Beachline:
             next_arc.prev = prev
         
         self.delete(arc)
+        self.size -= 1
+
+    def height(self):
+        """
+        Menghitung tinggi Red-Black Tree (jumlah level dari root sampai daun terdalam).
+        Membutuhkan waktu O(n), hanya dipakai untuk statistik.
+        """
+        if self.root is None or self.root is self.sentinel:
+            return 0
+        height = 0
+        level = [self.root]
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right)
+                     if child is not self.sentinel and child is not None]
+        return height
 
     @property
     def minimum(self):
@@ -28,36 +28,29 @@ class Circle:
             Objek Circle jika ketiga titik membentuk lingkaran yang valid,
             None jika tidak membentuk lingkaran yang valid
         """
-        # Ambil koordinat x dan y dari ketiga titik
+        # Koordinat relatif terhadap titik pertama agar tidak terjadi pembatalan
+        # numerik pada koordinat besar (kuadrat koordinat absolut kehilangan presisi)
         x1, y1 = p1.x, p1.y
-        x2, y2 = p2.x, p2.y
-        x3, y3 = p3.x, p3.y
+        bx, by = p2.x - x1, p2.y - y1
+        cx, cy = p3.x - x1, p3.y - y1
         
         # Hitung determinan untuk mencari pusat lingkaran
-        a = x1 * (y2 - y3) - y1 * (x2 - x3) + x2 * y3 - x3 * y2
-        
-        # Hitung komponen x dari pusat lingkaran
-        b = ((x1 * x1 + y1 * y1) * (y3 - y2) + 
-             (x2 * x2 + y2 * y2) * (y1 - y3) + 
-             (x3 * x3 + y3 * y3) * (y2 - y1))
-        
-        # Hitung komponen y dari pusat lingkaran
-        c = ((x1 * x1 + y1 * y1) * (x2 - x3) + 
-             (x2 * x2 + y2 * y2) * (x3 - x1) + 
-             (x3 * x3 + y3 * y3) * (x1 - x2))
+        d = 2 * (bx * cy - by * cx)
         
         # Cek apakah ketiga titik segaris (kolinear)
-        if a == 0:
+        if d == 0:
             return None
-            
-        # Hitung koordinat pusat lingkaran
-        x = -b / (2 * a)
-        y = -c / (2 * a)
+        
+        # Hitung pusat lingkaran relatif terhadap titik pertama
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        ux = (cy * b2 - by * c2) / d
+        uy = (bx * c2 - cx * b2) / d
         
         # Buat objek Point untuk pusat lingkaran
-        center = Point(x=x, y=y)
-        # Hitung jari-jari menggunakan jarak dari pusat ke salah satu titik
-        radius = hypot(x - x1, y - y1)
+        center = Point(x=x1 + ux, y=y1 + uy)
+        # Jari-jari adalah jarak dari pusat ke titik pertama
+        radius = hypot(ux, uy)
         
         return cls(center=center, radius=radius)
     
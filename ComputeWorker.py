@@ -0,0 +1,261 @@
+"""
+Worker thread untuk menghitung diagram Voronoi di luar thread UI.
+
+Hanya ada satu slot job tertunda: job baru menggantikan job yang belum dimulai
+dan membatalkan job yang sedang berjalan, sehingga rentetan input hanya
+menghasilkan satu perhitungan untuk state terakhir. Sweep dijalankan per potongan
+event lewat FortunesAlgo.advance(), dan di antara potongan worker memeriksa apakah
+job-nya sudah usang. Hasil diambil oleh thread UI lewat poll(); worker tidak
+pernah menyentuh objek Tk.
+
+Jika job meminta pratinjau, worker lebih dulu menghitung Voronoi raster
+aproksimatif (RasterVoronoi) dan mengirimkannya sebagai hasil sementara
+sebelum sweep eksak dimulai.
+
+Jika worker diberi DiagramCache, diagram untuk himpunan site yang sama diambil
+dari cache tanpa sweep (dan tanpa pratinjau).
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from Constant import eps
+from Diagram import Diagram
+from DiagramCache import DiagramCache, fingerprint
+from FortunesAlgo import FortunesAlgo
+from RasterVoronoi import RasterVoronoi, preview
+from Rectangle import Rectangle
+from Site import Site
+
+
+@dataclass
+class ComputeJob:
+    """
+    Permintaan perhitungan untuk worker.
+
+    Attributes:
+        generation: Nomor urut job; job dengan nomor lebih kecil dianggap usang
+        points: Titik-titik input
+        clipping_rect: Area clipping diagram
+        preview_size: Resolusi (lebar, tinggi) pratinjau raster, None jika tidak perlu
+    """
+    generation: int
+    points: List[Site]
+    clipping_rect: Rectangle
+    preview_size: Optional[Tuple[int, int]] = None
+
+
+@dataclass
+class ComputeResult:
+    """
+    Hasil perhitungan yang dikirim kembali ke thread UI.
+
+    Attributes:
+        generation: Nomor job yang menghasilkan hasil ini
+        points: Titik-titik yang dipakai
+        diagram: Diagram Voronoi yang sudah selesai, atau None jika gagal atau masih pratinjau
+        largest_empty_circles: List (x, y, radius) lingkaran kosong terbesar
+        compute_time: Waktu sweep dan analisis (detik)
+        error: Exception jika perhitungan gagal
+        preview: Hasil raster aproksimatif (hanya pada hasil sementara)
+        preview_scale: Faktor pembesaran preview ke preview_size
+    """
+    generation: int
+    points: List[Site]
+    diagram: Optional[Diagram] = None
+    largest_empty_circles: List[Tuple[float, float, float]] = field(default_factory=list)
+    compute_time: float = 0.0
+    error: Optional[BaseException] = None
+    preview: Optional[RasterVoronoi] = None
+    preview_scale: int = 1
+
+    @property
+    def is_preview(self) -> bool:
+        """True jika ini hasil sementara yang hanya berisi pratinjau raster."""
+        return self.diagram is None and self.preview is not None and self.error is None
+
+
+class JobSuperseded(Exception):
+    """Dilempar di dalam worker saat job yang sedang berjalan sudah digantikan."""
+
+
+def largest_empty_circles(points: List[Site], vertices: List[Site], k: int = 5) -> List[Tuple[float, float, float]]:
+    """
+    Mencari lingkaran kosong terbesar yang berpusat di vertex Voronoi.
+
+    Vertex dianggap valid jika minimal tiga site berjarak sama (dalam eps) darinya.
+    Semua vertex di-query ke KD-Tree sekaligus.
+
+    Args:
+        points: Site diagram
+        vertices: Vertex diagram
+        k: Jumlah tetangga terdekat yang diperiksa per vertex
+
+    Returns:
+        List (x, y, radius) untuk semua vertex valid dengan radius maksimum
+    """
+    if not points or not vertices:
+        return []
+    from scipy.spatial import KDTree
+
+    site_coords = np.array([(p.x, p.y) for p in points], dtype=np.float64)
+    vertex_coords = np.array([(v.x, v.y) for v in vertices], dtype=np.float64)
+    k = min(k, len(site_coords))
+    distances, _ = KDTree(site_coords).query(vertex_coords, k=k)
+    distances = distances.reshape(len(vertex_coords), k)
+    radius = distances[:, 0]
+    close = (np.abs(distances - radius[:, None]) < eps).sum(axis=1)
+    valid = close >= 3
+    if not valid.any():
+        return []
+    max_radius = radius[valid].max()
+    best = valid & (radius == max_radius)
+    return [(x, y, r) for (x, y), r in zip(vertex_coords[best].tolist(), radius[best].tolist())]
+
+
+class ComputeWorker:
+    """
+    Worker thread tunggal dengan pembatalan kooperatif.
+
+    Attributes:
+        chunk_events: Jumlah event yang diproses sebelum memeriksa pembatalan
+        cache: Cache diagram opsional (None = selalu menghitung ulang)
+    """
+
+    def __init__(self, chunk_events: int = 2048, cache: Optional[DiagramCache] = None):
+        self.chunk_events = chunk_events
+        self.cache = cache
+        # Dipakai ulang untuk semua job; arc dan event-nya di-recycle di setiap begin()
+        self._sweep = FortunesAlgo(pooled=True)
+        self._condition = threading.Condition()
+        self._pending: Optional[ComputeJob] = None
+        self._result: Optional[ComputeResult] = None
+        self._generation = 0
+        self._running = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="voronoi-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """True jika ada job yang tertunda, sedang berjalan, atau hasil yang belum diambil."""
+        with self._condition:
+            return self._pending is not None or self._running or self._result is not None
+
+    def submit(self, points: List[Site], clipping_rect: Rectangle,
+               preview_size: Optional[Tuple[int, int]] = None) -> int:
+        """
+        Menjadwalkan perhitungan baru dan membatalkan semua job sebelumnya.
+
+        Args:
+            points: Titik-titik input; list disalin sehingga aman diubah oleh pemanggil
+            clipping_rect: Area clipping diagram
+            preview_size: Resolusi pratinjau raster yang dikirim sebelum hasil eksak (opsional)
+
+        Returns:
+            int: Nomor generation job ini
+        """
+        with self._condition:
+            self._generation += 1
+            self._pending = ComputeJob(self._generation, list(points), clipping_rect, preview_size)
+            self._result = None
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Membatalkan job yang tertunda maupun yang sedang berjalan."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._result = None
+
+    def poll(self) -> Optional[ComputeResult]:
+        """Mengambil hasil terbaru jika ada (non-blocking, dipanggil dari thread UI)."""
+        with self._condition:
+            result, self._result = self._result, None
+            return result
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Menghentikan worker thread."""
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._pending = None
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _is_current(self, job: ComputeJob) -> bool:
+        return job.generation == self._generation and not self._closed
+
+    def _check(self, job: ComputeJob) -> None:
+        if not self._is_current(job):
+            raise JobSuperseded()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                job, self._pending = self._pending, None
+                self._running = True
+            try:
+                result = self._compute(job)
+            except JobSuperseded:
+                result = None
+            except Exception as e:
+                result = ComputeResult(job.generation, job.points, error=e)
+            # Satu critical section: busy tidak boleh terbaca False di antara
+            # selesainya job dan terisinya mailbox
+            with self._condition:
+                self._running = False
+                if result is not None and self._is_current(job):
+                    self._result = result
+
+    def _publish(self, job: ComputeJob, result: ComputeResult) -> None:
+        """Menaruh hasil di mailbox jika job-nya masih yang terbaru."""
+        with self._condition:
+            if self._is_current(job):
+                self._result = result
+
+    def _compute(self, job: ComputeJob) -> ComputeResult:
+        start = time.perf_counter()
+        points = job.points
+        key = None
+        if self.cache is not None and points:
+            key = fingerprint(points, job.clipping_rect)
+            diagram = self.cache.lookup(key)
+            if diagram is not None:
+                return ComputeResult(
+                    job.generation, points, diagram, largest_empty_circles(points, diagram.vertices),
+                    compute_time=time.perf_counter() - start
+                )
+
+        if job.preview_size is not None and points:
+            raster, scale = preview(points, job.clipping_rect, *job.preview_size)
+            self._publish(job, ComputeResult(
+                job.generation, points, preview=raster, preview_scale=scale,
+                compute_time=time.perf_counter() - start
+            ))
+            self._check(job)
+
+        sweep_start = time.perf_counter()
+        sweep = self._sweep
+        diagram = Diagram()
+        if points and sweep.begin(points, job.clipping_rect, diagram):
+            while not sweep.advance(self.chunk_events):
+                self._check(job)
+            sweep.terminate()
+        self._check(job)
+        if key is not None:
+            self.cache.store(key, diagram, time.perf_counter() - sweep_start)
+        circles = largest_empty_circles(points, diagram.vertices)
+        return ComputeResult(
+            job.generation, points, diagram, circles,
+            compute_time=time.perf_counter() - start
+        )
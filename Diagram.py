@@ -1,8 +1,9 @@
-from typing import Optional, List
+from typing import Callable, Optional, List, Iterator
 from weakref import ref, ReferenceType
 from Beachline import Arc
 from Site import Site
 from LineSegment import LineSegment
+from ObjectPool import ObjectPool
 
 Vertex = Site
 
@@ -62,6 +63,8 @@ class Cell:
     def __init__(self, site: Site):
         self.outer_component: Optional[HalfEdge] = None
         self.site: Site = site
+        # Diagram pemilik (weakref) selama cell belum diselesaikan pada mode lazy
+        self._pending: Optional[ReferenceType[Diagram]] = None
     
     def __del__(self):
         """Membersihkan referensi siklik"""
@@ -69,8 +72,22 @@ class Cell:
             self.outer_component.next = None
             self.outer_component.prev = None
     
+    @property
+    def is_finalized(self) -> bool:
+        """False jika cell masih menunggu dilengkapi dan dipotong (mode lazy)"""
+        return self._pending is None
+    
+    def finalize(self) -> None:
+        """Melengkapi dan memotong cell jika masih tertunda; tidak melakukan apa pun jika sudah"""
+        if self._pending is not None:
+            diagram = self._pending()
+            self._pending = None
+            if diagram is not None:
+                diagram._finalize_cell(self)
+    
     def hull_vertices_ccw(self) -> List[Vertex]:
         """Mengembalikan vertex sel dalam urutan berlawanan arah jarum jam"""
+        self.finalize()
         vertices = []
         if not self.outer_component:
             return vertices
@@ -87,6 +104,7 @@ class Cell:
     
     def neighbours(self) -> List['Cell']:
         """Mengembalikan semua sel tetangga dari sel tertentu"""
+        self.finalize()
         neighbours = []
         if not self.outer_component:
             return neighbours
@@ -102,22 +120,83 @@ class Cell:
         return neighbours
 
 class Diagram:
-    """Kelas utama untuk menyimpan struktur diagram Voronoi"""
-    def __init__(self):
+    """
+    Kelas utama untuk menyimpan struktur diagram Voronoi.
+    
+    Dengan pooled=True, Cell dan HalfEdge diambil dari pool dan clear() hanya
+    mengembalikan semuanya ke pool dalam O(1); referensi ke cell atau half-edge
+    lama tidak boleh dipakai lagi setelah clear().
+    
+    Diagram hasil sweep lazy (FortunesAlgo(lazy=True)) belum lengkap: setiap cell
+    dilengkapi dan dipotong saat pertama diakses lewat hull_vertices_ccw(),
+    neighbours(), cell() atau Cell.finalize(). Kode yang menelusuri outer_component
+    secara langsung (misalnya exporter) harus memanggil finalize_all() lebih dulu.
+    """
+    def __init__(self, pooled: bool = False):
         self.cells: List[Cell] = []
         self.vertices: List[Vertex] = []
+        self.half_edge_count = 0  # Jumlah half-edge yang pernah dibuat
+        self.cell_pool = ObjectPool(Cell) if pooled else None
+        self.half_edge_pool = ObjectPool(HalfEdge) if pooled else None
+        self._finalizer: Optional[Callable[[Cell], None]] = None
+        self._pending_count = 0
+    
+    @property
+    def is_finalized(self) -> bool:
+        """True jika tidak ada cell yang masih menunggu dilengkapi dan dipotong"""
+        return self._pending_count == 0
+    
+    def defer_finalization(self, finalizer: Callable[[Cell], None]) -> None:
+        """
+        Menandai semua cell sebagai tertunda; finalizer dipanggil sekali per cell
+        saat cell tersebut pertama kali diakses.
+        
+        Args:
+            finalizer: Fungsi yang melengkapi dan memotong satu cell
+        """
+        self._finalizer = finalizer
+        self._pending_count = len(self.cells)
+        pending = ref(self)
+        for cell in self.cells:
+            cell._pending = pending
+    
+    def _finalize_cell(self, cell: Cell) -> None:
+        if self._finalizer is None:
+            return
+        finalizer = self._finalizer
+        self._pending_count -= 1
+        if self._pending_count == 0:
+            self._finalizer = None
+        finalizer(cell)
+    
+    def finalize_all(self) -> None:
+        """Melengkapi dan memotong semua cell yang masih tertunda"""
+        if self._finalizer is None:
+            return
+        for cell in self.cells:
+            cell.finalize()
+    
+    def cell(self, index: int) -> Cell:
+        """Mengembalikan cell ke-index yang sudah dilengkapi dan dipotong"""
+        cell = self.cells[index]
+        cell.finalize()
+        return cell
     
     def create_cell(self, arc: 'Arc') -> None:
         """Membuat sel baru untuk busur yang diberikan"""
         if arc.point is None:
             return
-        cell = Cell(site=arc.point)
+        if self.cell_pool is not None:
+            cell = self.cell_pool.acquire(arc.point)
+        else:
+            cell = Cell(site=arc.point)
         self.cells.append(cell)
         arc.cell = cell
     
     def create_half_edge(self, cell: Cell) -> HalfEdge:
         """Membuat half-edge baru yang terkait dengan sel yang diberikan"""
-        he = HalfEdge()
+        he = self.half_edge_pool.acquire() if self.half_edge_pool is not None else HalfEdge()
+        self.half_edge_count += 1
         if cell.outer_component is None:
             cell.outer_component = he
         he.incident_face = cell
@@ -125,5 +204,46 @@ class Diagram:
     
     def clear(self) -> None:
         """Menghapus semua sel dan vertex dari diagram"""
-        self.cells.clear()
-        self.vertices.clear()
+        if self._finalizer is not None:
+            # Cell tertunda dibuang tanpa diselesaikan; cell dari pool di-reset saat diambil lagi
+            if self.cell_pool is None:
+                for cell in self.cells:
+                    cell._pending = None
+            self._finalizer = None
+            self._pending_count = 0
+        if self.cell_pool is not None:
+            # O(1): objek dikembalikan ke pool tanpa didealokasi
+            self.cell_pool.recycle()
+            self.half_edge_pool.recycle()
+            self.cells = []
+            self.vertices = []
+        else:
+            self.cells.clear()
+            self.vertices.clear()
+        self.half_edge_count = 0
+    
+    def iter_edges(self) -> Iterator[LineSegment]:
+        """
+        Mengiterasi semua edge diagram sebagai line segment.
+        
+        Setiap pasangan twin hanya dihasilkan sekali; half-edge tanpa twin
+        (misalnya sisi hasil clipping pada batas rectangle) dihasilkan apa adanya.
+        """
+        self.finalize_all()
+        seen = set()
+        for cell in self.cells:
+            if not cell.outer_component:
+                continue
+            he = cell.outer_component
+            while True:
+                if id(he) not in seen:
+                    seen.add(id(he))
+                    twin = he.twin
+                    if twin is not None:
+                        seen.add(id(twin))
+                    segment = he.to_segment()
+                    if segment is not None:
+                        yield segment
+                he = he.next
+                if not he or he is cell.outer_component:
+                    break
@@ -0,0 +1,406 @@
+"""
+Cache hasil perhitungan diagram Voronoi berdasarkan fingerprint himpunan site.
+
+Key cache adalah fingerprint (hash blake2b) dari koordinat site yang berada di
+dalam rectangle clipping, setelah diurutkan dan diduplikasi, ditambah rectangle
+itu sendiri. Karena FortunesAlgo.begin() juga membuang duplikat dan site di luar
+rectangle, dua input yang menghasilkan diagram yang sama mendapat key yang sama
+tanpa bergantung pada urutan site.
+
+Cache terdiri dari dua tingkat:
+- memori: LRU yang dibatasi perkiraan jumlah byte diagram yang disimpan
+- disk (opsional): satu file per key dalam format biner DCEL (encode_diagram),
+  dibatasi jumlah byte total dengan membuang file yang paling lama tidak dipakai
+
+Diagram yang dikembalikan cache dipakai bersama oleh semua pemanggil dengan key
+yang sama dan tidak boleh diubah.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Diagram import Cell, Diagram, HalfEdge, Vertex
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+
+# Perkiraan ukuran objek Python di memori (byte), diukur dengan tracemalloc
+CELL_BYTES = 200
+HALF_EDGE_BYTES = 200
+VERTEX_BYTES = 150
+
+CACHE_MAGIC = b"VDCH"
+CACHE_VERSION = 1
+# magic, versi, jumlah vertex diagram, jumlah titik total, jumlah cell, jumlah half-edge, waktu hitung
+CACHE_HEADER = struct.Struct("<4sHxxIIIId")
+CACHE_SUFFIX = ".vdc"
+
+
+def fingerprint(sites: Iterable[Site], clipping_rect: Rectangle) -> str:
+    """
+    Menghitung key cache yang tidak bergantung pada urutan site.
+
+    Args:
+        sites: Titik-titik input
+        clipping_rect: Rectangle clipping
+
+    Returns:
+        str: Digest heksadesimal 32 karakter
+    """
+    coords = np.array([(s.x, s.y) for s in sites], dtype=np.float64).reshape(-1, 2)
+    x, y = coords[:, 0], coords[:, 1]
+    inside = ((x >= clipping_rect.x) & (x <= clipping_rect.x + clipping_rect.width) &
+              (y >= clipping_rect.y) & (y <= clipping_rect.y + clipping_rect.height))
+    coords = coords[inside] + 0.0  # Menyamakan -0.0 dengan 0.0
+    coords = coords[np.lexsort((coords[:, 1], coords[:, 0]))]
+    if len(coords) > 1:
+        unique = np.ones(len(coords), dtype=bool)
+        unique[1:] = (coords[1:] != coords[:-1]).any(axis=1)
+        coords = coords[unique]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack("<4d", clipping_rect.x, clipping_rect.y,
+                              clipping_rect.width, clipping_rect.height))
+    digest.update(np.ascontiguousarray(coords).tobytes())
+    return digest.hexdigest()
+
+
+def estimate_bytes(diagram: Diagram) -> int:
+    """Perkiraan (batas atas) memori yang dipakai diagram, dalam byte."""
+    return (len(diagram.cells) * CELL_BYTES + diagram.half_edge_count * HALF_EDGE_BYTES +
+            len(diagram.vertices) * VERTEX_BYTES)
+
+
+def _half_edges(cell: Cell, seen: Dict[int, int]) -> List[HalfEdge]:
+    """
+    Half-edge pada batas cell yang belum ada di seen, mulai dari outer_component.
+    Setiap half-edge yang dikembalikan didaftarkan ke seen dengan indeks barunya.
+    """
+    half_edges = []
+    first = he = cell.outer_component
+    while he is not None and id(he) not in seen:
+        seen[id(he)] = len(seen)
+        half_edges.append(he)
+        he = he.next
+        if he is first:
+            break
+    return half_edges
+
+
+def encode_diagram(diagram: Diagram, compute_time: float = 0.0) -> bytes:
+    """
+    Menyerialisasi DCEL diagram ke bytes.
+
+    Titik disimpan sekali dan dirujuk dengan indeks sehingga vertex yang dipakai
+    bersama oleh beberapa half-edge tetap menjadi satu objek saat di-decode.
+    Urutan titik: semua diagram.vertices, lalu titik lain yang hanya muncul sebagai
+    ujung half-edge (misalnya hasil clipping).
+
+    Layout (little-endian): header CACHE_HEADER, titik (f64 x, y), cell
+    (f64 site x, y, i32 half-edge pertama), half-edge (i32 origin, destination,
+    twin, cell, next, prev; -1 untuk None).
+    """
+    point_index: Dict[int, int] = {}
+    points: List[Vertex] = []
+
+    def index_of(point: Optional[Vertex]) -> int:
+        if point is None:
+            return -1
+        i = point_index.get(id(point))
+        if i is None:
+            i = point_index[id(point)] = len(points)
+            points.append(point)
+        return i
+
+    diagram.finalize_all()
+    for v in diagram.vertices:
+        index_of(v)
+
+    he_index: Dict[int, int] = {}
+    loops = [_half_edges(cell, he_index) for cell in diagram.cells]
+
+    def he_index_of(he: Optional[HalfEdge]) -> int:
+        return he_index.get(id(he), -1) if he is not None else -1
+
+    cells = np.empty(len(diagram.cells), dtype=[("x", "<f8"), ("y", "<f8"), ("first", "<i4")])
+    half_edges = np.empty((len(he_index), 6), dtype="<i4")
+    row = 0
+    for cell_i, (cell, loop) in enumerate(zip(diagram.cells, loops)):
+        cells[cell_i] = (cell.site.x, cell.site.y, row if loop else -1)
+        for he in loop:
+            half_edges[row] = (index_of(he.origin), index_of(he.destination), he_index_of(he.twin),
+                               cell_i, he_index_of(he.next), he_index_of(he.prev))
+            row += 1
+
+    coords = np.array([(p.x, p.y) for p in points], dtype="<f8").reshape(-1, 2)
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(diagram.vertices), len(points),
+                               len(cells), len(half_edges), compute_time)
+    return header + coords.tobytes() + cells.tobytes() + half_edges.tobytes()
+
+
+def decode_diagram(data: bytes) -> Tuple[Diagram, float]:
+    """
+    Membangun kembali Diagram dari hasil encode_diagram.
+
+    Returns:
+        Tuple (diagram, waktu hitung yang tersimpan)
+
+    Raises:
+        ValueError: Jika data bukan cache diagram yang valid
+    """
+    if len(data) < CACHE_HEADER.size:
+        raise ValueError("data cache terlalu pendek")
+    magic, version, vertex_count, point_count, cell_count, he_count, compute_time = \
+        CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError("bukan file cache diagram yang didukung")
+    offset = CACHE_HEADER.size
+    coords = np.frombuffer(data, "<f8", point_count * 2, offset).reshape(-1, 2)
+    offset += coords.nbytes
+    cells = np.frombuffer(data, [("x", "<f8"), ("y", "<f8"), ("first", "<i4")], cell_count, offset)
+    offset += cells.nbytes
+    links = np.frombuffer(data, "<i4", he_count * 6, offset).reshape(-1, 6)
+    if offset + links.nbytes != len(data):
+        raise ValueError("ukuran data cache tidak sesuai header")
+
+    diagram = Diagram()
+    points = [Site(x, y) for x, y in coords.tolist()]
+    diagram.vertices = points[:vertex_count]
+    diagram.cells = [Cell(site=Site(x, y)) for x, y, _ in cells.tolist()]
+    half_edges = [HalfEdge() for _ in range(he_count)]
+    diagram.half_edge_count = he_count
+
+    for he, (origin, destination, twin, cell_i, next_i, prev_i) in zip(half_edges, links.tolist()):
+        he.origin = points[origin] if origin >= 0 else None
+        he.destination = points[destination] if destination >= 0 else None
+        he.twin = half_edges[twin] if twin >= 0 else None
+        he.incident_face = diagram.cells[cell_i]
+        he.next = half_edges[next_i] if next_i >= 0 else None
+        he.prev = half_edges[prev_i] if prev_i >= 0 else None
+    for cell, first in zip(diagram.cells, cells["first"].tolist()):
+        if first >= 0:
+            cell.outer_component = half_edges[first]
+    return diagram, compute_time
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistik pemakaian DiagramCache.
+
+    Attributes:
+        hits: Jumlah lookup yang ditemukan di memori
+        disk_hits: Jumlah lookup yang ditemukan di disk
+        misses: Jumlah lookup yang tidak ditemukan
+        evictions: Jumlah entry yang dibuang dari memori
+        disk_evictions: Jumlah file yang dihapus dari disk
+        compute_time: Total waktu perhitungan diagram yang disimpan ke cache (detik)
+        time_saved: Perkiraan waktu yang dihemat: waktu hitung entry dikurangi waktu lookup (detik)
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+    compute_time: float = 0.0
+    time_saved: float = 0.0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Proporsi lookup yang ditemukan di memori atau disk."""
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "compute_time": self.compute_time,
+            "time_saved": self.time_saved,
+        }
+
+
+class DiagramCache:
+    """
+    Cache diagram dua tingkat (memori dan disk) yang aman dipakai dari beberapa thread.
+
+    Attributes:
+        max_bytes: Batas perkiraan memori semua diagram di tingkat memori
+        directory: Direktori tingkat disk, atau None jika tidak dipakai
+        max_disk_bytes: Batas total ukuran file di disk (None = tidak dibatasi)
+        stats: Statistik hit/miss dan waktu yang dihemat
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self.current_bytes = 0
+        # key -> (diagram, perkiraan byte, waktu hitung)
+        self._entries: "OrderedDict[str, Tuple[Diagram, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, sites: Iterable[Site], clipping_rect: Rectangle) -> Optional[Diagram]:
+        """Mengembalikan diagram dari cache, atau None (dicatat sebagai miss)."""
+        return self.lookup(fingerprint(sites, clipping_rect))
+
+    def put(self, sites: Iterable[Site], clipping_rect: Rectangle, diagram: Diagram,
+            compute_time: float = 0.0) -> str:
+        """Menyimpan diagram ke cache. Mengembalikan key-nya."""
+        key = fingerprint(sites, clipping_rect)
+        self.store(key, diagram, compute_time)
+        return key
+
+    def compute(self, sites: Iterable[Site], clipping_rect: Rectangle) -> Diagram:
+        """
+        Mengembalikan diagram dari cache, atau menghitungnya dengan FortunesAlgo
+        lalu menyimpannya jika belum ada.
+
+        Args:
+            sites: Titik-titik input
+            clipping_rect: Rectangle clipping
+
+        Returns:
+            Diagram hasil (dipakai bersama, jangan diubah)
+        """
+        sites = list(sites)
+        key = fingerprint(sites, clipping_rect)
+        diagram = self.lookup(key)
+        if diagram is None:
+            start = time.perf_counter()
+            diagram = Diagram()
+            FortunesAlgo().compute(set(sites), diagram, clipping_rect)
+            self.store(key, diagram, time.perf_counter() - start)
+        return diagram
+
+    def lookup(self, key: str) -> Optional[Diagram]:
+        """Mencari diagram berdasarkan key di memori lalu di disk."""
+        start = time.perf_counter()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.time_saved += max(0.0, entry[2] - (time.perf_counter() - start))
+                return entry[0]
+
+        diagram = None
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    diagram, compute_time = decode_diagram(f.read())
+                os.utime(path)  # Menandai file sebagai baru dipakai untuk eviction disk
+            except (OSError, ValueError):
+                diagram = None
+
+        with self._lock:
+            if diagram is None:
+                self.stats.misses += 1
+                return None
+            self.stats.disk_hits += 1
+            self.stats.time_saved += max(0.0, compute_time - (time.perf_counter() - start))
+            self._insert(key, diagram, compute_time)
+            return diagram
+
+    def store(self, key: str, diagram: Diagram, compute_time: float = 0.0) -> None:
+        """Menyimpan diagram dengan key tertentu ke memori dan (jika aktif) ke disk."""
+        with self._lock:
+            self.stats.compute_time += compute_time
+            self._insert(key, diagram, compute_time)
+        if self.directory is not None:
+            self._write_file(key, encode_diagram(diagram, compute_time))
+
+    def clear(self, disk: bool = False) -> None:
+        """Mengosongkan tingkat memori, dan tingkat disk jika disk=True."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+        if disk and self.directory is not None:
+            for path, _, _ in self._disk_files():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _insert(self, key: str, diagram: Diagram, compute_time: float) -> None:
+        """Memasukkan entry ke LRU memori lalu membuang entry lama sampai muat (lock harus dipegang)."""
+        size = estimate_bytes(diagram)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (diagram, size, compute_time)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.stats.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def _disk_files(self) -> List[Tuple[str, int, float]]:
+        """List (path, ukuran, mtime) semua file cache di direktori."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.path, st.st_size, st.st_mtime))
+        return files
+
+    def _write_file(self, key: str, data: bytes) -> None:
+        """Menulis file cache secara atomik lalu menegakkan max_disk_bytes."""
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        if self.max_disk_bytes is None:
+            return
+        files = sorted(self._disk_files(), key=lambda f: f[2])
+        total = sum(size for _, size, _ in files)
+        for file_path, size, _ in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(file_path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.stats.disk_evictions += 1
@@ -0,0 +1,316 @@
+"""
+Writer streaming untuk mengekspor diagram Voronoi ke SVG, GeoJSON, WKB, dan biner datar.
+
+Semua writer berjalan per cell/edge/vertex dan langsung menulis ke file handle
+lewat buffer berukuran tetap, sehingga memori yang dipakai tidak bergantung pada
+jumlah cell. Writer teks (svg, geojson) menerima handle teks; writer biner (wkb,
+flat) menerima handle biner.
+
+Kuantisasi opsional (precision) membulatkan koordinat ke sejumlah digit desimal:
+writer teks menulis angka dengan digit tersebut, wkb menyimpan float64 yang sudah
+dibulatkan, dan flat menyimpan koordinat sebagai int32 berskala 10^precision.
+
+Format wkb adalah rangkaian geometri WKB little-endian, masing-masing diawali
+panjangnya (uint32): cell sebagai Polygon, edge sebagai LineString, vertex sebagai Point.
+
+Format flat (little-endian):
+    header  : magic b"VDFL", versi (u16), tipe koordinat (u8: 0=f64, 1=i32), padding (u8),
+              skala (f64), jumlah cell (u32), jumlah vertex (u32)
+    cells   : per cell koordinat site, jumlah vertex k (u32), lalu k koordinat
+    vertices: koordinat setiap vertex
+    edges   : koordinat (x1, y1, x2, y2) setiap edge sampai akhir file
+"""
+
+import struct
+from typing import BinaryIO, Callable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from Diagram import Diagram, HalfEdge
+
+LAYERS = ("cells", "edges", "vertices", "sites")
+DEFAULT_LAYERS = ("cells", "vertices")
+
+BUFFER_SIZE = 1 << 16
+
+WKB_POINT = 1
+WKB_LINESTRING = 2
+WKB_POLYGON = 3
+
+FLAT_MAGIC = b"VDFL"
+FLAT_VERSION = 1
+FLAT_HEADER = struct.Struct("<4sHBxdII")
+
+
+class BufferedSink:
+    """
+    Mengumpulkan potongan output (str atau bytes) dan menulisnya ke handle
+    setiap kali ukurannya melewati BUFFER_SIZE.
+    """
+
+    def __init__(self, out, binary: bool, buffer_size: int = BUFFER_SIZE):
+        self.out = out
+        self.empty = b"" if binary else ""
+        self.buffer_size = buffer_size
+        self._parts: List = []
+        self._size = 0
+        self.written = 0
+
+    def write(self, part) -> None:
+        self._parts.append(part)
+        self._size += len(part)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            data = self.empty.join(self._parts)
+            self.out.write(data)
+            self.written += len(data)
+            self._parts = []
+            self._size = 0
+
+
+def number_formatter(precision: Optional[int]) -> Callable[[float], str]:
+    """Mengembalikan fungsi format angka: repr penuh, atau dibulatkan ke precision digit."""
+    if precision is None:
+        return repr
+
+    def fmt(value: float) -> str:
+        text = f"{value:.{precision}f}"
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return "0" if text == "-0" else text
+    return fmt
+
+
+def cell_rings(diagram: Diagram) -> Iterator[Tuple[Tuple[float, float], List[Tuple[float, float]]]]:
+    """Menghasilkan (site, vertex ring CCW) untuk setiap cell yang memiliki minimal tiga vertex."""
+    for cell in diagram.cells:
+        ring = [(v.x, v.y) for v in cell.hull_vertices_ccw()]
+        if len(ring) >= 3:
+            yield (cell.site.x, cell.site.y), ring
+
+
+def _owns_edge(he: HalfEdge) -> bool:
+    """
+    Menentukan apakah half-edge mewakili pasangan twin-nya tanpa menyimpan himpunan
+    half-edge yang sudah dilihat: half-edge tanpa twin selalu ditulis, dan dari
+    sepasang twin yang ditulis adalah yang site cell-nya lebih kecil.
+    """
+    twin = he.twin
+    if twin is None:
+        return True
+    face, twin_face = he.incident_face, twin.incident_face
+    if face is None or twin_face is None:
+        return face is not None
+    return (face.site.x, face.site.y) < (twin_face.site.x, twin_face.site.y)
+
+
+def edge_segments(diagram: Diagram) -> Iterator[Tuple[float, float, float, float]]:
+    """
+    Menghasilkan setiap edge diagram sekali sebagai (x1, y1, x2, y2) dengan memori konstan.
+    """
+    diagram.finalize_all()
+    for cell in diagram.cells:
+        first = he = cell.outer_component
+        while he is not None:
+            if he.origin is not None and he.destination is not None and _owns_edge(he):
+                yield he.origin.x, he.origin.y, he.destination.x, he.destination.y
+            he = he.next
+            if he is first:
+                break
+
+
+def diagram_bounds(diagram: Diagram) -> Tuple[float, float, float, float]:
+    """Mengembalikan (min_x, min_y, max_x, max_y) dari semua site dan vertex cell."""
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
+    for site, ring in cell_rings(diagram):
+        xs = [site[0]] + [x for x, _ in ring]
+        ys = [site[1]] + [y for _, y in ring]
+        min_x, max_x = min(min_x, *xs), max(max_x, *xs)
+        min_y, max_y = min(min_y, *ys), max(max_y, *ys)
+    if min_x > max_x:
+        return 0.0, 0.0, 0.0, 0.0
+    return min_x, min_y, max_x, max_y
+
+
+def write_svg(diagram: Diagram, out: TextIO, precision: Optional[int] = None,
+              layers: Sequence[str] = DEFAULT_LAYERS,
+              bounds: Optional[Tuple[float, float, float, float]] = None) -> int:
+    """
+    Menulis diagram sebagai dokumen SVG.
+
+    Args:
+        diagram: Diagram yang diekspor
+        out: Handle teks tujuan
+        precision: Jumlah digit desimal koordinat (None = presisi penuh)
+        layers: Layer yang ditulis, subset dari LAYERS
+        bounds: viewBox (min_x, min_y, max_x, max_y); None = dihitung dengan satu pass tambahan
+
+    Returns:
+        int: Jumlah karakter yang ditulis
+    """
+    fmt = number_formatter(precision)
+    min_x, min_y, max_x, max_y = bounds if bounds is not None else diagram_bounds(diagram)
+    sink = BufferedSink(out, binary=False)
+    sink.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{fmt(min_x)} {fmt(min_y)} '
+        f'{fmt(max_x - min_x)} {fmt(max_y - min_y)}">\n'
+    )
+    if "cells" in layers:
+        sink.write('<g class="cells" fill="none" stroke="blue" stroke-width="0.5">\n')
+        for _, ring in cell_rings(diagram):
+            sink.write('<path d="M' + "L".join(f"{fmt(x)} {fmt(y)}" for x, y in ring) + 'Z"/>\n')
+        sink.write("</g>\n")
+    if "edges" in layers:
+        sink.write('<g class="edges" stroke="blue" stroke-width="0.5">\n')
+        for x1, y1, x2, y2 in edge_segments(diagram):
+            sink.write(f'<line x1="{fmt(x1)}" y1="{fmt(y1)}" x2="{fmt(x2)}" y2="{fmt(y2)}"/>\n')
+        sink.write("</g>\n")
+    if "sites" in layers:
+        sink.write('<g class="sites" fill="black">\n')
+        for cell in diagram.cells:
+            sink.write(f'<circle cx="{fmt(cell.site.x)}" cy="{fmt(cell.site.y)}" r="2"/>\n')
+        sink.write("</g>\n")
+    if "vertices" in layers:
+        sink.write('<g class="vertices" fill="red">\n')
+        for v in diagram.vertices:
+            sink.write(f'<circle cx="{fmt(v.x)}" cy="{fmt(v.y)}" r="1"/>\n')
+        sink.write("</g>\n")
+    sink.write("</svg>\n")
+    sink.flush()
+    return sink.written
+
+
+def write_geojson(diagram: Diagram, out: TextIO, precision: Optional[int] = None,
+                  layers: Sequence[str] = DEFAULT_LAYERS) -> int:
+    """
+    Menulis diagram sebagai GeoJSON FeatureCollection.
+
+    Cell menjadi Polygon (ring ditutup) dengan properti "site", edge menjadi
+    LineString, vertex dan site menjadi Point. Setiap feature memiliki properti "kind".
+
+    Returns:
+        int: Jumlah karakter yang ditulis
+    """
+    fmt = number_formatter(precision)
+    sink = BufferedSink(out, binary=False)
+    sink.write('{"type":"FeatureCollection","features":[')
+    separator = "\n"
+
+    def feature(kind: str, geometry: str, extra: str = "") -> None:
+        nonlocal separator
+        sink.write(f'{separator}{{"type":"Feature","properties":{{"kind":"{kind}"{extra}}},"geometry":{geometry}}}')
+        separator = ",\n"
+
+    if "cells" in layers:
+        for (sx, sy), ring in cell_rings(diagram):
+            coords = ",".join(f"[{fmt(x)},{fmt(y)}]" for x, y in ring + ring[:1])
+            feature("cell", f'{{"type":"Polygon","coordinates":[[{coords}]]}}', f',"site":[{fmt(sx)},{fmt(sy)}]')
+    if "edges" in layers:
+        for x1, y1, x2, y2 in edge_segments(diagram):
+            feature("edge", f'{{"type":"LineString","coordinates":[[{fmt(x1)},{fmt(y1)}],[{fmt(x2)},{fmt(y2)}]]}}')
+    if "sites" in layers:
+        for cell in diagram.cells:
+            feature("site", f'{{"type":"Point","coordinates":[{fmt(cell.site.x)},{fmt(cell.site.y)}]}}')
+    if "vertices" in layers:
+        for v in diagram.vertices:
+            feature("vertex", f'{{"type":"Point","coordinates":[{fmt(v.x)},{fmt(v.y)}]}}')
+    sink.write("\n]}\n")
+    sink.flush()
+    return sink.written
+
+
+def _rounder(precision: Optional[int]) -> Callable[[float], float]:
+    if precision is None:
+        return float
+    return lambda value: round(value, precision)
+
+
+def write_wkb(diagram: Diagram, out: BinaryIO, precision: Optional[int] = None,
+              layers: Sequence[str] = DEFAULT_LAYERS) -> int:
+    """
+    Menulis diagram sebagai rangkaian geometri WKB berawalan panjang (uint32).
+
+    Returns:
+        int: Jumlah byte yang ditulis
+    """
+    r = _rounder(precision)
+    sink = BufferedSink(out, binary=True)
+    point = struct.Struct("<IBIdd")
+    line = struct.Struct("<IBIIdddd")
+
+    if "cells" in layers:
+        for _, ring in cell_rings(diagram):
+            closed = ring + ring[:1]
+            coords = [r(c) for xy in closed for c in xy]
+            body = struct.pack(f"<BIII{len(coords)}d", 1, WKB_POLYGON, 1, len(closed), *coords)
+            sink.write(struct.pack("<I", len(body)) + body)
+    if "edges" in layers:
+        for x1, y1, x2, y2 in edge_segments(diagram):
+            sink.write(line.pack(line.size - 4, 1, WKB_LINESTRING, 2, r(x1), r(y1), r(x2), r(y2)))
+    if "sites" in layers:
+        for cell in diagram.cells:
+            sink.write(point.pack(point.size - 4, 1, WKB_POINT, r(cell.site.x), r(cell.site.y)))
+    if "vertices" in layers:
+        for v in diagram.vertices:
+            sink.write(point.pack(point.size - 4, 1, WKB_POINT, r(v.x), r(v.y)))
+    sink.flush()
+    return sink.written
+
+
+def write_flat(diagram: Diagram, out: BinaryIO, precision: Optional[int] = None) -> int:
+    """
+    Menulis seluruh diagram (cell, vertex, edge) dalam format biner datar.
+
+    Dengan precision, koordinat disimpan sebagai int32 = round(nilai * 10^precision).
+
+    Returns:
+        int: Jumlah byte yang ditulis
+
+    Raises:
+        OverflowError: Jika koordinat terkuantisasi tidak muat di int32
+    """
+    if precision is None:
+        coord_type, scale, code = 0, 0.0, "d"
+
+        def convert(values):
+            return values
+    else:
+        coord_type, scale, code = 1, float(10 ** precision), "i"
+
+        def convert(values):
+            return [round(v * scale) for v in values]
+
+    sink = BufferedSink(out, binary=True)
+    pair = struct.Struct(f"<2{code}")
+    quad = struct.Struct(f"<4{code}")
+    count = struct.Struct("<I")
+    try:
+        sink.write(FLAT_HEADER.pack(FLAT_MAGIC, FLAT_VERSION, coord_type, scale,
+                                    len(diagram.cells), len(diagram.vertices)))
+        for cell in diagram.cells:
+            ring = [c for v in cell.hull_vertices_ccw() for c in (v.x, v.y)]
+            sink.write(pair.pack(*convert((cell.site.x, cell.site.y))))
+            sink.write(count.pack(len(ring) // 2))
+            sink.write(struct.pack(f"<{len(ring)}{code}", *convert(ring)))
+        for v in diagram.vertices:
+            sink.write(pair.pack(*convert((v.x, v.y))))
+        for segment in edge_segments(diagram):
+            sink.write(quad.pack(*convert(segment)))
+    except struct.error as e:
+        raise OverflowError(f"koordinat tidak muat di format flat: {e}") from e
+    sink.flush()
+    return sink.written
+
+
+TEXT_WRITERS = {
+    "svg": write_svg,
+    "geojson": write_geojson,
+}
+
+BINARY_WRITERS = {
+    "wkb": write_wkb,
+    "flat": write_flat,
+}
@@ -0,0 +1,338 @@
+"""
+Renderer diagram Voronoi untuk tk.Canvas dengan level-of-detail.
+
+Ada dua mode yang dipilih otomatis setiap render:
+- vector: satu item canvas per cell, site, dan vertex yang terlihat. Item disimpan
+  per kunci (koordinat site/vertex) sehingga render berikutnya hanya membuat,
+  memindahkan, atau menghapus item yang berubah.
+- raster: jika jumlah item yang terlihat melewati ITEM_BUDGET, edge, site, dan
+  vertex digambar dengan numpy ke satu gambar seukuran canvas lalu ditampilkan
+  sebagai satu item image. Biaya di sisi Tk tidak lagi bergantung pada n.
+
+Cell yang bounding box-nya lebih kecil dari MIN_CELL_PX piksel tidak dibuat
+sebagai polygon; edge-nya tetap terlihat di mode raster.
+
+Diagram tidak berubah setelah dipublikasikan worker, sehingga segmen edge, polygon
+cell, dan indeks vertex yang terlihat disimpan per diagram. Site disaring lewat
+SiteIndex yang dibangun ulang hanya jika daftar titik berubah. Render ulang diagram
+yang sama tidak lagi berjalan atas semua n cell, site, dan vertex.
+"""
+
+import base64
+import struct
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from RasterVoronoi import RasterVoronoi, upscale
+from Rectangle import Rectangle
+from Site import Site
+from ViewportVoronoi import SiteIndex
+
+CELL_COLOR = (0, 0, 255)
+SITE_COLOR = (0, 0, 0)
+VERTEX_COLOR = (255, 0, 0)
+
+
+def encode_png(rgb: np.ndarray) -> bytes:
+    """
+    Meng-encode array uint8 (tinggi, lebar, 3) menjadi file PNG RGB tanpa filter.
+
+    Tk 8.6 bisa membaca PNG secara native, sehingga tidak perlu Pillow.
+    """
+    height, width, _ = rgb.shape
+    rows = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 0  # Filter "None" untuk setiap baris
+    rows[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), 1)) + chunk(b"IEND", b""))
+
+
+def rasterize_segments(image: np.ndarray, segments: np.ndarray, color: Tuple[int, int, int]) -> None:
+    """
+    Menggambar segmen garis (m, 4) ke image dengan sampling satu titik per piksel.
+    Piksel di luar image diabaikan.
+    """
+    if len(segments) == 0:
+        return
+    height, width, _ = image.shape
+    x0, y0, x1, y1 = segments.T
+    # Batasi panjang sampling agar edge yang sangat panjang di luar layar tidak meledak
+    steps = np.minimum(np.ceil(np.maximum(np.abs(x1 - x0), np.abs(y1 - y0))), 2 * (width + height))
+    steps = steps.astype(np.int64) + 1
+    owner = np.repeat(np.arange(len(segments)), steps)
+    offsets = np.arange(len(owner)) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = offsets / np.maximum(steps[owner] - 1, 1)
+    xs = np.rint(x0[owner] + (x1 - x0)[owner] * t).astype(np.int64)
+    ys = np.rint(y0[owner] + (y1 - y0)[owner] * t).astype(np.int64)
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    image[ys[inside], xs[inside]] = color
+
+
+def rasterize_points(image: np.ndarray, points: np.ndarray, color: Tuple[int, int, int], size: int) -> None:
+    """Menggambar titik (k, 2) sebagai kotak size x size piksel ke image."""
+    if len(points) == 0:
+        return
+    height, width, _ = image.shape
+    base = np.rint(points).astype(np.int64) - size // 2
+    for dx in range(size):
+        for dy in range(size):
+            xs = base[:, 0] + dx
+            ys = base[:, 1] + dy
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            image[ys[inside], xs[inside]] = color
+
+
+def boundary_segments(diagram: Diagram) -> np.ndarray:
+    """
+    Mengembalikan array (m, 4) semua half-edge batas cell.
+
+    Berbeda dengan Diagram.iter_edges, pasangan twin tidak disaring: untuk raster
+    menggambar edge dua kali tidak masalah dan jauh lebih murah daripada deduplikasi.
+    """
+    diagram.finalize_all()
+    coords = []
+    append = coords.append
+    for cell in diagram.cells:
+        first = he = cell.outer_component
+        while he is not None:
+            origin, destination = he.origin, he.destination
+            if origin is not None and destination is not None:
+                append((origin.x, origin.y, destination.x, destination.y))
+            he = he.next
+            if he is first:
+                break
+    return np.array(coords, dtype=np.float64).reshape(-1, 4)
+
+
+class DiagramRenderer:
+    """
+    Menggambar diagram ke canvas dengan mode vector atau raster.
+
+    Attributes:
+        ITEM_BUDGET (int): Jumlah maksimum item vector sebelum beralih ke mode raster
+        MIN_CELL_PX (float): Ukuran bounding box minimum cell yang digambar sebagai polygon
+        mode (str): Mode render terakhir, "vector", "raster", atau "preview"
+    """
+
+    ITEM_BUDGET = 6000
+    MIN_CELL_PX = 2.0
+
+    def __init__(self, canvas, width: int, height: int, site_radius: float = 3):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.site_radius = site_radius
+        self.mode = "vector"
+        self._cell_items: Dict[Tuple[float, float], Tuple[int, Tuple[float, ...]]] = {}
+        self._site_items: Dict[Tuple[float, float], int] = {}
+        self._vertex_items: Dict[Tuple[float, float], int] = {}
+        self._circle_items: List[int] = []
+        self._image_item: Optional[int] = None
+        self._photo = None  # Referensi PhotoImage agar tidak di-garbage collect
+        self._viewport = Rectangle(0, 0, width, height)
+        # Cache per diagram: (diagram, segmen terlihat, indeks vertex, polygon atau None)
+        self._geometry = None
+        # Cache indeks site: (daftar titik, panjangnya, SiteIndex)
+        self._site_index = None
+
+    def clear(self) -> None:
+        """Menghapus semua item yang dibuat renderer."""
+        self.canvas.delete("voronoi", "site", "vertex", "largest_empty_circle", "raster")
+        self._cell_items.clear()
+        self._site_items.clear()
+        self._vertex_items.clear()
+        self._circle_items = []
+        self._image_item = None
+        self._photo = None
+        self._geometry = None
+        self._site_index = None
+
+    def _visible(self, x: float, y: float) -> bool:
+        return 0 <= x <= self.width and 0 <= y <= self.height
+
+    def add_point(self, point: Site) -> None:
+        """Menggambar satu site baru tanpa menggambar ulang apa pun."""
+        key = (point.x, point.y)
+        if key in self._site_items or not self._visible(*key):
+            return
+        r = self.site_radius
+        self._site_items[key] = self.canvas.create_oval(
+            point.x - r, point.y - r, point.x + r, point.y + r, fill="black", tags="site"
+        )
+
+    def cell_polygons(self, diagram: Diagram) -> Dict[Tuple[float, float], Tuple[float, ...]]:
+        """
+        Mengembalikan koordinat polygon (x1, y1, x2, y2, ...) setiap cell yang terlihat
+        dan cukup besar, dengan kunci koordinat site-nya.
+        """
+        polygons = {}
+        min_px = self.MIN_CELL_PX
+        for cell in diagram.cells:
+            coords = []
+            for v in cell.hull_vertices_ccw():
+                coords.append(v.x)
+                coords.append(v.y)
+            if len(coords) < 6:
+                continue
+            xs, ys = coords[0::2], coords[1::2]
+            min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+            if max_x < 0 or min_x > self.width or max_y < 0 or min_y > self.height:
+                continue  # Di luar layar
+            if max_x - min_x < min_px and max_y - min_y < min_px:
+                continue  # Terlalu kecil untuk terlihat sebagai polygon
+            polygons[(cell.site.x, cell.site.y)] = tuple(coords)
+        return polygons
+
+    def _diagram_geometry(self, diagram: Diagram) -> Tuple[np.ndarray, SiteIndex]:
+        """
+        Segmen edge yang memotong canvas dan indeks vertex diagram, dihitung sekali
+        per diagram.
+        """
+        if self._geometry is None or self._geometry[0] is not diagram:
+            segments = boundary_segments(diagram)
+            x0, y0, x1, y1 = segments.T
+            # Margin satu piksel: titik sampling dibulatkan ke piksel terdekat
+            onscreen = ((np.maximum(x0, x1) >= -1) & (np.minimum(x0, x1) <= self.width + 1) &
+                        (np.maximum(y0, y1) >= -1) & (np.minimum(y0, y1) <= self.height + 1))
+            self._geometry = (diagram, segments[onscreen], SiteIndex(diagram.vertices), None)
+        return self._geometry[1], self._geometry[2]
+
+    def _cached_polygons(self, diagram: Diagram) -> Dict[Tuple[float, float], Tuple[float, ...]]:
+        """cell_polygons untuk diagram, dihitung sekali per diagram."""
+        polygons = self._geometry[3]
+        if polygons is None:
+            polygons = self.cell_polygons(diagram)
+            self._geometry = self._geometry[:3] + (polygons,)
+        return polygons
+
+    def _visible_sites(self, points: Sequence[Site]) -> np.ndarray:
+        """
+        Koordinat (k, 2) titik yang terlihat. Daftar titik hanya pernah ditambah atau
+        diganti, sehingga indeks dibangun ulang hanya jika objek atau panjangnya berubah.
+        """
+        cached = self._site_index
+        if cached is None or cached[0] is not points or cached[1] != len(points):
+            cached = self._site_index = (points, len(points), SiteIndex(points))
+        index = cached[2]
+        return index.coords[index.query(self._viewport)]
+
+    def render(self, diagram: Diagram, points: Sequence[Site],
+               circles: Sequence[Tuple[float, float, float]] = ()) -> str:
+        """
+        Menggambar diagram, site, vertex, dan lingkaran kosong terbesar.
+
+        Returns:
+            str: Mode yang dipakai ("vector" atau "raster")
+        """
+        segments, vertex_index = self._diagram_geometry(diagram)
+        visible_sites = self._visible_sites(points)
+        visible_vertices = vertex_index.coords[vertex_index.query(self._viewport)]
+        estimate = len(diagram.cells) + len(visible_sites) + len(visible_vertices)
+
+        polygons = None
+        if estimate <= self.ITEM_BUDGET:
+            polygons = self._cached_polygons(diagram)
+        if polygons is not None and len(polygons) + len(visible_sites) + len(visible_vertices) <= self.ITEM_BUDGET:
+            self._render_vector(polygons, visible_sites, visible_vertices)
+        else:
+            self._render_raster(segments, visible_sites, visible_vertices)
+
+        for item in self._circle_items:
+            self.canvas.delete(item)
+        self._circle_items = [
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, outline="orange", tags="largest_empty_circle")
+            for x, y, r in circles
+        ]
+        return self.mode
+
+    def _sync(self, items: Dict, wanted, create) -> None:
+        """Menghapus item yang tidak lagi ada dan membuat item untuk kunci baru."""
+        for key in [key for key in items if key not in wanted]:
+            self.canvas.delete(items.pop(key))
+        for key in wanted:
+            if key not in items:
+                items[key] = create(key)
+
+    def _render_vector(self, polygons, sites: np.ndarray, vertices: np.ndarray) -> None:
+        if self.mode != "vector":
+            self.canvas.delete("raster")
+            self._image_item = None
+            self._photo = None
+            self.mode = "vector"
+
+        # Cell: buat baru, pindahkan yang berubah, hapus yang hilang
+        for key in [key for key in self._cell_items if key not in polygons]:
+            self.canvas.delete(self._cell_items.pop(key)[0])
+        for key, coords in polygons.items():
+            current = self._cell_items.get(key)
+            if current is None:
+                item = self.canvas.create_polygon(coords, outline="blue", fill="", tags="voronoi")
+                self._cell_items[key] = (item, coords)
+            elif current[1] != coords:
+                self.canvas.coords(current[0], *coords)
+                self._cell_items[key] = (current[0], coords)
+
+        r = self.site_radius
+        self._sync(self._site_items, set(map(tuple, sites.tolist())), lambda key: self.canvas.create_oval(
+            key[0] - r, key[1] - r, key[0] + r, key[1] + r, fill="black", tags="site"))
+        self._sync(self._vertex_items, set(map(tuple, vertices.tolist())), lambda key: self.canvas.create_oval(
+            key[0] - 1.5, key[1] - 1.5, key[0] + 1.5, key[1] + 1.5, fill="red", outline="red", tags="vertex"))
+
+        # Urutan tumpukan sama seperti sebelumnya: cell, lalu site, lalu vertex
+        self.canvas.tag_raise("site")
+        self.canvas.tag_raise("vertex")
+
+    def _render_raster(self, segments: np.ndarray, sites: np.ndarray, vertices: np.ndarray) -> None:
+        image = np.full((self.height, self.width, 3), 255, dtype=np.uint8)
+        rasterize_segments(image, segments, CELL_COLOR)
+        rasterize_points(image, sites, SITE_COLOR, 2)
+        rasterize_points(image, vertices, VERTEX_COLOR, 1)
+        self._show_image(image, "raster")
+
+    def render_preview(self, raster: RasterVoronoi, scale: int, points: Sequence[Site]) -> str:
+        """
+        Menampilkan hasil RasterVoronoi (batas cell aproksimatif) beserta site-nya
+        sebagai satu gambar, sambil menunggu diagram eksak.
+
+        Args:
+            raster: Hasil jump flooding untuk area canvas
+            scale: Faktor pembesaran dari resolusi raster ke resolusi canvas
+            points: Site yang digambar di atas pratinjau
+
+        Returns:
+            str: "preview"
+        """
+        image = upscale(raster.to_rgb("boundaries"), scale, self.width, self.height)
+        coords = np.array([(p.x, p.y) for p in points], dtype=np.float64).reshape(-1, 2)
+        rasterize_points(image, coords, SITE_COLOR, 2)
+        self._show_image(image, "preview")
+        for item in self._circle_items:
+            self.canvas.delete(item)
+        self._circle_items = []
+        return self.mode
+
+    def _show_image(self, image: np.ndarray, mode: str) -> None:
+        """Menampilkan image sebagai satu item canvas dan menghapus semua layer vector."""
+        import tkinter as tk
+
+        # Semua layer vector (termasuk site hasil add_point) kini ada di dalam gambar
+        self.canvas.delete("voronoi", "site", "vertex")
+        self._cell_items.clear()
+        self._site_items.clear()
+        self._vertex_items.clear()
+        self.mode = mode
+
+        self._photo = tk.PhotoImage(data=base64.b64encode(encode_png(image)), format="png")
+        if self._image_item is None:
+            self._image_item = self.canvas.create_image(0, 0, image=self._photo, anchor=tk.NW, tags="raster")
+        else:
+            self.canvas.itemconfig(self._image_item, image=self._photo)
+        self.canvas.tag_lower("raster")
@@ -0,0 +1,248 @@
+"""
+Snapshot diagram Voronoi yang immutable untuk banyak reader sekaligus.
+
+FortunesAlgo mengubah Diagram di tempat, sehingga reader yang membaca diagram yang
+sedang dihitung ulang bisa melihat cell setengah jadi. DiagramSnapshot menyalin
+hasil akhir sebuah perhitungan ke array numpy read-only yang ringkas (tanpa objek
+DCEL), dan SnapshotPublisher menerbitkannya dengan satu assignment referensi.
+
+Reader cukup mengambil publisher.current satu kali lalu memakai snapshot tersebut
+sebanyak yang dibutuhkan tanpa lock; snapshot tidak pernah berubah, jadi reader
+tetap konsisten walaupun snapshot baru diterbitkan di tengah jalan. Penulis
+diserialisasi oleh lock milik publisher dan memakai ulang satu Diagram dan
+FortunesAlgo ber-pool, karena data yang dibaca reader sudah disalin ke snapshot.
+
+Contoh:
+    publisher = SnapshotPublisher()
+    publisher.compute(sites, rect)        # thread penulis
+    snapshot = publisher.current          # thread reader mana pun
+    polygon = snapshot.polygon(snapshot.locate(x, y))
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from math import hypot
+from typing import Iterable, Optional
+
+import numpy as np
+
+from Diagram import Diagram
+from DiagramExport import edge_segments
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+from ViewportVoronoi import SiteIndex
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class DiagramSnapshot:
+    """
+    Salinan immutable dari diagram yang sudah selesai.
+
+    Cell ke-i memiliki site sites[i], poligon CCW
+    ring_coords[ring_offsets[i]:ring_offsets[i + 1]] dan tetangga
+    neighbour_indices[neighbour_offsets[i]:neighbour_offsets[i + 1]] (layout CSR).
+    Semua array read-only.
+
+    Attributes:
+        version: Nomor urut snapshot dari publisher (0 jika dibuat langsung)
+        clipping_rect: Rectangle clipping perhitungan
+        sites: Array (n, 2) site setiap cell
+        ring_offsets: Array (n + 1,) awal poligon setiap cell di ring_coords
+        ring_coords: Array (r, 2) vertex poligon semua cell
+        neighbour_offsets: Array (n + 1,) awal tetangga setiap cell di neighbour_indices
+        neighbour_indices: Array indeks cell tetangga
+        vertices: Array (k, 2) vertex Voronoi
+        edges: Array (m, 4) edge (x1, y1, x2, y2), setiap pasangan twin sekali
+        compute_time: Waktu perhitungan diagram (detik)
+        index: SiteIndex atas sites untuk locate()
+    """
+    version: int
+    clipping_rect: Rectangle
+    sites: np.ndarray
+    ring_offsets: np.ndarray
+    ring_coords: np.ndarray
+    neighbour_offsets: np.ndarray
+    neighbour_indices: np.ndarray
+    vertices: np.ndarray
+    edges: np.ndarray
+    compute_time: float = 0.0
+    index: Optional[SiteIndex] = None
+
+    @classmethod
+    def from_diagram(cls, diagram: Diagram, clipping_rect: Rectangle, version: int = 0,
+                     compute_time: float = 0.0) -> "DiagramSnapshot":
+        """
+        Menyalin diagram yang sudah selesai ke snapshot baru.
+
+        Args:
+            diagram: Diagram hasil perhitungan; tidak dirujuk lagi oleh snapshot
+            clipping_rect: Rectangle clipping perhitungan
+            version: Nomor urut snapshot
+            compute_time: Waktu perhitungan diagram (detik)
+
+        Returns:
+            DiagramSnapshot
+        """
+        diagram.finalize_all()
+        cells = diagram.cells
+        cell_index = {id(cell): i for i, cell in enumerate(cells)}
+
+        ring_offsets = [0]
+        ring_coords = []
+        neighbour_offsets = [0]
+        neighbour_indices = []
+        for i, cell in enumerate(cells):
+            ring = [(v.x, v.y) for v in cell.hull_vertices_ccw()]
+            ring_coords.extend(ring)
+            ring_offsets.append(len(ring_coords))
+            seen = set()
+            for neighbour in cell.neighbours():
+                j = cell_index.get(id(neighbour))
+                if j is not None and j != i and j not in seen:
+                    seen.add(j)
+                    neighbour_indices.append(j)
+            neighbour_offsets.append(len(neighbour_indices))
+
+        sites = np.array([(cell.site.x, cell.site.y) for cell in cells], dtype=np.float64).reshape(-1, 2)
+        return cls(
+            version=version,
+            clipping_rect=clipping_rect,
+            sites=_frozen(sites),
+            ring_offsets=_frozen(np.array(ring_offsets, dtype=np.int64)),
+            ring_coords=_frozen(np.array(ring_coords, dtype=np.float64).reshape(-1, 2)),
+            neighbour_offsets=_frozen(np.array(neighbour_offsets, dtype=np.int64)),
+            neighbour_indices=_frozen(np.array(neighbour_indices, dtype=np.int64)),
+            vertices=_frozen(np.array([(v.x, v.y) for v in diagram.vertices], dtype=np.float64).reshape(-1, 2)),
+            edges=_frozen(np.array(list(edge_segments(diagram)), dtype=np.float64).reshape(-1, 4)),
+            compute_time=compute_time,
+            index=SiteIndex(sites) if len(sites) else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    @property
+    def nbytes(self) -> int:
+        """Jumlah byte semua array snapshot (tanpa indeks)."""
+        return sum(a.nbytes for a in (self.sites, self.ring_offsets, self.ring_coords, self.neighbour_offsets,
+                                      self.neighbour_indices, self.vertices, self.edges))
+
+    def polygon(self, i: int) -> np.ndarray:
+        """Vertex poligon CCW cell ke-i sebagai array (k, 2) read-only."""
+        return self.ring_coords[self.ring_offsets[i]:self.ring_offsets[i + 1]]
+
+    def neighbours(self, i: int) -> np.ndarray:
+        """Indeks cell tetangga cell ke-i."""
+        return self.neighbour_indices[self.neighbour_offsets[i]:self.neighbour_offsets[i + 1]]
+
+    def locate(self, x: float, y: float) -> int:
+        """
+        Mencari cell yang memuat titik (x, y), yaitu cell dengan site terdekat.
+
+        Returns:
+            Indeks cell, atau -1 jika snapshot kosong
+        """
+        if self.index is None:
+            return -1
+        bounds = self.index.bounds
+        # Mulai dari kotak seukuran kira-kira satu bucket, perbesar sampai ada kandidat
+        half = max(bounds.width, bounds.height) / max(1, min(self.index.nx, self.index.ny))
+        half = max(half, 1e-9)
+        while True:
+            candidates = self.index.query(Rectangle(x - half, y - half, 2 * half, 2 * half))
+            if len(candidates):
+                break
+            half *= 2
+        c = self.sites[candidates]
+        nearest = candidates[np.argmin(np.hypot(c[:, 0] - x, c[:, 1] - y))]
+        # Site yang lebih dekat pasti berada di dalam kotak dengan radius jarak terdekat
+        radius = hypot(self.sites[nearest, 0] - x, self.sites[nearest, 1] - y)
+        if radius > half:
+            candidates = self.index.query(Rectangle(x - radius, y - radius, 2 * radius, 2 * radius))
+            c = self.sites[candidates]
+            nearest = candidates[np.argmin(np.hypot(c[:, 0] - x, c[:, 1] - y))]
+        return int(nearest)
+
+
+class SnapshotPublisher:
+    """
+    Menghitung diagram dan menerbitkan snapshot terbarunya secara atomik.
+
+    current dapat dibaca dari thread mana pun tanpa lock. compute() dan publish()
+    diserialisasi satu sama lain; snapshot lama tetap valid selama masih dirujuk.
+
+    Attributes:
+        version: Nomor urut snapshot terakhir yang diterbitkan (0 jika belum ada)
+    """
+
+    def __init__(self):
+        self._current: Optional[DiagramSnapshot] = None
+        self._write_lock = threading.Lock()
+        self._published = threading.Condition(threading.Lock())
+        self._sweep = FortunesAlgo(pooled=True)
+        self._diagram = Diagram(pooled=True)
+        self.version = 0
+
+    @property
+    def current(self) -> Optional[DiagramSnapshot]:
+        """Snapshot terakhir yang diterbitkan, atau None jika belum ada."""
+        return self._current
+
+    def compute(self, sites: Iterable[Site], clipping_rect: Rectangle) -> DiagramSnapshot:
+        """
+        Menghitung diagram baru dan menerbitkan snapshot-nya.
+
+        Selama perhitungan, reader tetap membaca snapshot sebelumnya.
+
+        Args:
+            sites: Titik-titik input
+            clipping_rect: Rectangle clipping
+
+        Returns:
+            Snapshot yang baru diterbitkan
+        """
+        with self._write_lock:
+            diagram = self._diagram
+            diagram.clear()
+            start = time.perf_counter()
+            self._sweep.compute(sites, diagram, clipping_rect)
+            compute_time = time.perf_counter() - start
+            return self._publish(diagram, clipping_rect, compute_time)
+
+    def publish(self, diagram: Diagram, clipping_rect: Rectangle, compute_time: float = 0.0) -> DiagramSnapshot:
+        """
+        Menerbitkan snapshot dari diagram yang dihitung di luar publisher.
+
+        Returns:
+            Snapshot yang baru diterbitkan
+        """
+        with self._write_lock:
+            return self._publish(diagram, clipping_rect, compute_time)
+
+    def _publish(self, diagram: Diagram, clipping_rect: Rectangle, compute_time: float) -> DiagramSnapshot:
+        snapshot = DiagramSnapshot.from_diagram(diagram, clipping_rect, self.version + 1, compute_time)
+        with self._published:
+            # Satu assignment referensi: reader melihat snapshot lama atau baru, tidak pernah campuran
+            self._current = snapshot
+            self.version = snapshot.version
+            self._published.notify_all()
+        return snapshot
+
+    def wait_newer(self, version: int, timeout: Optional[float] = None) -> Optional[DiagramSnapshot]:
+        """
+        Menunggu sampai ada snapshot dengan nomor lebih besar dari version.
+
+        Returns:
+            Snapshot terbaru, atau None jika timeout habis sebelum ada snapshot baru
+        """
+        with self._published:
+            if not self._published.wait_for(lambda: self.version > version, timeout):
+                return None
+            return self._current
@@ -0,0 +1,355 @@
+"""
+Perekaman trace event sweep FortunesAlgo ke log biner berlebar tetap, beserta replayer-nya.
+
+Format file (little-endian):
+    header : magic b"VTRC", versi (u16), ukuran record (u16), jumlah site (u32)
+    sites  : jumlah_site pasangan float64 (x, y); indeks pasangan = site id
+    records: satu record RECORD per event yang diproses, sampai akhir file
+
+Setiap arc beachline mendapat id unik saat dibuat. Record site event menyimpan
+arc baru, arc di kirinya, dan salinan kanan arc yang terbelah (-1 jika tidak ada);
+record circle event menyimpan arc yang hilang, kedua tetangganya, dan vertex yang
+terbentuk. Informasi ini cukup untuk membangun ulang urutan arc beachline tanpa
+menghitung geometri apa pun.
+
+Contoh penggunaan:
+    python voronoi_cli.py input.txt --trace sweep.trace -o hasil.json
+    python EventTrace.py sweep.trace --step 1200
+"""
+
+import argparse
+import struct
+import sys
+from bisect import bisect_right
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from Site import Site
+
+MAGIC = b"VTRC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+KIND_SITE = 0
+KIND_CIRCLE = 1
+
+# kind, padding, step, sweep_y, site, arc, left, right, vertex_x, vertex_y
+RECORD = struct.Struct("<B3xIdiiiidd")
+
+RECORD_DTYPE = np.dtype([
+    ("kind", "u1"), ("pad", "V3"), ("step", "<u4"), ("sweep_y", "<f8"),
+    ("site", "<i4"), ("arc", "<i4"), ("left", "<i4"), ("right", "<i4"),
+    ("vertex_x", "<f8"), ("vertex_y", "<f8"),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+NAN = float("nan")
+
+
+class EventTrace:
+    """
+    Perekam event sweep yang menulis record berlebar tetap ke file biner.
+
+    Record dikemas ke buffer bytearray yang sudah dialokasikan dan baru ditulis
+    ke file saat buffer penuh, sehingga biaya per event hanya satu struct.pack_into.
+    Seperti SweepStats, perekaman bersifat opt-in lewat argumen trace FortunesAlgo.
+
+    Attributes:
+        target: File biner tujuan (None berarti disimpan di memori, lihat getvalue)
+        records: Jumlah record yang sudah direkam pada sweep terakhir
+    """
+
+    def __init__(self, target: Optional[BinaryIO] = None, buffer_records: int = 4096):
+        """
+        Args:
+            target: File biner yang terbuka untuk ditulis (None = simpan di memori)
+            buffer_records: Jumlah record yang ditampung sebelum ditulis ke file
+        """
+        self.target = target
+        self._memory = bytearray() if target is None else None
+        self._buffer = bytearray(RECORD.size * buffer_records)
+        self._offset = 0
+        self._site_ids: Dict[Site, int] = {}
+        self._next_arc_id = 0
+        self.records = 0
+
+    def _write(self, data) -> None:
+        if self._memory is not None:
+            self._memory += data
+        else:
+            self.target.write(data)
+
+    def start(self, sites: Sequence[Site]) -> None:
+        """
+        Dipanggil di awal sweep. Menulis header dan tabel site; urutan sites menjadi site id.
+        """
+        self._offset = 0
+        self._next_arc_id = 0
+        self.records = 0
+        self._site_ids = {site: i for i, site in enumerate(sites)}
+        if self._memory is not None:
+            self._memory.clear()
+        self._write(HEADER.pack(MAGIC, VERSION, RECORD.size, len(sites)))
+        coords = np.fromiter((c for site in sites for c in (site.x, site.y)), dtype="<f8", count=2 * len(sites))
+        self._write(coords.tobytes())
+
+    def _arc_id(self, arc) -> int:
+        """Mengembalikan id arc, memberi id baru jika arc belum pernah terlihat."""
+        if arc is None:
+            return -1
+        if arc.trace_id < 0:
+            arc.trace_id = self._next_arc_id
+            self._next_arc_id += 1
+        return arc.trace_id
+
+    def _append(self, kind: int, step: int, sweep_y: float, site: Site,
+                arc, left, right, vertex_x: float, vertex_y: float) -> None:
+        RECORD.pack_into(
+            self._buffer, self._offset, kind, step, sweep_y, self._site_ids[site],
+            self._arc_id(arc), self._arc_id(left), self._arc_id(right), vertex_x, vertex_y
+        )
+        self._offset += RECORD.size
+        self.records += 1
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def record_site(self, step: int, sweep_y: float, arc, left, right) -> None:
+        """
+        Merekam site event.
+
+        Args:
+            arc: Arc baru untuk site
+            left: Arc tepat di kiri arc baru (None jika beachline sebelumnya kosong)
+            right: Salinan kanan arc yang terbelah, atau None jika tidak ada arc yang terbelah
+        """
+        self._append(KIND_SITE, step, sweep_y, arc.point, arc, left, right, NAN, NAN)
+
+    def record_circle(self, step: int, sweep_y: float, arc, left, right, vertex: Site) -> None:
+        """
+        Merekam circle event.
+
+        Args:
+            arc: Arc yang hilang dari beachline
+            left, right: Tetangga arc tersebut sebelum dihapus
+            vertex: Vertex Voronoi yang terbentuk
+        """
+        self._append(KIND_CIRCLE, step, sweep_y, arc.point, arc, left, right, vertex.x, vertex.y)
+
+    def flush(self) -> None:
+        """Menulis isi buffer ke tujuan."""
+        if self._offset:
+            self._write(memoryview(self._buffer)[:self._offset])
+            self._offset = 0
+        if self.target is not None and hasattr(self.target, "flush"):
+            self.target.flush()
+
+    def getvalue(self) -> bytes:
+        """Mengembalikan seluruh trace yang disimpan di memori (hanya jika target None)."""
+        if self._memory is None:
+            raise ValueError("trace ditulis ke file, bukan ke memori")
+        self.flush()
+        return bytes(self._memory)
+
+
+class _ArcList:
+    """Linked list urutan arc beachline (berdasarkan id) untuk replay O(1) per event."""
+
+    def __init__(self, arcs: Sequence[int] = ()):
+        self.next: Dict[int, int] = {}
+        self.prev: Dict[int, int] = {}
+        self.head = -1
+        last = -1
+        for arc in arcs:
+            self._link(last, arc)
+            last = arc
+
+    def _link(self, left: int, arc: int) -> None:
+        """Menyisipkan arc tepat setelah left (left = -1 berarti di awal)."""
+        if left < 0:
+            right = self.head
+            self.head = arc
+        else:
+            right = self.next[left]
+            self.next[left] = arc
+        self.prev[arc] = left
+        self.next[arc] = right
+        if right >= 0:
+            self.prev[right] = arc
+
+    def remove(self, arc: int) -> None:
+        left = self.prev.pop(arc)
+        right = self.next.pop(arc)
+        if left >= 0:
+            self.next[left] = right
+        else:
+            self.head = right
+        if right >= 0:
+            self.prev[right] = left
+
+    def apply(self, kind: int, arc: int, left: int, right: int) -> None:
+        """Menerapkan satu record trace ke urutan arc."""
+        if kind == KIND_SITE:
+            self._link(left, arc)
+            if right >= 0:
+                self._link(arc, right)
+        else:
+            self.remove(arc)
+
+    def to_list(self) -> List[int]:
+        arcs = []
+        arc = self.head
+        while arc >= 0:
+            arcs.append(arc)
+            arc = self.next[arc]
+        return arcs
+
+
+class TraceReplayer:
+    """
+    Membaca trace biner dan membangun ulang beachline pada langkah mana pun.
+
+    Saat dibuka, seluruh log dilewati sekali untuk membuat snapshot urutan arc
+    setiap snapshot_every event. beachline_at(step) mulai dari snapshot terdekat
+    sebelum step lalu menerapkan paling banyak snapshot_every record, tanpa
+    menghitung ulang sweep dari awal.
+
+    Attributes:
+        sites: Array (n, 2) koordinat site; indeks baris = site id
+        records: Structured array RECORD_DTYPE berisi semua event
+        arc_sites: Array site id untuk setiap arc id
+    """
+
+    def __init__(self, source: Union[str, bytes, BinaryIO], snapshot_every: int = 1024):
+        """
+        Args:
+            source: Path file trace, isi trace (bytes), atau file biner yang terbuka
+            snapshot_every: Jarak (dalam jumlah event) antar snapshot beachline
+
+        Raises:
+            ValueError: Jika data bukan trace yang valid
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = bytes(source)
+        elif isinstance(source, str):
+            with open(source, "rb") as f:
+                data = f.read()
+        else:
+            data = source.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError("trace terlalu pendek")
+        magic, version, record_size, site_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError("format trace tidak dikenali")
+        sites_end = HEADER.size + 16 * site_count
+        if (len(data) - sites_end) % RECORD.size:
+            raise ValueError("trace terpotong di tengah record")
+
+        self.sites = np.frombuffer(data, dtype="<f8", count=2 * site_count, offset=HEADER.size).reshape(-1, 2)
+        self.records = np.frombuffer(data, dtype=RECORD_DTYPE, offset=sites_end)
+        self.snapshot_every = snapshot_every
+
+        # Snapshot ke-i adalah urutan arc setelah i * snapshot_every event.
+        # Site id setiap arc: arc baru milik site event-nya, salinan kanan milik arc yang terbelah.
+        self._snapshots: List[Tuple[int, ...]] = [()]
+        arc_sites: List[int] = []
+        arcs = _ArcList()
+        columns = (self.records[name].tolist() for name in ("kind", "site", "arc", "left", "right"))
+        for i, (kind, site, arc, left, right) in enumerate(zip(*columns), 1):
+            if kind == KIND_SITE:
+                arc_sites.append(site)
+                if right >= 0:
+                    arc_sites.append(arc_sites[left])
+            arcs.apply(kind, arc, left, right)
+            if i % snapshot_every == 0:
+                self._snapshots.append(tuple(arcs.to_list()))
+        self.arc_sites = np.array(arc_sites, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Jumlah event dalam trace."""
+        return len(self.records)
+
+    def event(self, step: int) -> dict:
+        """
+        Mengembalikan event ke-step (dimulai dari 1) dalam bentuk dict.
+        """
+        record = self.records[step - 1]
+        result = {
+            "step": int(record["step"]),
+            "kind": "site" if record["kind"] == KIND_SITE else "circle",
+            "sweep_y": float(record["sweep_y"]),
+            "site": int(record["site"]),
+            "arc": int(record["arc"]),
+            "left": int(record["left"]),
+            "right": int(record["right"]),
+        }
+        if record["kind"] == KIND_CIRCLE:
+            result["vertex"] = (float(record["vertex_x"]), float(record["vertex_y"]))
+        return result
+
+    def arcs_at(self, step: int) -> List[int]:
+        """
+        Mengembalikan id arc beachline dari kiri ke kanan setelah step event diproses.
+
+        Raises:
+            IndexError: Jika step di luar rentang 0..len(self)
+        """
+        if not 0 <= step <= len(self.records):
+            raise IndexError(f"step {step} di luar rentang 0..{len(self.records)}")
+        index = min(step // self.snapshot_every, len(self._snapshots) - 1)
+        arcs = _ArcList(self._snapshots[index])
+        records = self.records[index * self.snapshot_every:step]
+        columns = (records[name].tolist() for name in ("kind", "arc", "left", "right"))
+        for kind, arc, left, right in zip(*columns):
+            arcs.apply(kind, arc, left, right)
+        return arcs.to_list()
+
+    def beachline_at(self, step: int) -> List[int]:
+        """Mengembalikan site id setiap arc beachline dari kiri ke kanan setelah step event diproses."""
+        return self.arc_sites[self.arcs_at(step)].tolist()
+
+    def vertices_at(self, step: int) -> np.ndarray:
+        """Mengembalikan array (k, 2) vertex yang sudah terbentuk setelah step event diproses."""
+        records = self.records[:step]
+        circles = records[records["kind"] == KIND_CIRCLE]
+        return np.column_stack((circles["vertex_x"], circles["vertex_y"]))
+
+    def step_at_y(self, sweep_y: float) -> int:
+        """Mengembalikan jumlah event yang sudah diproses saat sweep line berada di sweep_y."""
+        return bisect_right(self.records["sweep_y"], sweep_y)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Menampilkan isi trace event FortunesAlgo")
+    parser.add_argument("trace", help="File trace dari voronoi_cli.py --trace")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--step", type=int, help="Tampilkan event dan beachline setelah langkah ini")
+    group.add_argument("--y", type=float, help="Tampilkan beachline saat sweep line berada di y ini")
+    args = parser.parse_args(argv)
+
+    try:
+        replayer = TraceReplayer(args.trace)
+    except (OSError, ValueError) as e:
+        print(f"trace: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{len(replayer.sites)} site, {len(replayer)} event, {len(replayer.arc_sites)} arc")
+    step = replayer.step_at_y(args.y) if args.y is not None else args.step
+    if step is None:
+        return 0
+    try:
+        if step > 0:
+            print(f"event {step}: {replayer.event(step)}")
+        beachline = replayer.beachline_at(step)
+    except IndexError as e:
+        print(f"trace: {e}", file=sys.stderr)
+        return 1
+    print(f"beachline ({len(beachline)} arc): " + " ".join(
+        f"{site}({replayer.sites[site][0]:g},{replayer.sites[site][1]:g})" for site in beachline
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,42 @@
-from queue import PriorityQueue
-from typing import Set, Optional, Tuple
+from itertools import count
+from typing import TYPE_CHECKING, Set, Optional, Tuple
 from Beachline import Beachline, Arc
 from Circle import Point, Circle
 from Event import Event, EventKind
 from Rectangle import Rectangle
 from Diagram import Diagram, HalfEdge, Site, Cell
 from LiangBarsky import lb_clip
+from SweepStats import SweepStats
+from ObjectPool import ObjectPool, gc_paused
+from time import perf_counter
 import heapq
 
+if TYPE_CHECKING:
+    # EventTrace memuat NumPy; hanya dibutuhkan pemanggil yang merekam trace
+    from EventTrace import EventTrace
+
 class FortunesAlgo:
     """
     Kelas ini mengimplementasikan algoritma Fortune's untuk menghasilkan diagram Voronoi.
     """
 
-    def __init__(self):
+    def __init__(self, stats: Optional[SweepStats] = None, trace: Optional['EventTrace'] = None,
+                 pooled: bool = False, lazy: bool = False):
         """
         Inisialisasi variabel-variabel yang dibutuhkan untuk algoritma Fortune's:
         
+        Args:
+            stats: Objek SweepStats opsional untuk mencatat statistik sweep (None = nonaktif)
+            trace: Objek EventTrace opsional untuk merekam setiap event ke log biner (None = nonaktif)
+            pooled: Jika True, objek Arc dan Event diambil dari pool yang di-recycle setiap
+                    begin() dalam O(1), dan cyclic GC dinonaktifkan selama advance() dan
+                    terminate(). Berguna untuk instance yang dipakai ulang untuk banyak perhitungan.
+            lazy: Jika True, terminate() hanya membatasi arc yang tersisa di beachline;
+                  setiap cell baru dilengkapi dan dipotong saat pertama diakses
+                  (lihat Diagram.finalize_all()).
+        
         Atribut:
-            event_queue (PriorityQueue): Antrian prioritas untuk menyimpan event-event yang akan diproses
+            event_queue (list): Heap berisi tuple (y, x, urutan, event) untuk event-event yang akan diproses
             beachline (Beachline): Struktur data untuk menyimpan garis pantai (beachline)
             sweep_line_y (float): Posisi Y dari garis penyapuan saat ini
             first_site_y (float): Koordinat Y dari titik pertama yang diproses
@@ -27,8 +45,13 @@ class FortunesAlgo:
             diagram (Diagram): Objek diagram Voronoi yang akan dihasilkan
             current_step (int): Langkah saat ini dalam algoritma
             is_terminated (bool): Status apakah algoritma sudah selesai dijalankan
+            stats (SweepStats): Pencatat statistik sweep, atau None jika nonaktif
+            trace (EventTrace): Perekam trace event, atau None jika nonaktif
+            arc_pool, event_pool (ObjectPool): Pool Arc dan Event, atau None jika pooled=False
+            lazy (bool): Apakah cell diselesaikan secara lazy
         """
-        self.event_queue = PriorityQueue()
+        self.event_queue = []
+        self._event_counter = count()
         self.beachline = Beachline()
         self.sweep_line_y = 0
         self.first_site_y = None
@@ -37,11 +60,20 @@ class FortunesAlgo:
         self.diagram = None
         self.current_step = 0
         self.is_terminated = False
+        self.stats = stats
+        self.trace = trace
+        self._half_edges_at_start = 0
+        self.arc_pool = ObjectPool(Arc) if pooled else None
+        self.event_pool = ObjectPool(Event) if pooled else None
+        self.lazy = lazy
 
     def compute(self, sites: Set[Point], diagram: Diagram, clipping_rect: Rectangle, max_steps_count: int = -1) -> bool:
         """
         Memulai perhitungan diagram Voronoi dari kumpulan titik yang diberikan.
         
+        Setiap pemanggilan memulai sweep dari awal. Untuk melanjutkan sweep secara
+        bertahap gunakan begin(), advance(), dan finish().
+        
         Args:
             sites: Himpunan titik-titik sumber untuk diagram Voronoi
             diagram: Objek diagram yang akan menyimpan hasil perhitungan
@@ -51,53 +83,186 @@ class FortunesAlgo:
         Returns:
             bool: True jika perhitungan selesai, False jika masih ada langkah yang tersisa
         """
-        self.diagram = diagram
-        self.clipper = clipping_rect
+        if not self.begin(sites, clipping_rect, diagram):
+            # Tidak ada titik dalam area clipping, langsung selesai
+            return True
         
-        # Filter titik-titik yang berada dalam area clipping
-        filtered_sites = {site for site in sites if self.clipper.contains(site)}
+        if self.advance(max_steps_count if max_steps_count >= 0 else None):
+            self.terminate()
+            return True
         
-        # Buat event dari setiap titik
-        events = [Event(point=site) for site in filtered_sites]
+        return False
+
+    def begin(self, sites: Set[Point], clipping_rect: Rectangle, diagram: Optional[Diagram] = None) -> bool:
+        """
+        Menyiapkan sesi sweep baru tanpa memproses event apa pun.
         
-        # Jika tidak ada titik dalam area clipping, langsung selesai
-        if not events:
-            return True
+        Args:
+            sites: Himpunan titik-titik sumber untuk diagram Voronoi
+            clipping_rect: Rectangle yang menentukan batas area diagram
+            diagram: Objek diagram yang akan menyimpan hasil (None untuk membuat yang baru)
+            
+        Returns:
+            bool: True jika ada titik di dalam area clipping yang akan diproses
+        """
+        previous = self.diagram
+        if previous is not None and not previous.is_finalized:
+            # Cell tertunda dari sesi lazy sebelumnya memakai container dan clipper sesi itu
+            previous.finalize_all()
+        self.diagram = diagram if diagram is not None else Diagram()
+        self.clipper = clipping_rect
         
-        # Inisialisasi state awal
+        # Filter titik-titik yang berada dalam area clipping
+        filtered_sites = [site for site in set(sites) if self.clipper.contains(site)]
+        
+        # Inisialisasi state awal; arc dan event sesi sebelumnya dikembalikan ke pool
+        if self.arc_pool is not None:
+            self.arc_pool.recycle()
+            self.event_pool.recycle()
+        self.event_queue = []
+        self._event_counter = count()
         self.current_step = 0
         self.sweep_line_y = 0
         self.first_site_y = None
-        self.beachline = Beachline()
+        self.beachline = Beachline(self.arc_pool)
+        self.is_terminated = not filtered_sites
         
-        # Masukkan semua event ke dalam priority queue
-        for event in events:
-            self.event_queue.put(event)
+        # Masukkan semua site event ke dalam priority queue
+        for site in filtered_sites:
+            self.push_event(self._new_event(site))
         
-        self.is_terminated = False
+        if self.stats is not None:
+            self.stats.start(len(self.event_queue))
+            self._half_edges_at_start = self.diagram.half_edge_count
+        if self.trace is not None:
+            self.trace.start(filtered_sites)
         
-        # Loop utama algoritma
-        while not self.event_queue.empty() and self.current_step != max_steps_count:
-            self.step()
+        return bool(filtered_sites)
+
+    def advance(self, max_events: Optional[int] = None, until_y: Optional[float] = None) -> bool:
+        """
+        Melanjutkan sweep dari state terakhir.
         
-        if self.event_queue.empty():
-            self.terminate()
-            return True
+        Berhenti setelah max_events event diproses, atau sebelum event pertama
+        dengan y > until_y, atau saat queue habis. Biaya setiap pemanggilan
+        sebanding dengan jumlah event yang diproses.
         
-        return False
+        Args:
+            max_events: Jumlah maksimum event yang diproses (None untuk tidak terbatas)
+            until_y: Posisi sweep line maksimum yang diproses (None untuk tidak terbatas)
+            
+        Returns:
+            bool: True jika semua event sudah diproses dan sweep tinggal diselesaikan dengan finish()
+        """
+        try:
+            if self.arc_pool is not None:
+                with gc_paused():
+                    return self._advance(max_events, until_y)
+            return self._advance(max_events, until_y)
+        finally:
+            # Trace lengkap sampai event terakhir walaupun sweep dibatalkan di antara
+            # chunk atau gagal di tengah chunk
+            if self.trace is not None:
+                self.trace.flush()
+
+    def _advance(self, max_events: Optional[int], until_y: Optional[float]) -> bool:
+        processed = 0
+        while max_events is None or processed < max_events:
+            event = self.peek_event()
+            if event is None:
+                return True
+            if until_y is not None and event.point.y > until_y:
+                return False
+            heapq.heappop(self.event_queue)
+            self.process_event(event)
+            processed += 1
+        return self.peek_event() is None
+
+    def finish(self) -> Diagram:
+        """
+        Memproses semua event yang tersisa lalu menyelesaikan diagram.
+        
+        Returns:
+            Diagram: Diagram Voronoi yang sudah lengkap dan terpotong
+        """
+        if not self.is_terminated:
+            self.advance()
+            self.terminate()
+        return self.diagram
+
+    def _new_event(self, point: Point, kind: EventKind = EventKind.SITE) -> Event:
+        """Membuat event baru, dari pool jika pooled."""
+        if self.event_pool is not None:
+            return self.event_pool.acquire(point, kind)
+        return Event(point=point, kind=kind)
+
+    def push_event(self, event: Event):
+        """
+        Memasukkan event ke priority queue.
+        Urutan: y terkecil lebih dulu, lalu x terkecil, lalu urutan penyisipan.
+        """
+        heapq.heappush(self.event_queue, (event.point.y, event.point.x, next(self._event_counter), event))
+
+    def peek_event(self) -> Optional[Event]:
+        """
+        Mengembalikan event valid teratas tanpa mengeluarkannya dari queue.
+        Circle event yang sudah dibatalkan dibuang di sini (lazy deletion).
+        """
+        queue = self.event_queue
+        while queue:
+            event = queue[0][-1]
+            if event.kind == EventKind.CIRCLE and event.arc.event is not event:
+                heapq.heappop(queue)
+                if self.stats is not None:
+                    self.stats.record_stale_discarded()
+                continue
+            return event
+        return None
 
     def step(self):
         """
         Mengeksekusi satu langkah algoritma dengan memproses event teratas dari queue.
         Event bisa berupa site event atau circle event.
         """
-        if not self.event_queue.empty():
-            event = self.event_queue.get()
-            self.current_step += 1
-            if event.kind == EventKind.SITE:
-                self.process_site_event(event)
-            else:
-                self.process_circle_event(event)
+        event = self.peek_event()
+        if event is not None:
+            heapq.heappop(self.event_queue)
+            self.process_event(event)
+
+    def process_event(self, event: Event):
+        """
+        Memproses satu event yang sudah dikeluarkan dari queue.
+        
+        Args:
+            event: Site event atau circle event
+        """
+        self.current_step += 1
+        if self.stats is not None:
+            self.step_with_stats(event)
+        elif event.kind == EventKind.SITE:
+            self.process_site_event(event)
+        else:
+            self.process_circle_event(event)
+
+    def step_with_stats(self, event: Event):
+        """
+        Memproses satu event sambil mencatat waktu dan counter ke self.stats.
+        
+        Args:
+            event: Event yang sudah diambil dari queue
+        """
+        stats = self.stats
+        start = perf_counter()
+        if event.kind == EventKind.SITE:
+            self.process_site_event(event)
+            stats.record_site_event(perf_counter() - start)
+        else:
+            if event.arc.event is not event:
+                stats.record_false_alarm()
+            self.process_circle_event(event)
+            stats.record_circle_event(perf_counter() - start)
+        if self.current_step % stats.sample_every == 0:
+            stats.on_sample(self.current_step, self.sweep_line_y, self.beachline, len(self.event_queue))
 
     def process_site_event(self, event: Event):
         """
@@ -123,6 +288,8 @@ class FortunesAlgo:
             self.container = Rectangle.rect_from_source(self.clipper, 20)
             self.container.expand_to_contain_point(event.point)
             self.diagram.create_cell(root)
+            if self.trace is not None:
+                self.trace.record_site(self.current_step, self.sweep_line_y, root, None, None)
             return
         
         # Kasus khusus: titik dengan y yang sama dengan titik pertama
@@ -138,12 +305,17 @@ class FortunesAlgo:
             arc.left_half_edge = self.diagram.create_half_edge(arc.cell)
             arc.left_half_edge.origin = p
             self.make_twins(prev.right_half_edge, arc.left_half_edge)
+            if self.trace is not None:
+                self.trace.record_site(self.current_step, self.sweep_line_y, arc, prev, None)
             return
         
         # Kasus normal: sisipkan arc baru ke beachline
         new_arc, is_special_case = self.beachline.insert_arc_for_point(event.point)
         self.container.expand_to_contain_point(event.point)
         self.diagram.create_cell(new_arc)
+        if self.trace is not None:
+            self.trace.record_site(self.current_step, self.sweep_line_y, new_arc, new_arc.prev,
+                                   None if is_special_case else new_arc.next)
         
         # Periksa kemungkinan circle event
         self.remove_circle_event(new_arc.prev)
@@ -159,6 +331,7 @@ class FortunesAlgo:
             vertex = Circle.from_three_points(
                 prev_arc.point, new_arc.point, next_arc.point
             ).center
+            self.diagram.vertices.append(vertex)
             
             # Perbarui half-edge yang ada
             prev_arc.right_half_edge.origin = vertex
@@ -181,9 +354,10 @@ class FortunesAlgo:
             r_twin.origin = vertex
             self.make_twins(rhe, r_twin)
             
-            # Sambungkan kembali half-edge
-            self.connect(prev_arc.right_half_edge, lhe)
-            self.connect(rhe, next_arc.left_half_edge)
+            # Sambungkan kembali half-edge; setiap sambungan berada di dalam satu cell
+            self.connect(l_twin, prev_arc.right_half_edge)
+            self.connect(next_arc.left_half_edge, r_twin)
+            self.connect(rhe, lhe)
             
             prev_arc.right_half_edge = l_twin
             next_arc.left_half_edge = r_twin
@@ -212,10 +386,12 @@ class FortunesAlgo:
         
         self.sweep_line_y = event.point.y
         self.beachline.update_sweepline_y(self.sweep_line_y)
+        if self.trace is not None:
+            self.trace.record_circle(self.current_step, self.sweep_line_y, arc, left, right, center)
         
         # Hapus arc dan circle event terkait
         self.beachline.delete_arc(arc)
-        self.remove_circle_event(arc)
+        arc.event = None  # Event ini sedang diproses, bukan dibatalkan
         self.remove_circle_event(left)
         self.remove_circle_event(right)
         
@@ -280,31 +456,51 @@ class FortunesAlgo:
         right = arc.next
         circle = self.check_circle_event(left, arc, right)
         if circle:
-            event = Event(point=circle.bottom_point, kind=EventKind.CIRCLE)
+            event = self._new_event(circle.bottom_point, EventKind.CIRCLE)
             event.circle = circle
             event.arc = arc
             arc.event = event
-            self.event_queue.put(event)
+            self.push_event(event)
+            if self.stats is not None:
+                self.stats.record_circle_created(len(self.event_queue))
 
     def remove_circle_event(self, arc: Optional[Arc]):
         """
         Menghapus circle event yang terkait dengan arc tertentu.
         
+        Event tidak dicari di dalam queue; cukup dilepas dari arc-nya sehingga
+        dianggap basi dan dibuang saat keluar dari queue (lazy deletion, O(1)).
+        
         Args:
             arc: Arc yang circle event-nya akan dihapus
         """
         if arc and arc.event and arc.event.kind == EventKind.CIRCLE:
-            if arc.event in self.event_queue.queue:
-                self.event_queue.queue.remove(arc.event)
-                heapq.heapify(self.event_queue.queue)  # Heapify the priority queue
             arc.event = None
+            if self.stats is not None:
+                self.stats.record_circle_cancelled()
 
     def terminate(self):
         """
         Menyelesaikan konstruksi diagram dengan menangani edge-edge yang belum selesai
-        dan memotong diagram sesuai dengan area clipping.
+        dan memotong diagram sesuai dengan area clipping. Pada mode lazy, hanya arc
+        yang tersisa di beachline yang dibatasi; cell dilengkapi saat diakses.
         """
+        try:
+            if self.arc_pool is not None:
+                with gc_paused():
+                    self._terminate()
+            else:
+                self._terminate()
+        finally:
+            if self.trace is not None:
+                self.trace.flush()
+
+    def _terminate(self):
         self.is_terminated = True
+        stats = self.stats
+        if stats is not None:
+            stats.on_sample(self.current_step, self.sweep_line_y, self.beachline, len(self.event_queue))
+            stats.begin_phase()
         
         # Selesaikan edge-edge yang belum lengkap
         arc = self.beachline.minimum
@@ -329,11 +525,39 @@ class FortunesAlgo:
                     self.connect(max_arc.left_half_edge, head)
                     self.connect(tail, min_arc.right_half_edge)
         
-        # Selesaikan dan potong semua cell
-        for cell in self.diagram.cells:
-            if not cell.outer_component or not cell.outer_component.prev or not cell.outer_component.next:
-                self.complete_incomplete_cell(cell)
-            self.clip_cell(cell, self.clipper)
+        if self.lazy:
+            # Cell dilengkapi dan dipotong satu per satu saat pertama diakses
+            self.diagram.defer_finalization(self.finalize_cell)
+        else:
+            # Selesaikan semua cell
+            for cell in self.diagram.cells:
+                if not cell.outer_component or not cell.outer_component.prev or not cell.outer_component.next:
+                    self.complete_incomplete_cell(cell)
+        
+        if stats is not None:
+            stats.end_complete_phase()
+            stats.begin_phase()
+        
+        # Potong semua cell
+        if not self.lazy:
+            for cell in self.diagram.cells:
+                self.clip_cell(cell, self.clipper)
+        
+        if stats is not None:
+            stats.end_clip_phase()
+            stats.record_half_edges(self.diagram.half_edge_count - self._half_edges_at_start)
+
+    def finalize_cell(self, cell: Cell):
+        """
+        Melengkapi dan memotong satu cell dari diagram sesi terakhir.
+        Dipanggil oleh Diagram untuk cell yang tertunda pada mode lazy.
+        
+        Args:
+            cell: Cell yang akan diselesaikan
+        """
+        if not cell.outer_component or not cell.outer_component.prev or not cell.outer_component.next:
+            self.complete_incomplete_cell(cell)
+        self.clip_cell(cell, self.clipper)
 
     def complete_incomplete_cell(self, cell: Cell):
         """
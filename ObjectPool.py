@@ -0,0 +1,86 @@
+"""
+Pool objek untuk memakai ulang Arc, Event, Cell, dan HalfEdge antar perhitungan.
+
+Setiap pool mencatat objek yang dibagikan sejak recycle() terakhir. recycle()
+memindahkan seluruh daftar itu ke daftar bebas dalam O(1) (list-nya dipindah,
+bukan disalin), sehingga tidak ada objek yang didealokasi dan cyclic GC tidak
+perlu membersihkan graf arc/event yang saling mereferensikan. Objek bebas
+diinisialisasi ulang dengan memanggil __init__-nya lagi saat diambil.
+
+Objek yang sudah di-recycle dapat dipakai ulang kapan saja; pemanggil tidak boleh
+lagi memegang referensi ke objek tersebut.
+"""
+
+import gc
+from contextlib import contextmanager
+from typing import Generic, List, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectPool(Generic[T]):
+    """
+    Pool untuk satu kelas objek.
+
+    Attributes:
+        cls: Kelas objek yang dibuat pool
+        allocated: Jumlah objek yang pernah dibuat baru
+        reused: Jumlah pengambilan yang dilayani dari daftar bebas
+    """
+
+    def __init__(self, cls: Type[T]):
+        self.cls = cls
+        self.allocated = 0
+        self.reused = 0
+        self._live: List[T] = []
+        self._free_chunks: List[List[T]] = []
+
+    @property
+    def live(self) -> int:
+        """Jumlah objek yang sedang dipakai sejak recycle() terakhir."""
+        return len(self._live)
+
+    @property
+    def free(self) -> int:
+        """Jumlah objek yang siap dipakai ulang."""
+        return sum(len(chunk) for chunk in self._free_chunks)
+
+    def acquire(self, *args, **kwargs) -> T:
+        """Mengambil objek bebas (diinisialisasi ulang dengan args) atau membuat objek baru."""
+        chunks = self._free_chunks
+        while chunks and not chunks[-1]:
+            chunks.pop()
+        if chunks:
+            obj = chunks[-1].pop()
+            obj.__init__(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.allocated += 1
+        self._live.append(obj)
+        return obj
+
+    def recycle(self) -> None:
+        """Mengembalikan semua objek yang sedang dipakai ke daftar bebas dalam O(1)."""
+        if self._live:
+            self._free_chunks.append(self._live)
+            self._live = []
+
+    def trim(self) -> None:
+        """Melepas semua objek bebas agar memorinya dapat dibebaskan."""
+        self._free_chunks = []
+
+
+@contextmanager
+def gc_paused():
+    """
+    Menonaktifkan cyclic GC selama blok berjalan, lalu mengembalikan state sebelumnya.
+    GC bersifat global untuk seluruh process, termasuk thread lain.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
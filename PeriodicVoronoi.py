@@ -0,0 +1,203 @@
+"""
+Diagram Voronoi periodik (toroidal) pada domain Rectangle.
+
+Pada domain periodik, site di dekat satu sisi juga bertetangga dengan site di sisi
+seberangnya. Alih-alih menyalin seluruh site 3x3 kali, modul ini hanya menyalin
+site yang berada dalam pita selebar band di sekitar domain (ghost site), menghitung
+diagram domain + band, lalu mengambil cell milik n site asli.
+
+Kriteria benar sama dengan ViewportVoronoi: cell site s eksak jika lingkaran
+keamanan setiap vertex-nya (berpusat di vertex p, radius |p - s|) berada di dalam
+domain + band, karena di area itu semua salinan periodik sudah ada. Jika belum,
+band diperbesar dan perhitungan diulang. Salinan hanya diambil dari 8 tetangga
+3x3; pita per sumbu dibatasi lebar/tinggi domain, dan pada band max(w, h) hasilnya
+sama dengan tiling 3x3 penuh (eksak, karena salinan s di (±w, ±h) membatasi cell s
+pada kotak s ± (w/2, h/2)). Biaya terburuk dengan demikian sama dengan tiling 3x3.
+
+Tetangga lintas batas dinyatakan sebagai (j, kx, ky): cell i bersebelahan dengan
+salinan cell j yang digeser sejauh (kx * w, ky * h).
+"""
+
+from dataclasses import dataclass, field
+from math import ceil, floor, sqrt
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+from ViewportVoronoi import Polygon, clip_polygon, required_halo
+
+Neighbour = Tuple[int, int, int]
+
+
+def wrap_sites(sites, domain: Rectangle) -> np.ndarray:
+    """
+    Memetakan site ke dalam domain [x, x + w) x [y, y + h) dan membuang duplikat.
+
+    Returns:
+        Array (n, 2) site unik dengan urutan kemunculan pertama
+    """
+    if isinstance(sites, np.ndarray):
+        coords = np.asarray(sites, dtype=np.float64).reshape(-1, 2)
+    else:
+        coords = np.array([(s.x, s.y) for s in sites], dtype=np.float64).reshape(-1, 2)
+    origin = np.array([domain.x, domain.y])
+    size = np.array([domain.width, domain.height])
+    coords = origin + np.mod(coords - origin, size)
+    # np.mod dapat menghasilkan tepat size karena pembulatan
+    coords = np.where(coords >= origin + size, origin, coords)
+    keys = np.ascontiguousarray(coords + 0.0).view(np.complex128).ravel()
+    _, first = np.unique(keys, return_index=True)
+    return coords[np.sort(first)]
+
+
+def band_area(domain: Rectangle, band: float) -> Rectangle:
+    """Domain yang diperluas sejauh band, dibatasi lebar dan tinggi domain per sumbu."""
+    bx, by = min(band, domain.width), min(band, domain.height)
+    return Rectangle(domain.x - bx, domain.y - by, domain.width + 2 * bx, domain.height + 2 * by)
+
+
+def ghost_sites(coords: np.ndarray, domain: Rectangle, band: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Salinan periodik site (dari 8 tetangga 3x3) yang jatuh di dalam band_area(domain, band).
+
+    Returns:
+        (koordinat ghost (g, 2), indeks site asal (g,), pergeseran (kx, ky) (g, 2))
+    """
+    w, h = domain.width, domain.height
+    area = band_area(domain, band)
+    x0, y0 = area.x, area.y
+    x1, y1 = area.x + area.width, area.y + area.height
+    parts, sources, shifts = [], [], []
+    for kx in (-1, 0, 1):
+        for ky in (-1, 0, 1):
+            if kx == 0 and ky == 0:
+                continue
+            shifted = coords + (kx * w, ky * h)
+            inside = np.flatnonzero((shifted[:, 0] >= x0) & (shifted[:, 0] <= x1) &
+                                    (shifted[:, 1] >= y0) & (shifted[:, 1] <= y1))
+            parts.append(shifted[inside])
+            sources.append(inside)
+            shifts.append(np.tile((kx, ky), (len(inside), 1)))
+    return np.concatenate(parts), np.concatenate(sources), np.concatenate(shifts).astype(np.int64)
+
+
+@dataclass
+class PeriodicResult:
+    """
+    Hasil compute_periodic.
+
+    Attributes:
+        domain: Domain periodik
+        sites: Array (n, 2) site setelah dibungkus ke domain dan diduplikasi
+        polygons: Poligon CCW cell setiap site, tidak dibungkus (dapat melewati tepi domain)
+        neighbours: Untuk setiap cell, list (j, kx, ky) salinan cell tetangga
+        band: Lebar pita ghost site pada putaran terakhir
+        ghost_count: Jumlah ghost site pada putaran terakhir
+        rounds: Jumlah perhitungan yang dijalankan
+        diagram: Diagram domain + band dari putaran terakhir (site asli dan ghost)
+    """
+    domain: Rectangle
+    sites: np.ndarray
+    polygons: List[Polygon] = field(default_factory=list)
+    neighbours: List[List[Neighbour]] = field(default_factory=list)
+    band: float = 0.0
+    ghost_count: int = 0
+    rounds: int = 0
+    diagram: Optional[Diagram] = None
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def adjacency(self, i: int) -> List[int]:
+        """Indeks cell tetangga cell i (tanpa pergeseran), terurut dan unik."""
+        return sorted({j for j, _, _ in self.neighbours[i]})
+
+    def pieces(self, i: int) -> List[Polygon]:
+        """Potongan cell i di dalam domain setelah dibungkus (untuk digambar)."""
+        polygon = self.polygons[i]
+        if not polygon:
+            return []
+        xs = [x for x, _ in polygon]
+        ys = [y for _, y in polygon]
+        w, h = self.domain.width, self.domain.height
+        x0, y0 = self.domain.x, self.domain.y
+        result = []
+        # Semua pergeseran yang mungkin membuat poligon bertumpang tindih dengan domain
+        for kx in range(int(floor((x0 - max(xs)) / w)), int(ceil((x0 + w - min(xs)) / w)) + 1):
+            for ky in range(int(floor((y0 - max(ys)) / h)), int(ceil((y0 + h - min(ys)) / h)) + 1):
+                piece = clip_polygon([(x + kx * w, y + ky * h) for x, y in polygon], self.domain)
+                if piece:
+                    result.append(piece)
+        return result
+
+
+def compute_periodic(sites, domain: Rectangle, initial_band: Optional[float] = None,
+                     growth: float = 1.25, max_rounds: int = 16) -> PeriodicResult:
+    """
+    Menghitung diagram Voronoi periodik dengan ghost site seminimal mungkin.
+
+    Args:
+        sites: Site atau array (n, 2); site di luar domain dibungkus ke dalamnya
+        domain: Domain periodik
+        initial_band: Lebar pita awal; None memakai tiga kali jarak rata-rata antar site
+        growth: Faktor pengali band yang dibutuhkan untuk putaran berikutnya
+        max_rounds: Batas jumlah putaran sebelum band maksimum dipakai
+
+    Returns:
+        PeriodicResult dengan tepat satu cell untuk setiap site unik
+    """
+    if domain.width <= 0 or domain.height <= 0:
+        raise ValueError("domain periodik harus memiliki lebar dan tinggi positif")
+    coords = wrap_sites(sites, domain)
+    n = len(coords)
+    w, h = domain.width, domain.height
+    # Band yang sama dengan tiling 3x3 penuh (lihat docstring modul)
+    full_band = max(w, h)
+    if initial_band is None:
+        initial_band = 3 * sqrt(w * h / max(1, n))
+    band = min(initial_band, full_band)
+    rounds = 0
+
+    while True:
+        rounds += 1
+        if rounds >= max_rounds:
+            band = full_band
+        ghosts, sources, shifts = ghost_sites(coords, domain, band)
+        # Kunci (x, y) -> (indeks asal, kx, ky); site asli memakai pergeseran (0, 0)
+        owner = {(x, y): (i, 0, 0) for i, (x, y) in enumerate(coords.tolist())}
+        for (x, y), i, (kx, ky) in zip(ghosts.tolist(), sources.tolist(), shifts.tolist()):
+            owner[(x, y)] = (i, kx, ky)
+        points = [Site(x, y) for x, y in coords.tolist()] + [Site(x, y) for x, y in ghosts.tolist()]
+
+        area = band_area(domain, band)
+        diagram = Diagram()
+        FortunesAlgo().compute(points, diagram, area)
+
+        polygons: List[Polygon] = [[] for _ in range(n)]
+        neighbours: List[List[Neighbour]] = [[] for _ in range(n)]
+        needed = 0.0
+        for cell in diagram.cells:
+            i, kx, ky = owner[(cell.site.x, cell.site.y)]
+            if kx or ky:
+                continue
+            ring = [(v.x, v.y) for v in cell.hull_vertices_ccw()]
+            if len(ring) < 3:
+                needed = full_band
+                continue
+            polygons[i] = ring
+            needed = max(needed, required_halo((cell.site.x, cell.site.y), ring, domain))
+            seen = set()
+            for other in cell.neighbours():
+                key = owner[(other.site.x, other.site.y)]
+                if key not in seen:
+                    seen.add(key)
+                    neighbours[i].append(key)
+
+        # Pita per sumbu dibatasi ukuran domain, jadi site lengkap sejauh min(band, w, h)
+        if needed <= min(band, w, h) or band >= full_band:
+            return PeriodicResult(domain, coords, polygons, neighbours, band, len(ghosts), rounds, diagram)
+        band = min(max(needed, band) * growth, full_band)
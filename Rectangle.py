@@ -116,6 +116,32 @@ class Rectangle:
             height=source_rect.height + 2 * padding
         )
     
+    @classmethod
+    def bounding(cls, points: List['Site'], padding: float = 20.0) -> 'Rectangle':
+        """
+        Membuat persegi panjang terkecil yang memuat semua titik, ditambah padding.
+        
+        Args:
+            points: Titik-titik yang harus dimuat; jika kosong, kotak di sekitar (0, 0)
+            padding: Jarak tambahan ke setiap sisi
+            
+        Returns:
+            Instance Rectangle pembatas
+        """
+        if points:
+            min_x = min(p.x for p in points)
+            min_y = min(p.y for p in points)
+            max_x = max(p.x for p in points)
+            max_y = max(p.y for p in points)
+        else:
+            min_x = max_x = min_y = max_y = 0.0
+        return cls(
+            x=min_x - padding,
+            y=min_y - padding,
+            width=max_x - min_x + 2 * padding,
+            height=max_y - min_y + 2 * padding
+        )
+    
     def contains(self, point: Optional['Site']) -> bool:
         """
         Memeriksa apakah suatu titik berada di dalam persegi panjang.
@@ -0,0 +1,380 @@
+"""
+Loader titik (site) dalam jumlah besar untuk diagram Voronoi.
+
+Seluruh file di-parse sekaligus menjadi array koordinat kontigu berukuran (n, 2)
+alih-alih membuat objek Point per baris. Format yang didukung:
+- text: satu titik per baris, "x y" atau "x,y"
+- f64: biner mentah little-endian float64, pasangan x, y berurutan
+- i32: biner mentah little-endian int32, pasangan x, y berurutan
+Semua format boleh dikompresi dengan gzip (dideteksi dari magic bytes).
+
+NumPy hanya diimpor oleh fungsi yang membutuhkannya. load_site_list mem-parse
+input teks kecil tanpa NumPy, sehingga runner per-request (voronoi_cli) tidak
+menanggung biaya impor NumPy untuk input biasa.
+"""
+
+import gzip
+import os
+import re
+import warnings
+from math import isfinite
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Sequence, Tuple, Union
+
+from Site import Site
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FORMATS = ("auto", "text", "f64", "i32")
+
+# Dtype untuk setiap format biner
+BINARY_DTYPES = {
+    "f64": "<f8",
+    "i32": "<i4",
+}
+
+# Input teks sampai ukuran ini di-parse tanpa NumPy oleh load_site_list
+SMALL_TEXT_BYTES = 1 << 20
+
+# Ekstensi file yang dikenali saat format "auto"
+EXTENSION_FORMATS = {
+    ".f64": "f64",
+    ".bin": "f64",
+    ".i32": "i32",
+}
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Token angka yang diterima np.fromstring(sep=" "); dipakai kedua parser teks agar
+# hasilnya tidak bergantung pada ukuran input (float() juga menerima "1_000")
+_FLOAT_TOKEN = re.compile(
+    rb"[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan(?:\([0-9a-z_]*\))?)", re.I
+)
+
+
+def detect_format(name: str) -> str:
+    """
+    Menentukan format dari nama file berdasarkan ekstensinya.
+    Ekstensi .gz diabaikan karena kompresi dideteksi dari isi file.
+
+    Args:
+        name: Nama atau path file
+
+    Returns:
+        Nama format ("text", "f64", atau "i32")
+    """
+    root, ext = os.path.splitext(name.lower())
+    if ext == ".gz":
+        ext = os.path.splitext(root)[1]
+    return EXTENSION_FORMATS.get(ext, "text")
+
+
+def _invalid_line(data: bytes, line_index: int) -> ValueError:
+    """Membuat ValueError untuk baris ke-line_index (0-based) dari data."""
+    lines = data.split(b"\n")
+    line = lines[line_index].strip() if line_index < len(lines) else b""
+    return ValueError(
+        f"baris {line_index + 1} tidak valid: {line.decode('utf-8', 'replace')!r}"
+    )
+
+
+def _parse_pair(tokens: Sequence[bytes]) -> Optional[Tuple[float, float]]:
+    """Koordinat finite dari token satu baris, atau None jika baris tidak valid."""
+    if len(tokens) != 2 or not (_FLOAT_TOKEN.fullmatch(tokens[0]) and _FLOAT_TOKEN.fullmatch(tokens[1])):
+        return None
+    try:
+        x, y = float(tokens[0]), float(tokens[1])
+    except ValueError:  # "nan(...)" tidak diterima float(), tetapi memang tidak finite
+        return None
+    return (x, y) if isfinite(x) and isfinite(y) else None
+
+
+def drop_invalid_lines(data: bytes) -> Tuple[bytes, int]:
+    """
+    Menghapus baris teks yang akan ditolak parse_text / parse_text_sites.
+
+    Args:
+        data: Isi file teks dalam bentuk bytes
+
+    Returns:
+        Tuple (data tanpa baris tidak valid, jumlah baris yang dilewati)
+    """
+    kept = []
+    skipped = 0
+    for line in data.split(b"\n"):
+        tokens = line.replace(b",", b" ").split()
+        if tokens and _parse_pair(tokens) is None:
+            skipped += 1
+        else:
+            kept.append(line)
+    return (data if not skipped else b"\n".join(kept)), skipped
+
+
+def parse_text_sites(data: bytes, dedupe: bool = True) -> List[Site]:
+    """
+    Mem-parse teks "x y" / "x,y" per baris langsung menjadi list Site tanpa NumPy.
+
+    Aturannya sama dengan parse_text; dipakai untuk input kecil yang tidak
+    sebanding dengan biaya impor NumPy.
+
+    Args:
+        data: Isi file dalam bentuk bytes
+        dedupe: Menghapus titik duplikat (urutan kemunculan pertama dipertahankan)
+
+    Returns:
+        List Site
+
+    Raises:
+        ValueError: Jika ada baris yang tidak valid, beserta nomor barisnya
+    """
+    sites = []
+    seen = set()
+    for line_index, line in enumerate(data.replace(b",", b" ").split(b"\n")):
+        tokens = line.split()
+        if not tokens:
+            continue
+        pair = _parse_pair(tokens)
+        if pair is None:
+            raise _invalid_line(data, line_index)
+        x, y = pair
+        if dedupe:
+            # 0.0 dan -0.0 sama sebagai key dict
+            if (x, y) in seen:
+                continue
+            seen.add((x, y))
+        sites.append(Site(x, y))
+    return sites
+
+
+def _text_error(data: bytes) -> ValueError:
+    """
+    Error untuk data yang ditolak parse_text, dengan baris yang sama seperti
+    parse_text_sites. Hanya dipanggil di jalur error, jadi loop Python tidak masalah.
+    """
+    try:
+        parse_text_sites(data, dedupe=False)
+    except ValueError as e:
+        return e
+    return ValueError("data teks tidak dapat dibaca sampai akhir")
+
+
+def parse_text(data: bytes) -> "np.ndarray":
+    """
+    Mem-parse teks "x y" / "x,y" per baris menjadi array (n, 2) float64.
+
+    Jumlah token per baris divalidasi secara vektor: setiap baris yang tidak kosong
+    harus berisi tepat dua token. Baris kosong dilewati. Input yang diterima dan
+    error yang dilaporkan sama dengan parse_text_sites.
+
+    Args:
+        data: Isi file dalam bentuk bytes
+
+    Returns:
+        Array koordinat berukuran (n, 2)
+
+    Raises:
+        ValueError: Jika ada baris yang tidak valid, beserta nomor barisnya
+    """
+    import numpy as np
+
+    if not data:
+        return np.empty((0, 2), dtype=np.float64)
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Whitespace ASCII (seperti bytes.split) dan koma dianggap pemisah token
+    is_sep = ((buf >= ord("\t")) & (buf <= ord("\r"))) | (buf == ord(" ")) | (buf == ord(","))
+
+    # Posisi awal setiap token, lalu jumlah token di antara dua newline
+    starts = ~is_sep
+    starts[1:] &= is_sep[:-1]
+    token_pos = np.flatnonzero(starts)
+    if not token_pos.size:
+        return np.empty((0, 2), dtype=np.float64)
+    newline_pos = np.flatnonzero(buf == ord("\n"))
+    line_ends = np.searchsorted(token_pos, newline_pos)
+    tokens_per_line = np.diff(line_ends, prepend=0, append=token_pos.size)
+    if np.any((tokens_per_line != 0) & (tokens_per_line != 2)):
+        raise _text_error(data)
+
+    try:
+        with warnings.catch_warnings():
+            # fromstring hanya memberi DeprecationWarning untuk data yang tidak terbaca
+            warnings.simplefilter("error")
+            values = np.fromstring(data.replace(b",", b" "), dtype=np.float64, sep=" ")
+    except (ValueError, DeprecationWarning):
+        values = None
+    if values is None or values.size != token_pos.size:
+        raise _text_error(data)
+
+    coords = values.reshape(-1, 2)
+    if not np.isfinite(coords).all():
+        raise _text_error(data)
+    return coords
+
+
+def parse_binary(data: bytes, fmt: str) -> "np.ndarray":
+    """
+    Mem-parse data biner mentah (pasangan x, y berurutan) menjadi array (n, 2) float64.
+
+    Args:
+        data: Isi file dalam bentuk bytes
+        fmt: Format biner ("f64" atau "i32")
+
+    Returns:
+        Array koordinat berukuran (n, 2)
+
+    Raises:
+        ValueError: Jika ukuran data bukan kelipatan ukuran satu titik
+                    atau ada koordinat yang tidak finite
+    """
+    import numpy as np
+
+    dtype = np.dtype(BINARY_DTYPES[fmt])
+    record_size = 2 * dtype.itemsize
+    if len(data) % record_size:
+        raise ValueError(
+            f"ukuran data {len(data)} byte bukan kelipatan {record_size} byte (format {fmt})"
+        )
+    coords = np.frombuffer(data, dtype=dtype).reshape(-1, 2).astype(np.float64)
+    not_finite = np.flatnonzero(~np.isfinite(coords).all(axis=1))
+    if not_finite.size:
+        raise ValueError(f"titik ke-{not_finite[0] + 1} tidak valid: {coords[not_finite[0]].tolist()}")
+    return coords
+
+
+def unique_sites(coords: "np.ndarray") -> "np.ndarray":
+    """
+    Menghapus titik duplikat secara vektor dengan mempertahankan urutan kemunculan pertama.
+
+    Args:
+        coords: Array koordinat berukuran (n, 2)
+
+    Returns:
+        Array koordinat tanpa duplikat
+    """
+    import numpy as np
+
+    if len(coords) < 2:
+        return coords
+    # Tambah 0.0 agar -0.0 dan 0.0 dianggap sama, lalu pandang setiap baris sebagai satu complex
+    keys = np.ascontiguousarray(coords + 0.0).view(np.complex128).ravel()
+    _, first_index = np.unique(keys, return_index=True)
+    if len(first_index) == len(coords):
+        return coords
+    first_index.sort()
+    return coords[first_index]
+
+
+def _read(source: Union[str, os.PathLike, BinaryIO], fmt: str):
+    """Membaca seluruh source (gzip didekompresi) dan menentukan format-nya."""
+    if fmt not in FORMATS:
+        raise ValueError(f"format tidak dikenal: {fmt}")
+
+    if isinstance(source, (str, os.PathLike)):
+        name = os.fspath(source)
+        with open(name, "rb") as file:
+            data = file.read()
+    else:
+        name = getattr(source, "name", "")
+        data = source.read()
+    if fmt == "auto":
+        fmt = detect_format(name if isinstance(name, str) else "")
+
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return data, fmt
+
+
+def _parse(data: bytes, fmt: str, dedupe: bool) -> "np.ndarray":
+    import numpy as np
+
+    if fmt == "text":
+        coords = parse_text(data)
+    else:
+        coords = parse_binary(data, fmt)
+
+    if dedupe:
+        coords = unique_sites(coords)
+    return np.ascontiguousarray(coords)
+
+
+def load_sites(source: Union[str, os.PathLike, BinaryIO], fmt: str = "auto",
+               dedupe: bool = True) -> "np.ndarray":
+    """
+    Memuat titik-titik dari file atau stream biner secara bulk.
+
+    Args:
+        source: Path file atau objek file yang dibuka dalam mode biner
+        fmt: Format input (lihat FORMATS); "auto" menebak dari ekstensi file
+        dedupe: Menghapus titik duplikat jika True
+
+    Returns:
+        Array koordinat kontigu berukuran (n, 2) bertipe float64
+
+    Raises:
+        ValueError: Jika format tidak dikenal atau data tidak valid
+    """
+    data, fmt = _read(source, fmt)
+    return _parse(data, fmt, dedupe)
+
+
+def load_sites_lenient(source: Union[str, os.PathLike, BinaryIO], fmt: str = "auto",
+                       dedupe: bool = True) -> Tuple["np.ndarray", int]:
+    """
+    Seperti load_sites, tetapi baris teks yang tidak valid dilewati alih-alih menolak
+    seluruh file. Data biner yang tidak valid tetap menimbulkan ValueError.
+
+    Args:
+        source: Path file atau objek file yang dibuka dalam mode biner
+        fmt: Format input (lihat FORMATS); "auto" menebak dari ekstensi file
+        dedupe: Menghapus titik duplikat jika True
+
+    Returns:
+        Tuple (array koordinat (n, 2), jumlah baris teks yang dilewati)
+
+    Raises:
+        ValueError: Jika format tidak dikenal atau data biner tidak valid
+    """
+    data, fmt = _read(source, fmt)
+    skipped = 0
+    if fmt == "text":
+        data, skipped = drop_invalid_lines(data)
+    return _parse(data, fmt, dedupe), skipped
+
+
+def load_site_list(source: Union[str, os.PathLike, BinaryIO], fmt: str = "auto",
+                   dedupe: bool = True) -> List[Site]:
+    """
+    Memuat titik-titik sebagai list Site.
+
+    Input teks sampai SMALL_TEXT_BYTES di-parse tanpa NumPy; input biner dan
+    teks yang lebih besar memakai parser vektor load_sites.
+
+    Args:
+        source: Path file atau objek file yang dibuka dalam mode biner
+        fmt: Format input (lihat FORMATS); "auto" menebak dari ekstensi file
+        dedupe: Menghapus titik duplikat jika True
+
+    Returns:
+        List Site
+
+    Raises:
+        ValueError: Jika format tidak dikenal atau data tidak valid
+    """
+    data, fmt = _read(source, fmt)
+    if fmt == "text" and len(data) <= SMALL_TEXT_BYTES:
+        return parse_text_sites(data, dedupe)
+    return to_sites(_parse(data, fmt, dedupe))
+
+
+def to_sites(coords: "np.ndarray") -> List[Site]:
+    """
+    Mengkonversi array koordinat (n, 2) menjadi list Site untuk FortunesAlgo.
+
+    Args:
+        coords: Array koordinat berukuran (n, 2)
+
+    Returns:
+        List Site dengan urutan yang sama dengan array
+    """
+    return list(map(Site, coords[:, 0].tolist(), coords[:, 1].tolist()))
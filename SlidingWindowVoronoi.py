@@ -0,0 +1,428 @@
+"""
+Diagram Voronoi online untuk site yang kedaluwarsa setelah jendela waktu tetap.
+
+Domain dibagi menjadi tile grid. Setiap tile menyimpan potongan cell di dalamnya
+yang dihitung dengan compute_viewport (ViewportVoronoi) atas indeks site dinamis,
+beserta "area pengaruh" tile: viewport + halo yang membuktikan potongan itu eksak.
+Menyisipkan atau menghapus site p hanya dapat mengubah potongan yang lingkaran
+keamanannya memuat p, sehingga cukup menandai kotor tile yang area pengaruhnya
+memuat p; tile lain dipakai ulang apa adanya. Tile kotor dihitung ulang saat
+snapshot diminta.
+
+Ukuran tile mengikuti jumlah site (sekitar sites_per_tile site per tile) dan
+grid disusun ulang setiap kali jumlah site berubah dua kali lipat, sehingga biaya
+per update teramortisasi tidak bergantung pada ukuran jendela.
+
+Contoh:
+    window = SlidingWindowVoronoi(Rectangle(0, 0, 1000, 1000), window=60.0)
+    for t, x, y in reports:
+        window.insert(x, y, t)
+    snapshot = window.snapshot()
+    site = snapshot.locate(500, 500)
+
+Pemeriksaan cepat (locate dibandingkan dengan site terdekat brute force):
+    python SlidingWindowVoronoi.py
+"""
+
+import sys
+from collections import deque
+from dataclasses import dataclass
+from math import ceil, sqrt
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from Rectangle import Rectangle
+from ViewportVoronoi import compute_viewport, expand
+
+# (x site, y site, vertex potongan cell di dalam tile)
+Piece = Tuple[float, float, Tuple[Tuple[float, float], ...]]
+
+
+class DynamicSiteIndex:
+    """
+    Indeks grid site yang mendukung penambahan dan penghapusan.
+
+    Antarmukanya sama dengan SiteIndex (coords, bounds, query) sehingga dapat
+    dipakai compute_viewport. Indeks yang dikembalikan query adalah slot di coords;
+    slot yang sudah dihapus dipakai ulang oleh penambahan berikutnya.
+
+    Attributes:
+        coords: Array (kapasitas, 2) koordinat per slot
+        bounds: Rectangle domain; semua site berada di dalamnya
+    """
+
+    def __init__(self, bounds: Rectangle, nx: int = 1, ny: int = 1):
+        self.bounds = bounds
+        self.coords = np.empty((64, 2), dtype=np.float64)
+        self._alive: Set[int] = set()
+        self._free: List[int] = []
+        self._used = 0
+        self._buckets: Dict[Tuple[int, int], Set[int]] = {}
+        self.set_grid(nx, ny)
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def set_grid(self, nx: int, ny: int) -> None:
+        """Mengganti ukuran grid bucket dan memasukkan ulang semua site."""
+        self.nx, self.ny = nx, ny
+        self._scale_x = nx / self.bounds.width if self.bounds.width > 0 else 0.0
+        self._scale_y = ny / self.bounds.height if self.bounds.height > 0 else 0.0
+        self._buckets = {}
+        for slot in self._alive:
+            self._buckets.setdefault(self._bucket_of(*self.coords[slot]), set()).add(slot)
+
+    def _bucket_of(self, x: float, y: float) -> Tuple[int, int]:
+        ix = min(self.nx - 1, max(0, int((x - self.bounds.x) * self._scale_x)))
+        iy = min(self.ny - 1, max(0, int((y - self.bounds.y) * self._scale_y)))
+        return ix, iy
+
+    def add(self, x: float, y: float) -> int:
+        """Menambahkan site dan mengembalikan slot-nya."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self._used
+            self._used += 1
+            if slot >= len(self.coords):
+                self.coords = np.concatenate((self.coords, np.empty_like(self.coords)))
+        self.coords[slot] = (x, y)
+        self._alive.add(slot)
+        self._buckets.setdefault(self._bucket_of(x, y), set()).add(slot)
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Menghapus site pada slot."""
+        key = self._bucket_of(*self.coords[slot])
+        bucket = self._buckets[key]
+        bucket.discard(slot)
+        if not bucket:
+            del self._buckets[key]
+        self._alive.discard(slot)
+        self._free.append(slot)
+
+    def query(self, rect: Rectangle) -> np.ndarray:
+        """Slot site yang berada di dalam rect (tepi termasuk)."""
+        x0, y0 = self._bucket_of(rect.x, rect.y)
+        x1, y1 = self._bucket_of(rect.x + rect.width, rect.y + rect.height)
+        slots = []
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                bucket = self._buckets.get((ix, iy))
+                if bucket:
+                    slots.extend(bucket)
+        if not slots:
+            return np.empty(0, dtype=np.int64)
+        slots = np.array(slots, dtype=np.int64)
+        c = self.coords[slots]
+        inside = ((c[:, 0] >= rect.x) & (c[:, 0] <= rect.x + rect.width) &
+                  (c[:, 1] >= rect.y) & (c[:, 1] <= rect.y + rect.height))
+        return np.sort(slots[inside])
+
+
+def _contains(polygon: Tuple[Tuple[float, float], ...], x: float, y: float) -> bool:
+    """
+    True jika (x, y) berada di dalam poligon konveks (tepi termasuk, orientasi bebas).
+
+    Poligon degenerate (luas nol) tidak memuat titik apa pun.
+    """
+    sign = 0
+    n = len(polygon)
+    for i in range(n):
+        ax, ay = polygon[i]
+        bx, by = polygon[(i + 1) % n]
+        cross = (bx - ax) * (y - ay) - (by - ay) * (x - ax)
+        if cross > 1e-9:
+            if sign < 0:
+                return False
+            sign = 1
+        elif cross < -1e-9:
+            if sign > 0:
+                return False
+            sign = -1
+    return sign != 0
+
+
+@dataclass(frozen=True, eq=False)
+class WindowSnapshot:
+    """
+    Keadaan diagram yang immutable pada satu waktu.
+
+    Tile yang tidak berubah dipakai bersama antar snapshot, sehingga membuat
+    snapshot hanya menyalin list referensi tile.
+
+    Attributes:
+        time: Waktu terakhir yang sudah diproses
+        domain: Domain diagram
+        cols, rows: Ukuran grid tile
+        tiles: Potongan cell setiap tile (indeks row * cols + col)
+        site_count: Jumlah site unik yang aktif
+    """
+    time: float
+    domain: Rectangle
+    cols: int
+    rows: int
+    tiles: Tuple[Tuple[Piece, ...], ...]
+    site_count: int
+
+    def __iter__(self) -> Iterator[Piece]:
+        for tile in self.tiles:
+            yield from tile
+
+    def locate(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """
+        Mencari site yang cell-nya memuat (x, y).
+
+        Returns:
+            Koordinat site, atau None jika titik di luar domain atau tidak ada site aktif
+        """
+        domain = self.domain
+        if not (domain.x <= x <= domain.x + domain.width and domain.y <= y <= domain.y + domain.height):
+            return None
+        col = min(self.cols - 1, int((x - domain.x) * self.cols / domain.width))
+        row = min(self.rows - 1, int((y - domain.y) * self.rows / domain.height))
+        pieces = self.tiles[row * self.cols + col]
+        for sx, sy, polygon in pieces:
+            if _contains(polygon, x, y):
+                return sx, sy
+        if not pieces:
+            return None
+        # Titik tepat di batas dengan galat pembulatan: site terdekat di antara potongan tile
+        sx, sy, _ = min(pieces, key=lambda p: (p[0] - x) ** 2 + (p[1] - y) ** 2)
+        return sx, sy
+
+
+class SlidingWindowVoronoi:
+    """
+    Diagram Voronoi atas site yang masing-masing aktif selama window satuan waktu.
+
+    Timestamp insert() harus tidak menurun. Site di luar domain diabaikan. Beberapa
+    laporan dengan koordinat yang sama berbagi satu cell sampai laporan terakhirnya
+    kedaluwarsa.
+
+    Attributes:
+        domain: Domain diagram
+        window: Lama site aktif; site dengan timestamp t kedaluwarsa saat waktu >= t + window
+        now: Waktu terakhir yang sudah diproses
+        updates: Jumlah penyisipan dan penghapusan site unik
+        tiles_recomputed: Jumlah perhitungan ulang tile
+    """
+
+    def __init__(self, domain: Rectangle, window: float, sites_per_tile: int = 32):
+        if domain.width <= 0 or domain.height <= 0:
+            raise ValueError("domain harus memiliki lebar dan tinggi positif")
+        if window <= 0:
+            raise ValueError("window harus positif")
+        self.domain = domain
+        self.window = window
+        self.sites_per_tile = sites_per_tile
+        self.now = float("-inf")
+        self.updates = 0
+        self.tiles_recomputed = 0
+        self._reports: Deque[Tuple[float, float, float]] = deque()
+        # Koordinat -> [slot indeks, jumlah laporan aktif]
+        self._slots: Dict[Tuple[float, float], List[int]] = {}
+        self._index = DynamicSiteIndex(domain)
+        self._snapshot: Optional[WindowSnapshot] = None
+        self._layout(0)
+
+    @property
+    def site_count(self) -> int:
+        """Jumlah site unik yang aktif."""
+        return len(self._slots)
+
+    def _layout(self, count: int) -> None:
+        """Menyusun grid tile untuk kira-kira count site; semua tile menjadi kotor."""
+        tiles = max(1, ceil(count / self.sites_per_tile))
+        aspect = self.domain.width / self.domain.height
+        self.cols = max(1, int(round(sqrt(tiles * aspect))))
+        self.rows = max(1, int(ceil(tiles / self.cols)))
+        self._layout_count = max(count, self.sites_per_tile)
+        self._tile_w = self.domain.width / self.cols
+        self._tile_h = self.domain.height / self.rows
+        total = self.cols * self.rows
+        self._tiles: List[Tuple[Piece, ...]] = [()] * total
+        self._influence: List[Optional[Rectangle]] = [None] * total
+        # Tile grid -> tile yang area pengaruhnya menutupi tile grid tersebut
+        self._watchers: Dict[int, Set[int]] = {}
+        self._registered: List[List[int]] = [[] for _ in range(total)]
+        self._dirty: Set[int] = set(range(total))
+        self._index.set_grid(self.cols, self.rows)
+        self._snapshot = None
+
+    def _tile_of(self, x: float, y: float) -> int:
+        col = min(self.cols - 1, max(0, int((x - self.domain.x) / self._tile_w)))
+        row = min(self.rows - 1, max(0, int((y - self.domain.y) / self._tile_h)))
+        return row * self.cols + col
+
+    def _tile_rect(self, tile: int) -> Rectangle:
+        row, col = divmod(tile, self.cols)
+        return Rectangle(self.domain.x + col * self._tile_w, self.domain.y + row * self._tile_h,
+                         self._tile_w, self._tile_h)
+
+    def _touch(self, x: float, y: float) -> None:
+        """Menandai kotor semua tile yang potongannya dapat berubah karena site di (x, y)."""
+        tile = self._tile_of(x, y)
+        self._dirty.add(tile)
+        for watcher in self._watchers.get(tile, ()):
+            rect = self._influence[watcher]
+            if rect.x <= x <= rect.x + rect.width and rect.y <= y <= rect.y + rect.height:
+                self._dirty.add(watcher)
+        self._snapshot = None
+
+    def _add_site(self, x: float, y: float) -> None:
+        entry = self._slots.get((x, y))
+        if entry is not None:
+            entry[1] += 1
+            return
+        self._slots[(x, y)] = [self._index.add(x, y), 1]
+        self.updates += 1
+        if len(self._slots) > 2 * self._layout_count:
+            self._layout(len(self._slots))
+        else:
+            self._touch(x, y)
+
+    def _remove_site(self, x: float, y: float) -> None:
+        entry = self._slots[(x, y)]
+        entry[1] -= 1
+        if entry[1]:
+            return
+        del self._slots[(x, y)]
+        self._index.remove(entry[0])
+        self.updates += 1
+        if self._layout_count > self.sites_per_tile and len(self._slots) < self._layout_count // 4:
+            self._layout(len(self._slots))
+        else:
+            self._touch(x, y)
+
+    def advance(self, now: float) -> int:
+        """
+        Memajukan waktu dan membuang laporan yang kedaluwarsa.
+
+        Returns:
+            Jumlah laporan yang kedaluwarsa
+        """
+        if now < self.now:
+            raise ValueError(f"waktu mundur: {now} < {self.now}")
+        self.now = now
+        expired = 0
+        reports = self._reports
+        while reports and reports[0][0] + self.window <= now:
+            _, x, y = reports.popleft()
+            self._remove_site(x, y)
+            expired += 1
+        return expired
+
+    def insert(self, x: float, y: float, timestamp: float) -> bool:
+        """
+        Menambahkan laporan site pada waktu timestamp (laporan yang kedaluwarsa ikut dibuang).
+
+        Returns:
+            False jika site berada di luar domain dan diabaikan
+        """
+        self.advance(timestamp)
+        domain = self.domain
+        if not (domain.x <= x <= domain.x + domain.width and domain.y <= y <= domain.y + domain.height):
+            return False
+        x, y = float(x), float(y)
+        self._reports.append((timestamp, x, y))
+        self._add_site(x, y)
+        return True
+
+    def _recompute(self, tile: int) -> None:
+        for cell in self._registered[tile]:
+            self._watchers[cell].discard(tile)
+        rect = self._tile_rect(tile)
+        result = compute_viewport(self._index, rect)
+        self._tiles[tile] = tuple((site.x, site.y, tuple(polygon)) for site, polygon in result.polygons)
+        if result.complete or not result.polygons:
+            # Potongan bergantung pada seluruh dataset (atau belum ada site sama sekali):
+            # update di mana pun dapat mengubahnya
+            influence = self.domain
+        else:
+            influence = expand(rect, result.halo)
+        self._influence[tile] = influence
+        first = self._tile_of(influence.x, influence.y)
+        last = self._tile_of(influence.x + influence.width, influence.y + influence.height)
+        first_row, first_col = divmod(first, self.cols)
+        last_row, last_col = divmod(last, self.cols)
+        registered = [row * self.cols + col
+                      for row in range(first_row, last_row + 1) for col in range(first_col, last_col + 1)]
+        for cell in registered:
+            self._watchers.setdefault(cell, set()).add(tile)
+        self._registered[tile] = registered
+        self.tiles_recomputed += 1
+
+    def refresh(self) -> int:
+        """
+        Menghitung ulang semua tile kotor.
+
+        Returns:
+            Jumlah tile yang dihitung ulang
+        """
+        dirty, self._dirty = self._dirty, set()
+        for tile in dirty:
+            self._recompute(tile)
+        return len(dirty)
+
+    def verify(self, samples: int = 1000, seed: int = 0) -> int:
+        """
+        Membandingkan snapshot().locate dengan pencarian site terdekat brute force.
+
+        Args:
+            samples: Jumlah titik acak di dalam domain
+            seed: Seed titik acak
+
+        Returns:
+            Jumlah titik yang hasil locate-nya salah (0 jika diagram benar)
+        """
+        snapshot = self.snapshot()
+        rng = np.random.default_rng(seed)
+        domain = self.domain
+        points = rng.uniform((domain.x, domain.y), (domain.x + domain.width, domain.y + domain.height),
+                             size=(samples, 2))
+        sites = np.array(list(self._slots), dtype=np.float64).reshape(-1, 2)
+        wrong = 0
+        for x, y in points.tolist():
+            found = snapshot.locate(x, y)
+            if not len(sites):
+                wrong += found is not None
+                continue
+            nearest = np.min(np.hypot(sites[:, 0] - x, sites[:, 1] - y))
+            if found is None or abs(np.hypot(found[0] - x, found[1] - y) - nearest) > 1e-9 * (1 + nearest):
+                wrong += 1
+        return wrong
+
+    def snapshot(self) -> WindowSnapshot:
+        """Snapshot immutable keadaan saat ini; tile kotor dihitung ulang lebih dulu."""
+        if self._snapshot is None or self._dirty:
+            self.refresh()
+            self._snapshot = WindowSnapshot(self.now, self.domain, self.cols, self.rows,
+                                            tuple(self._tiles), len(self._slots))
+        return self._snapshot
+
+
+def main() -> int:
+    """Pemeriksaan cepat: site mengumpul di satu pojok dan aliran site seragam."""
+    rng = np.random.default_rng(7)
+    cases = []
+    clustered = SlidingWindowVoronoi(Rectangle(0, 0, 1000, 1000), window=10_000)
+    for t, (x, y) in enumerate(rng.uniform(0, 100, size=(1500, 2)).tolist()):
+        clustered.insert(x, y, t)
+    cases.append(("mengumpul di pojok", clustered))
+    stream = SlidingWindowVoronoi(Rectangle(0, 0, 1000, 600), window=300)
+    for t, (x, y) in enumerate(rng.uniform((0, 0), (1000, 600), size=(1200, 2)).tolist()):
+        stream.insert(x, y, t)
+    cases.append(("aliran seragam", stream))
+    failed = False
+    for name, window in cases:
+        wrong = window.verify()
+        failed = failed or wrong > 0
+        print(f"{name:>20}: {window.site_count} site, {window.cols * window.rows} tile, "
+              f"{wrong} locate salah{'  <-- GAGAL' if wrong else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Sweep streaming: cell yang sudah pasti dikeluarkan sebelum sweep selesai.
+
+Site dibaca dari iterator yang sudah terurut menurut (y, x), sehingga queue hanya
+berisi circle event dan satu site berikutnya. Cell sebuah site tidak dapat berubah
+lagi begitu arc terakhirnya hilang dari beachline: saat itu semua edge-nya sudah
+memiliki kedua ujung dan rantainya tertutup. Cell tersebut langsung dipotong
+(FortunesAlgo.finalize_cell) dan dikeluarkan lewat generator; diagram tidak
+menyimpannya, sehingga memorinya dibebaskan begitu pemanggil melepasnya. Cell yang
+masih memiliki arc (cell di convex hull) dikeluarkan setelah iterator habis.
+
+Memori puncak sebanding dengan lebar beachline (dan cell yang belum selesai),
+bukan dengan jumlah site. Karena twin disimpan sebagai weakref, half-edge cell yang
+masih aktif kehilangan twin-nya setelah cell tetangga yang sudah dikeluarkan
+dilepas; neighbours() hanya lengkap selama cell tetangga masih dirujuk.
+
+Contoh:
+    for cell in stream_cells(sorted_sites, clipping_rect):
+        write(cell.site, cell.hull_vertices_ccw())
+"""
+
+import heapq
+from typing import Dict, Iterable, Iterator, List
+
+from Beachline import Arc, Beachline
+from Diagram import Cell, Diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+
+
+class _ArcRecorder:
+    """Pengganti arc_pool Beachline yang mencatat setiap arc baru."""
+
+    def __init__(self):
+        self.created: List[Arc] = []
+
+    def acquire(self, point) -> Arc:
+        arc = Arc(point=point)
+        self.created.append(arc)
+        return arc
+
+
+class StreamingSweep(FortunesAlgo):
+    """
+    FortunesAlgo yang membaca site terurut dari iterator dan mengeluarkan cell
+    yang sudah selesai selama sweep berjalan.
+
+    Attributes:
+        emitted: Jumlah cell yang sudah dikeluarkan pada sesi terakhir
+        peak_active_cells: Jumlah maksimum cell yang belum selesai pada saat yang sama
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.emitted = 0
+        self.peak_active_cells = 0
+
+    def process_circle_event(self, event):
+        super().process_circle_event(event)
+        # Arc yang dihapus masih dapat dirujuk circle event basi di queue; putuskan
+        # rujukannya ke cell dan arc lain agar cell yang dikeluarkan dapat dibebaskan
+        arc = event.arc
+        arc.prev = arc.next = None
+        arc.left = arc.right = arc.parent = None
+        arc.cell = None
+        arc.left_half_edge = arc.right_half_edge = None
+
+    def cells(self, sites: Iterable[Site], clipping_rect: Rectangle) -> Iterator[Cell]:
+        """
+        Menjalankan sweep dan menghasilkan setiap cell begitu cell tersebut selesai.
+
+        Args:
+            sites: Site terurut menurut (y, x); site di luar clipping_rect dan
+                   duplikat berurutan dilewati
+            clipping_rect: Rectangle clipping
+
+        Yields:
+            Cell yang sudah lengkap dan terpotong
+
+        Raises:
+            ValueError: Jika site tidak terurut menurut (y, x)
+        """
+        diagram = Diagram()
+        self.begin((), clipping_rect, diagram)
+        recorder = _ArcRecorder()
+        self.beachline = Beachline(recorder)
+        self.is_terminated = False
+        self.emitted = 0
+        self.peak_active_cells = 0
+        # Cell yang belum selesai -> jumlah arc-nya di beachline
+        arc_counts: Dict[Cell, int] = {}
+
+        source = iter(sites)
+        last_key = None
+
+        def next_site():
+            nonlocal last_key
+            for site in source:
+                key = (site.y, site.x)
+                if last_key is not None and key <= last_key:
+                    if key == last_key:
+                        continue
+                    raise ValueError(f"site tidak terurut menurut (y, x): {site} setelah {last_key}")
+                last_key = key
+                if self.clipper.contains(site):
+                    return site
+            return None
+
+        site = next_site()
+        while True:
+            event = self.peek_event()
+            # Site event didahulukan pada (y, x) yang sama, seperti urutan queue FortunesAlgo
+            if site is not None and (event is None or (site.y, site.x) <= (event.point.y, event.point.x)):
+                self.process_event(self._new_event(site))
+                for arc in recorder.created:
+                    arc_counts[arc.cell] = arc_counts.get(arc.cell, 0) + 1
+                recorder.created.clear()
+                self.peak_active_cells = max(self.peak_active_cells, len(arc_counts))
+                site = next_site()
+            elif event is not None:
+                heapq.heappop(self.event_queue)
+                cell = event.arc.cell
+                self.process_event(event)
+                remaining = arc_counts[cell] - 1
+                if remaining:
+                    arc_counts[cell] = remaining
+                else:
+                    del arc_counts[cell]
+                    self.finalize_cell(cell)
+                    self.emitted += 1
+                    yield cell
+            else:
+                break
+            # Diagram hanya menampung cell dan vertex sementara; cell aktif dirujuk oleh arc
+            diagram.cells.clear()
+            diagram.vertices.clear()
+
+        if not arc_counts:
+            self.is_terminated = True
+            return
+        # Cell yang tersisa (convex hull) diselesaikan seperti biasa oleh terminate()
+        diagram.cells = list(arc_counts)
+        self.terminate()
+        remaining_cells, diagram.cells = diagram.cells, []
+        for cell in remaining_cells:
+            self.emitted += 1
+            yield cell
+
+
+def stream_cells(sites: Iterable[Site], clipping_rect: Rectangle) -> Iterator[Cell]:
+    """
+    Menghasilkan cell diagram Voronoi satu per satu dari site yang terurut menurut (y, x).
+
+    Lihat StreamingSweep.cells.
+    """
+    return StreamingSweep().cells(sites, clipping_rect)
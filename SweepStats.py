@@ -0,0 +1,136 @@
+import json
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+class SweepStats:
+    """
+    Kelas untuk mengumpulkan statistik dan waktu per fase dari sweep FortunesAlgo.
+
+    Statistik bersifat opt-in: FortunesAlgo hanya memanggil method kelas ini jika
+    atribut stats-nya di-set, sehingga overhead saat nonaktif hanya satu pengecekan None.
+    Method record_* dan on_sample dapat di-override di subclass sebagai hook.
+
+    Attributes:
+        sample_every: Interval (dalam jumlah event) pengambilan sampel beachline
+        site_events: Jumlah site event yang diproses
+        circle_events_created: Jumlah circle event yang dimasukkan ke queue
+        circle_events_cancelled: Jumlah circle event yang dibatalkan sebelum terjadi
+        circle_events_fired: Jumlah circle event yang diproses
+        false_alarms: Jumlah circle event yang diproses padahal sudah tidak dimiliki
+                      arc-nya lagi (event basi); selalu 0 selama event basi dibuang
+                      lebih dulu, nilai lain menandakan bug
+        stale_events_discarded: Jumlah circle event yang sudah dibatalkan dan dibuang
+                                saat mencapai puncak queue (lazy deletion); paling
+                                banyak circle_events_cancelled
+        queue_high_water: Ukuran maksimum event queue
+        half_edges: Jumlah half-edge yang dialokasikan
+        beachline_max_size: Jumlah arc maksimum pada beachline
+        samples: List (step, sweep_y, ukuran beachline, tinggi tree, ukuran queue)
+        site_time: Total waktu pemrosesan site event (detik)
+        circle_time: Total waktu pemrosesan circle event (detik)
+        complete_time: Waktu melengkapi arc dan cell yang belum selesai pada terminate (detik)
+        clip_time: Waktu clipping cell (detik)
+    """
+
+    def __init__(self, sample_every: int = 1024):
+        self.sample_every = sample_every
+        self.reset()
+
+    def reset(self) -> None:
+        """Mengosongkan semua counter, sampel, dan waktu."""
+        self.sites = 0
+        self.site_events = 0
+        self.circle_events_created = 0
+        self.circle_events_cancelled = 0
+        self.circle_events_fired = 0
+        self.false_alarms = 0
+        self.stale_events_discarded = 0
+        self.queue_high_water = 0
+        self.half_edges = 0
+        self.beachline_max_size = 0
+        self.samples: List[Tuple[int, float, int, int, int]] = []
+        self.site_time = 0.0
+        self.circle_time = 0.0
+        self.complete_time = 0.0
+        self.clip_time = 0.0
+        self._phase_start: Optional[float] = None
+
+    def start(self, site_count: int) -> None:
+        """Dipanggil di awal compute."""
+        self.reset()
+        self.sites = site_count
+        self.queue_high_water = site_count
+
+    def record_site_event(self, seconds: float) -> None:
+        self.site_events += 1
+        self.site_time += seconds
+
+    def record_circle_event(self, seconds: float) -> None:
+        self.circle_events_fired += 1
+        self.circle_time += seconds
+
+    def record_circle_created(self, queue_size: int) -> None:
+        self.circle_events_created += 1
+        if queue_size > self.queue_high_water:
+            self.queue_high_water = queue_size
+
+    def record_circle_cancelled(self) -> None:
+        self.circle_events_cancelled += 1
+
+    def record_false_alarm(self) -> None:
+        self.false_alarms += 1
+
+    def record_stale_discarded(self) -> None:
+        self.stale_events_discarded += 1
+
+    def record_half_edges(self, count: int) -> None:
+        self.half_edges = count
+
+    def begin_phase(self) -> None:
+        """Menandai awal fase terminate (complete atau clip)."""
+        self._phase_start = perf_counter()
+
+    def end_complete_phase(self) -> None:
+        self.complete_time += perf_counter() - self._phase_start
+
+    def end_clip_phase(self) -> None:
+        self.clip_time += perf_counter() - self._phase_start
+
+    def on_sample(self, step: int, sweep_y: float, beachline, queue_size: int) -> None:
+        """
+        Mengambil sampel ukuran dan tinggi beachline.
+        Dipanggil setiap sample_every event.
+        """
+        size = beachline.size
+        if size > self.beachline_max_size:
+            self.beachline_max_size = size
+        self.samples.append((step, sweep_y, size, beachline.height(), queue_size))
+
+    def to_dict(self) -> dict:
+        """Mengembalikan semua statistik dalam bentuk dict yang bisa di-serialize ke JSON."""
+        return {
+            "sites": self.sites,
+            "site_events": self.site_events,
+            "circle_events_created": self.circle_events_created,
+            "circle_events_cancelled": self.circle_events_cancelled,
+            "circle_events_fired": self.circle_events_fired,
+            "false_alarms": self.false_alarms,
+            "stale_events_discarded": self.stale_events_discarded,
+            "queue_high_water": self.queue_high_water,
+            "half_edges": self.half_edges,
+            "beachline_max_size": self.beachline_max_size,
+            "time": {
+                "site": self.site_time,
+                "circle": self.circle_time,
+                "complete": self.complete_time,
+                "clip": self.clip_time,
+            },
+            "samples": [
+                {"step": step, "sweep_y": y, "beachline_size": size, "tree_height": height, "queue_size": queue}
+                for step, y, size, height, queue in self.samples
+            ],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Mengekspor statistik sebagai string JSON."""
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,260 @@
+"""
+Perhitungan diagram Voronoi yang dibatasi pada sebuah viewport.
+
+FortunesAlgo membuang semua site di luar rectangle clipping, sehingga cell di tepi
+viewport salah jika hanya site di dalam viewport yang diberikan. Modul ini memilih
+site di dalam viewport yang diperluas dengan halo lewat indeks grid (SiteIndex),
+menghitung diagramnya, lalu memeriksa apakah cell yang memotong viewport sudah pasti
+stabil. Jika belum, halo diperbesar dan perhitungan diulang.
+
+Kriteria stabil: untuk cell site s, hasil perpotongan cell dengan viewport adalah
+poligon konveks. Site lain yang dapat memotong bagian ini harus berada di dalam
+salah satu lingkaran berpusat di vertex p poligon tersebut dengan radius |p - s|
+(lingkaran untuk titik lain di poligon tercakup oleh gabungan lingkaran di vertex).
+Jika semua lingkaran itu berada di dalam area yang site-nya sudah lengkap
+(viewport + halo), cell tersebut eksak di dalam viewport. Karena cell hanya bisa
+mengecil jika site ditambah, halo yang dibutuhkan dari satu putaran adalah batas
+atas untuk putaran berikutnya; biasanya cukup satu atau dua putaran.
+
+Biaya sebanding dengan jumlah site di sekitar viewport, bukan ukuran dataset.
+"""
+
+from dataclasses import dataclass, field
+from math import ceil, hypot, sqrt
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+
+Polygon = List[Tuple[float, float]]
+
+
+class SiteIndex:
+    """
+    Indeks grid seragam atas seluruh site untuk query rectangle.
+
+    Site diurutkan per bucket (layout CSR) sehingga query hanya menyentuh bucket
+    yang bertumpang tindih dengan rectangle.
+
+    Attributes:
+        coords: Array (n, 2) koordinat site tanpa duplikat
+        bounds: Rectangle pembatas semua site
+    """
+
+    def __init__(self, sites, sites_per_bucket: int = 8):
+        if isinstance(sites, np.ndarray):
+            coords = np.asarray(sites, dtype=np.float64).reshape(-1, 2)
+        else:
+            coords = np.array([(s.x, s.y) for s in sites], dtype=np.float64).reshape(-1, 2)
+        # Duplikat dibuang seperti pada FortunesAlgo.begin()
+        keys = np.ascontiguousarray(coords + 0.0).view(np.complex128).ravel()
+        _, first = np.unique(keys, return_index=True)
+        self.coords = coords[np.sort(first)] if len(coords) else coords
+
+        n = len(self.coords)
+        if n:
+            low, high = self.coords.min(axis=0), self.coords.max(axis=0)
+        else:
+            low = high = np.zeros(2)
+        self.bounds = Rectangle(float(low[0]), float(low[1]), float(high[0] - low[0]), float(high[1] - low[1]))
+
+        span = np.maximum(high - low, 1e-12)
+        buckets = max(1, n // sites_per_bucket)
+        # Bucket kira-kira persegi
+        self.nx = max(1, int(round(sqrt(buckets * span[0] / span[1]))))
+        self.ny = max(1, int(ceil(buckets / self.nx)))
+        self._low = low
+        self._scale = np.array([self.nx, self.ny]) / span
+
+        ix, iy = self._bucket_of(self.coords)
+        bucket = iy * self.nx + ix
+        order = np.argsort(bucket, kind="stable")
+        self._order = order
+        self._starts = np.searchsorted(bucket[order], np.arange(self.nx * self.ny + 1))
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def _bucket_of(self, coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cell = np.floor((coords - self._low) * self._scale).astype(np.int64)
+        return np.clip(cell[:, 0], 0, self.nx - 1), np.clip(cell[:, 1], 0, self.ny - 1)
+
+    def query(self, rect: Rectangle) -> np.ndarray:
+        """Indeks site yang berada di dalam rect (tepi termasuk)."""
+        if not len(self.coords):
+            return np.empty(0, dtype=np.int64)
+        corners = np.array([[rect.x, rect.y], [rect.x + rect.width, rect.y + rect.height]])
+        (x0, x1), (y0, y1) = self._bucket_of(corners)
+        parts = []
+        for iy in range(y0, y1 + 1):
+            row = iy * self.nx
+            parts.append(self._order[self._starts[row + x0]:self._starts[row + x1 + 1]])
+        candidates = np.concatenate(parts)
+        c = self.coords[candidates]
+        inside = ((c[:, 0] >= rect.x) & (c[:, 0] <= rect.x + rect.width) &
+                  (c[:, 1] >= rect.y) & (c[:, 1] <= rect.y + rect.height))
+        return np.sort(candidates[inside])
+
+
+def expand(rect: Rectangle, margin: float) -> Rectangle:
+    """Rectangle yang diperluas sejauh margin ke setiap sisi."""
+    return Rectangle(rect.x - margin, rect.y - margin, rect.width + 2 * margin, rect.height + 2 * margin)
+
+
+def union(a: Rectangle, b: Rectangle) -> Rectangle:
+    """Rectangle terkecil yang memuat a dan b."""
+    x0, y0 = min(a.x, b.x), min(a.y, b.y)
+    x1 = max(a.x + a.width, b.x + b.width)
+    y1 = max(a.y + a.height, b.y + b.height)
+    return Rectangle(x0, y0, x1 - x0, y1 - y0)
+
+
+def contains_rect(outer: Rectangle, inner: Rectangle) -> bool:
+    """True jika inner seluruhnya berada di dalam outer."""
+    return (outer.x <= inner.x and outer.y <= inner.y and
+            inner.x + inner.width <= outer.x + outer.width and
+            inner.y + inner.height <= outer.y + outer.height)
+
+
+def clip_polygon(polygon: Sequence[Tuple[float, float]], rect: Rectangle) -> Polygon:
+    """
+    Memotong poligon konveks dengan rectangle (Sutherland-Hodgman).
+
+    Returns:
+        Vertex hasil potongan; list kosong jika tidak berpotongan
+    """
+    x0, y0 = rect.x, rect.y
+    x1, y1 = rect.x + rect.width, rect.y + rect.height
+    # (koordinat, batas, True jika sisi dalam adalah >= batas)
+    planes = ((0, x0, True), (0, x1, False), (1, y0, True), (1, y1, False))
+    result = list(polygon)
+    for axis, bound, keep_greater in planes:
+        if not result:
+            break
+        source, result = result, []
+        prev = source[-1]
+        prev_in = prev[axis] >= bound if keep_greater else prev[axis] <= bound
+        for point in source:
+            point_in = point[axis] >= bound if keep_greater else point[axis] <= bound
+            if point_in != prev_in:
+                t = (bound - prev[axis]) / (point[axis] - prev[axis])
+                crossing = [prev[0] + t * (point[0] - prev[0]), prev[1] + t * (point[1] - prev[1])]
+                crossing[axis] = bound
+                result.append((crossing[0], crossing[1]))
+            if point_in:
+                result.append(point)
+            prev, prev_in = point, point_in
+    return result if len(result) >= 3 else []
+
+
+def required_halo(site: Tuple[float, float], polygon: Polygon, viewport: Rectangle) -> float:
+    """
+    Halo minimum agar lingkaran keamanan semua vertex poligon (bagian cell di dalam
+    viewport) berada di dalam viewport + halo.
+    """
+    sx, sy = site
+    x0, y0 = viewport.x, viewport.y
+    x1, y1 = viewport.x + viewport.width, viewport.y + viewport.height
+    halo = 0.0
+    for px, py in polygon:
+        r = hypot(px - sx, py - sy)
+        halo = max(halo, r - min(px - x0, x1 - px, py - y0, y1 - py))
+    return halo
+
+
+@dataclass
+class ViewportResult:
+    """
+    Hasil compute_viewport.
+
+    Attributes:
+        diagram: Diagram untuk semua site di viewport + halo; cell yang memotong
+                 viewport eksak di dalam viewport
+        polygons: List (site, poligon cell dipotong ke viewport) untuk setiap cell yang memotong viewport
+        viewport: Rectangle viewport
+        halo: Halo yang dipakai pada putaran terakhir
+        rounds: Jumlah perhitungan yang dijalankan
+        site_count: Jumlah site yang dipakai pada putaran terakhir
+        complete: True jika semua site dataset ikut dihitung (hasil eksak tanpa perlu kriteria halo)
+    """
+    diagram: Diagram
+    polygons: List[Tuple[Site, Polygon]] = field(default_factory=list)
+    viewport: Optional[Rectangle] = None
+    halo: float = 0.0
+    rounds: int = 0
+    site_count: int = 0
+    complete: bool = False
+
+
+def compute_viewport(index: SiteIndex, viewport: Rectangle, initial_halo: Optional[float] = None,
+                     growth: float = 1.25, max_rounds: int = 16) -> ViewportResult:
+    """
+    Menghitung diagram Voronoi yang eksak di dalam viewport dengan site seminimal mungkin.
+
+    Args:
+        index: SiteIndex atas seluruh dataset
+        viewport: Area yang ingin ditampilkan
+        initial_halo: Halo awal; None memakai dua kali jarak rata-rata antar site di viewport
+        growth: Faktor pengali halo yang dibutuhkan untuk putaran berikutnya
+        max_rounds: Batas jumlah putaran sebelum seluruh dataset dipakai
+
+    Returns:
+        ViewportResult
+    """
+    if initial_halo is None:
+        count = max(1, len(index.query(viewport)))
+        initial_halo = 2 * sqrt(max(viewport.width * viewport.height, 1e-12) / count)
+    halo = initial_halo
+    data_bounds = index.bounds
+    # Halo yang membuat viewport + halo memuat seluruh dataset
+    cover_halo = max(0.0, viewport.x - data_bounds.x, viewport.y - data_bounds.y,
+                     data_bounds.x + data_bounds.width - viewport.x - viewport.width,
+                     data_bounds.y + data_bounds.height - viewport.y - viewport.height)
+    rounds = 0
+
+    while True:
+        rounds += 1
+        area = expand(viewport, halo)
+        complete = contains_rect(area, data_bounds)
+        if not complete and rounds >= max_rounds:
+            # Putaran terakhir: pakai seluruh dataset
+            area = union(area, data_bounds)
+            complete = True
+
+        selected = index.query(area)
+        if not len(selected) and len(index) and not complete:
+            # Tanpa site di area ini belum ada yang terbukti; perbesar halo tanpa menghitung
+            halo = min(halo * 2, cover_halo) if halo > 0 else cover_halo
+            continue
+        sites = [Site(x, y) for x, y in index.coords[selected].tolist()]
+        diagram = Diagram()
+        FortunesAlgo().compute(sites, diagram, area)
+
+        polygons: List[Tuple[Site, Polygon]] = []
+        needed = 0.0
+        if len(diagram.cells) == 1:
+            cell = diagram.cells[0]
+            corners = [(viewport.x, viewport.y), (viewport.x + viewport.width, viewport.y),
+                       (viewport.x + viewport.width, viewport.y + viewport.height),
+                       (viewport.x, viewport.y + viewport.height)]
+            polygons.append((cell.site, corners))
+            needed = required_halo((cell.site.x, cell.site.y), corners, viewport)
+        else:
+            for cell in diagram.cells:
+                ring = [(v.x, v.y) for v in cell.hull_vertices_ccw()]
+                if len(ring) < 3:
+                    # Cell degenerate (misalnya site segaris) tidak bisa dibuktikan stabil
+                    needed = max(needed, cover_halo)
+                    continue
+                polygon = clip_polygon(ring, viewport)
+                if polygon:
+                    polygons.append((cell.site, polygon))
+                    needed = max(needed, required_halo((cell.site.x, cell.site.y), polygon, viewport))
+
+        if complete or needed <= halo:
+            return ViewportResult(diagram, polygons, viewport, halo, rounds, len(sites), complete)
+        halo = max(needed, halo) * growth
@@ -10,12 +10,13 @@
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from FortunesAlgo import FortunesAlgo
 from Diagram import Diagram
 from Rectangle import Rectangle
 from Circle import Point
-from Constant import eps
-from scipy.spatial import KDTree
+from SiteLoader import load_sites_lenient, to_sites
+from ComputeWorker import ComputeWorker
+from DiagramCache import DiagramCache
+from DiagramRenderer import DiagramRenderer
 
 class MainWindow:
     """
@@ -27,11 +28,21 @@ class MainWindow:
     - Memvisualisasikan diagram Voronoi dengan sel dan vertex
     - Menemukan dan menampilkan lingkaran kosong terbesar di antara titik-titik
     
+    Perhitungan diagram dijalankan di ComputeWorker agar window tetap responsif;
+    thread UI hanya mengirim job, memeriksa hasil secara berkala, dan menggambar.
+    
     Atribut:
         RADIUS (int): Radius titik yang digambar pada canvas (dalam piksel)
+        DEBOUNCE_MS (int): Jeda setelah klik terakhir sebelum perhitungan dimulai
+        POLL_MS (int): Interval pemeriksaan hasil dari worker
+        PREVIEW_MIN_POINTS (int): Jumlah titik minimum untuk menampilkan pratinjau raster
+                                  selama diagram eksak dihitung
     """
     
     RADIUS = 3
+    DEBOUNCE_MS = 150
+    POLL_MS = 30
+    PREVIEW_MIN_POINTS = 2000
 
     def __init__(self, master):
         self.master = master
@@ -53,9 +64,14 @@ class MainWindow:
         self.btnClear = tk.Button(self.frmButtons, text="Clear All", command=self.clear_canvas)
         self.btnClear.pack(side=tk.LEFT, padx=5, pady=5)
         
+        # Label status perhitungan
+        self.lblStatus = tk.Label(self.frmButtons, text="", anchor=tk.W)
+        self.lblStatus.pack(side=tk.LEFT, padx=5, pady=5)
+        
         # Membuat canvas utama untuk menggambar
         self.canvas = tk.Canvas(self.frmMain, width=1440, height=720, bg="white")
         self.canvas.pack()
+        self.renderer = DiagramRenderer(self.canvas, 1440, 720, site_radius=self.RADIUS)
         
         # Menghubungkan klik kiri mouse dengan pembuatan titik
         self.canvas.bind('<Button-1>', self.on_click)
@@ -64,42 +80,55 @@ class MainWindow:
         self.points = []  # Daftar titik untuk akses berurutan
         self.diagram = Diagram()  # Struktur diagram Voronoi
         self.clipping_rect = Rectangle(0, 0, 1440, 720)  # Area pembatas diagram
-        self.sweep = FortunesAlgo()  # Algoritma Fortune's sweep line untuk membuat diagram Voronoi
+        self.largest_empty_circles = []  # List (x, y, radius) dari hasil perhitungan terakhir
+        
+        # Worker thread untuk algoritma Fortune's sweep line; diagram yang pernah
+        # dihitung (misalnya file yang dimuat ulang) diambil dari cache
+        self.worker = ComputeWorker(cache=DiagramCache(max_bytes=128 * 1024 * 1024))
+        self._debounce_id = None  # Id callback after() untuk debounce klik
+        self._poll_id = None      # Id callback after() untuk memeriksa hasil worker
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        """Menghentikan worker lalu menutup window."""
+        self.worker.shutdown(timeout=1.0)
+        self.master.destroy()
 
     def clear_canvas(self):
         """Membersihkan semua titik dan mereset canvas."""
+        self._cancel_debounce()
+        self.worker.cancel()
         self.points = []
+        self.diagram = Diagram()
+        self.largest_empty_circles = []
+        self.renderer.clear()
         self.canvas.delete(tk.ALL)
+        self.lblStatus.config(text="")
 
     def load_points(self):
         """
         Memuat titik-titik dari file teks.
-        Format file yang diharapkan: setiap baris berisi koordinat x,y atau x y
+        Format file yang diharapkan: setiap baris berisi koordinat x,y atau x y,
+        atau file biner mentah float64 (.f64/.bin) / int32 (.i32), boleh dikompresi gzip.
+        Baris teks yang tidak valid dilewati dan jumlahnya dilaporkan; titik duplikat
+        tetap dimuat (FortunesAlgo mengabaikannya)
         """
         try:
             filename = filedialog.askopenfilename(
-                filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+                filetypes=[("Text Files", "*.txt"), ("Binary Files", "*.f64 *.bin *.i32"),
+                           ("Gzip Files", "*.gz"), ("All Files", "*.*")]
             )
             if not filename:  # Pengguna membatalkan
                 return
                 
-            with open(filename, 'r') as file:
-                # Membersihkan titik-titik yang ada
-                self.points = []
-                
-                # Membaca titik-titik dari file
-                for line in file:
-                    try:
-                        # Format yang diharapkan: "x,y" atau "x y"
-                        coords = line.strip().replace(',', ' ').split()
-                        if len(coords) == 2:
-                            x, y = map(float, coords)
-                            point = Point(x, y)
-                            self.points.append(point)
-                    except ValueError:
-                        print(f"Melewati baris yang tidak valid: {line.strip()}")
+            # Memuat semua titik sekaligus (teks, biner, atau gzip)
+            coords, skipped = load_sites_lenient(filename, dedupe=False)
+            self.points = to_sites(coords)
+            if skipped:
+                messagebox.showwarning("Peringatan", f"Melewati {skipped} baris yang tidak valid")
                 
-            # Memperbarui diagram
+            # Memperbarui diagram di background
+            self._cancel_debounce()
             self.update_voronoi_diagram()
             
         except Exception as e:
@@ -108,92 +137,81 @@ class MainWindow:
     def on_click(self, event):
         """
         Menangani event klik mouse pada canvas.
-        Menambahkan titik baru dan memperbarui diagram Voronoi.
+        Menambahkan titik baru, langsung menggambarnya, dan menjadwalkan
+        perhitungan ulang setelah DEBOUNCE_MS tanpa klik baru.
         
         Args:
             event: Event klik mouse
         """
         point = Point(event.x, event.y)
         self.points.append(point)
-        self.update_voronoi_diagram()
+        self.renderer.add_point(point)
+        self._cancel_debounce()
+        self._debounce_id = self.master.after(self.DEBOUNCE_MS, self.update_voronoi_diagram)
+
+    def _cancel_debounce(self):
+        """Membatalkan perhitungan ulang yang sudah dijadwalkan oleh klik sebelumnya."""
+        if self._debounce_id is not None:
+            self.master.after_cancel(self._debounce_id)
+            self._debounce_id = None
 
     def update_voronoi_diagram(self):
         """
-        Memperbarui diagram Voronoi berdasarkan titik-titik yang ada.
-        Mencetak informasi sel dan vertex ke konsol.
+        Mengirim titik-titik yang ada ke worker untuk dihitung ulang.
+        Perhitungan yang masih berjalan dibatalkan dan digantikan oleh yang baru.
         """
+        self._debounce_id = None
         if self.points:  # Hanya memperbarui jika ada titik
-            self.diagram.clear()
-            sites = set(self.points)
-            self.sweep.compute(sites, self.diagram, self.clipping_rect)
-            self.draw_voronoi()
+            preview_size = (1440, 720) if len(self.points) >= self.PREVIEW_MIN_POINTS else None
+            self.worker.submit(self.points, self.clipping_rect, preview_size)
+            self.lblStatus.config(text=f"Menghitung {len(self.points)} titik...")
+            if self._poll_id is None:
+                self._poll_id = self.master.after(self.POLL_MS, self.poll_worker)
+
+    def poll_worker(self):
+        """
+        Memeriksa hasil dari worker di thread UI.
+        Menggambar diagram jika hasil sudah ada, atau menjadwalkan pemeriksaan berikutnya.
+        """
+        self._poll_id = None
+        result = self.worker.poll()
+        if result is not None:
+            if result.error is not None:
+                self.lblStatus.config(text="")
+                messagebox.showerror("Error", f"Gagal menghitung diagram: {result.error}")
+            elif result.is_preview:
+                self.renderer.render_preview(result.preview, result.preview_scale, self.points)
+                self.lblStatus.config(
+                    text=f"Pratinjau {len(result.points)} titik ({result.compute_time:.2f} detik), "
+                         f"menghitung diagram eksak..."
+                )
+            else:
+                self.diagram = result.diagram
+                self.largest_empty_circles = result.largest_empty_circles
+                mode = self.draw_voronoi()
+                self.lblStatus.config(
+                    text=f"{len(result.points)} titik, {len(self.diagram.vertices)} vertex "
+                         f"({result.compute_time:.2f} detik, render {mode})"
+                )
+        if self.worker.busy:
+            self._poll_id = self.master.after(self.POLL_MS, self.poll_worker)
 
     def draw_voronoi(self):
         """
-        Menggambar diagram Voronoi pada canvas.
+        Menggambar diagram Voronoi pada canvas lewat DiagramRenderer.
         Termasuk:
         - Sel-sel Voronoi (garis biru)
         - Titik-titik input (lingkaran hitam)
         - Vertex-vertex diagram (titik merah)
         - Lingkaran kosong terbesar (garis oranye)
-        """
-        self.canvas.delete(tk.ALL)
-        
-        # Menggambar sel-sel Voronoi
-        for cell in self.diagram.cells:
-            if cell.outer_component:
-                he = cell.outer_component
-                points = []
-                while True:
-                    if he.origin:
-                        points.append((he.origin.x, he.origin.y))
-                    he = he.next
-                    if he == cell.outer_component or he is None:
-                        break
-                if points:
-                    self.canvas.create_polygon(points, outline="blue", fill="", tags="voronoi")
         
-        # Menggambar titik-titik input
-        for point in self.points:
-            self.canvas.create_oval(point.x - self.RADIUS, point.y - self.RADIUS, 
-                                  point.x + self.RADIUS, point.y + self.RADIUS, fill="black")
+        Hanya item yang berubah yang dibuat ulang; jika item terlalu banyak,
+        sel, titik, dan vertex digambar sebagai satu gambar raster.
         
-        # Mempersiapkan KD-Tree untuk pencarian titik terdekat
-        site_coords = [(point.x, point.y) for point in self.points]
-        tree = KDTree(site_coords)
-
-        # Menggambar vertex-vertex
-        for vertex in self.diagram.vertices:
-            # print(vertex.x, vertex.y)
-            self.canvas.create_oval(vertex.x - 1.5, vertex.y - 1.5, 
-                                  vertex.x + 1.5, vertex.y + 1.5, fill="red", outline="red", tags="vertex")
-
-        # Mencari dan menggambar lingkaran kosong terbesar
-        centers = []
-        radiuses = []
-        max_radius = -1
-        for vertex in self.diagram.vertices:
-            vx, vy = vertex.x, vertex.y
-            
-            # Mencari 5 titik terdekat untuk setiap vertex
-            distances, indices = tree.query((vx, vy), k=5)  
-            
-            radius = distances[0]
-            close_sites = [(site_coords[i][0], site_coords[i][1]) for i, d in zip(indices, distances) if abs(d - radius) < eps]
-
-            if len(close_sites) >= 3:
-                centers.append((vx, vy))
-                radiuses.append(radius)
-                max_radius = max(radius, max_radius)
-
-        # Menggambar lingkaran kosong terbesar
-        for i in range(len(centers)):
-            radius = radiuses[i]
-            if radius == max_radius:
-                vx = centers[i][0]
-                vy = centers[i][1]
-                self.canvas.create_oval(vx - radius, vy - radius, vx + radius, vy + radius,
-                                     outline="orange", tags="largest_empty_circle")
+        Returns:
+            str: Mode render yang dipakai ("vector" atau "raster")
+        """
+        return self.renderer.render(self.diagram, self.points, self.largest_empty_circles)
             
 def main():
     """Fungsi utama untuk menjalankan aplikasi."""
@@ -0,0 +1,299 @@
+"""
+Graf ketetanggaan dari dual diagram Voronoi (triangulasi Delaunay).
+
+Dua site bertetangga Delaunay jika cell Voronoi-nya berbagi edge, sehingga
+ketetanggaan cell (Cell.neighbours) sudah memuat semua kandidat edge untuk graf
+berikut, yang semuanya subgraf Delaunay:
+
+    nearest neighbour  ⊂  MST Euclidean  ⊂  RNG  ⊂  Gabriel  ⊂  Delaunay
+
+Graf dinyatakan sebagai array indeks yang ringkas: edges adalah array (m, 2)
+int64 dengan i < j per baris, terurut, dan indeks site mengikuti urutan
+diagram.cells. Dengan m = O(n), setiap builder berjalan dalam O(n log n).
+
+Edge Delaunay di convex hull yang edge Voronoi-nya seluruhnya berada di luar
+clipping rectangle tidak ikut terbaca. Graf turunannya tetap eksak: edge Gabriel
+(dan semua subgrafnya) memotong edge Voronoi-nya di titik tengah segmen site,
+yang selalu berada di dalam convex hull site.
+
+Contoh:
+    sites, edges = delaunay_from_sites(points)
+    tree = euclidean_mst(sites, edges)
+    nearest = nearest_neighbours(sites, edges)
+"""
+
+import heapq
+from typing import List, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+
+
+def _edge_keys(edges: np.ndarray, n: int) -> np.ndarray:
+    return edges[:, 0] * n + edges[:, 1]
+
+
+def delaunay_edges(diagram: Diagram) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Membaca edge Delaunay dari ketetanggaan cell diagram yang sudah selesai.
+
+    Args:
+        diagram: Diagram hasil FortunesAlgo
+
+    Returns:
+        (sites (n, 2) urut diagram.cells, edges (m, 2) int64 dengan i < j, terurut)
+    """
+    diagram.finalize_all()
+    cells = diagram.cells
+    cell_index = {id(cell): i for i, cell in enumerate(cells)}
+    pairs = []
+    for i, cell in enumerate(cells):
+        for neighbour in cell.neighbours():
+            j = cell_index.get(id(neighbour))
+            if j is not None and i < j:
+                pairs.append((i, j))
+    sites = np.array([(cell.site.x, cell.site.y) for cell in cells], dtype=np.float64).reshape(-1, 2)
+    edges = np.unique(np.array(pairs, dtype=np.int64).reshape(-1, 2), axis=0)
+    return sites, edges
+
+
+def delaunay_from_sites(points, padding: float = 20.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Menghitung diagram untuk points lalu membaca edge Delaunay-nya.
+
+    Args:
+        points: Site atau pasangan (x, y); duplikat digabung
+        padding: Jarak clipping rectangle ke kotak pembatas site
+
+    Returns:
+        (sites, edges) seperti delaunay_edges
+    """
+    sites = [p if isinstance(p, Site) else Site(float(p[0]), float(p[1])) for p in points]
+    diagram = Diagram()
+    if sites:
+        FortunesAlgo().compute(sites, diagram, Rectangle.bounding(sites, padding))
+    return delaunay_edges(diagram)
+
+
+def edge_lengths(sites: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Panjang Euclidean setiap edge, array (m,)."""
+    delta = sites[edges[:, 1]] - sites[edges[:, 0]]
+    return np.hypot(delta[:, 0], delta[:, 1])
+
+
+def adjacency(n: int, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ketetanggaan tak berarah dalam layout CSR.
+
+    Returns:
+        (offsets (n + 1,), indices): tetangga site i adalah indices[offsets[i]:offsets[i + 1]], terurut
+    """
+    heads = np.concatenate((edges[:, 0], edges[:, 1]))
+    tails = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.lexsort((tails, heads))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=n), out=offsets[1:])
+    return offsets, tails[order]
+
+
+def _common_neighbours(n: int, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pasangan (edge e, site k) dengan k tetangga kedua ujung edge e (apex segitiga Delaunay).
+
+    Returns:
+        (indeks edge, indeks site k), keduanya array dengan panjang sama
+    """
+    offsets, indices = adjacency(n, edges)
+    degree = np.diff(offsets)
+    first = edges[:, 0]
+    counts = degree[first]
+    edge_ids = np.repeat(np.arange(len(edges)), counts)
+    # Posisi setiap tetangga site pertama di indices
+    starts = np.repeat(offsets[first], counts)
+    local = np.arange(len(edge_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+    k = indices[starts + local]
+    other = edges[edge_ids, 1]
+    candidate = np.stack((np.minimum(k, other), np.maximum(k, other)), axis=1)
+    keys = _edge_keys(edges, n)
+    probe = _edge_keys(candidate, n)
+    position = np.minimum(np.searchsorted(keys, probe), len(keys) - 1)
+    is_edge = (keys[position] == probe) & (k != other)
+    return edge_ids[is_edge], k[is_edge]
+
+
+def gabriel_graph(sites: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Graf Gabriel: edge ij tanpa site lain di dalam lingkaran berdiameter ij.
+
+    Pada edge Delaunay, lingkaran itu kosong jika dan hanya jika kedua apex
+    segitiganya kosong, jadi cukup menguji tetangga bersama kedua ujung edge.
+
+    Returns:
+        Array (g, 2) edge Gabriel, subset terurut dari edges
+    """
+    if not len(edges):
+        return edges
+    edge_ids, k = _common_neighbours(len(sites), edges)
+    a = sites[edges[edge_ids, 0]] - sites[k]
+    b = sites[edges[edge_ids, 1]] - sites[k]
+    # k di dalam lingkaran berdiameter ij jika sudut ikj tumpul
+    inside = np.einsum("ij,ij->i", a, b) < 0
+    keep = np.ones(len(edges), dtype=bool)
+    keep[edge_ids[inside]] = False
+    return edges[keep]
+
+
+def relative_neighbourhood_graph(sites: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Relative neighbourhood graph: edge ij tanpa site k dengan max(|ik|, |jk|) < |ij|.
+
+    Kandidat diambil dari graf Gabriel (RNG ⊂ Gabriel). Tetangga Delaunay kedua
+    ujung edge diuji lebih dulu secara vektor; site di dalam lune tidak selalu
+    bertetangga Delaunay dengan i atau j, jadi edge yang lolos diuji eksak dengan
+    pencarian best-first dari i di graf Delaunay, yang hanya mengunjungi site yang
+    lebih dekat ke i daripada j.
+
+    Returns:
+        Array (r, 2) edge RNG, subset terurut dari edges
+    """
+    gabriel = gabriel_graph(sites, edges)
+    if not len(gabriel):
+        return gabriel
+    offsets, indices = adjacency(len(sites), edges)
+    delta = sites[gabriel[:, 1]] - sites[gabriel[:, 0]]
+    length2 = np.einsum("ij,ij->i", delta, delta)
+    keep = np.ones(len(gabriel), dtype=bool)
+    for end in (0, 1):
+        heads = gabriel[:, end]
+        counts = np.diff(offsets)[heads]
+        edge_ids = np.repeat(np.arange(len(gabriel)), counts)
+        local = np.arange(len(edge_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        k = indices[np.repeat(offsets[heads], counts) + local]
+        di = sites[k] - sites[gabriel[edge_ids, 0]]
+        dj = sites[k] - sites[gabriel[edge_ids, 1]]
+        bound = length2[edge_ids]
+        # Ujung edge sendiri (k = i atau k = j) bukan penghalang
+        in_lune = ((np.einsum("ij,ij->i", di, di) < bound) & (np.einsum("ij,ij->i", dj, dj) < bound) &
+                   (k != gabriel[edge_ids, 1 - end]))
+        keep[edge_ids[in_lune]] = False
+
+    # Uji eksak: site di lune ij lebih dekat ke i daripada j, dan best-first di graf
+    # Delaunay mengunjungi site menurut jarak ke i (lihat k_nearest_neighbours)
+    candidates = np.flatnonzero(keep)
+    offsets, indices = offsets.tolist(), indices.tolist()
+    xs, ys = sites[:, 0].tolist(), sites[:, 1].tolist()
+    by_site = {}
+    for e in candidates.tolist():
+        by_site.setdefault(int(gabriel[e, 0]), []).append(e)
+    for i, group in by_site.items():
+        x, y = xs[i], ys[i]
+        group.sort(key=lambda e: length2[e])
+        seen = {i}
+        heap: List[Tuple[float, int]] = [(0.0, i)]
+        visited: List[int] = []
+        for e in group:
+            j = int(gabriel[e, 1])
+            bound = (xs[j] - x) ** 2 + (ys[j] - y) ** 2
+            while heap and heap[0][0] < bound:
+                _, current = heapq.heappop(heap)
+                if current != i:
+                    visited.append(current)
+                for other in indices[offsets[current]:offsets[current + 1]]:
+                    if other not in seen:
+                        seen.add(other)
+                        heapq.heappush(heap, ((xs[other] - x) ** 2 + (ys[other] - y) ** 2, other))
+            xj, yj = xs[j], ys[j]
+            for k in visited:
+                if k != j and (xs[k] - xj) ** 2 + (ys[k] - yj) ** 2 < bound:
+                    keep[e] = False
+                    break
+    return gabriel[keep]
+
+
+def euclidean_mst(sites: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Minimum spanning tree Euclidean dengan Kruskal atas edge Delaunay.
+
+    Returns:
+        Array (n - c, 2) edge pohon (c = jumlah komponen), urut menurut panjang
+    """
+    parent = list(range(len(sites)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    order = np.argsort(edge_lengths(sites, edges), kind="stable") if len(edges) else []
+    tree = []
+    for e in order:
+        i, j = edges[e]
+        ri, rj = find(int(i)), find(int(j))
+        if ri != rj:
+            parent[ri] = rj
+            tree.append(e)
+            if len(tree) == len(sites) - 1:
+                break
+    return edges[np.array(tree, dtype=np.int64)].reshape(-1, 2)
+
+
+def nearest_neighbours(sites: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Nearest neighbour setiap site; selalu tetangga Delaunay-nya.
+
+    Returns:
+        Array (n,) indeks site terdekat, -1 untuk site tanpa tetangga
+    """
+    nearest = np.full(len(sites), -1, dtype=np.int64)
+    if not len(edges):
+        return nearest
+    lengths = edge_lengths(sites, edges)
+    heads = np.concatenate((edges[:, 0], edges[:, 1]))
+    tails = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.lexsort((tails, np.tile(lengths, 2), heads))
+    heads, tails = heads[order], tails[order]
+    first = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]])
+    nearest[heads[first]] = tails[first]
+    return nearest
+
+
+def k_nearest_neighbours(sites: np.ndarray, edges: np.ndarray, k: int) -> np.ndarray:
+    """
+    k nearest neighbour setiap site dengan pencarian best-first di graf Delaunay.
+
+    Tetangga terdekat ke-(m + 1) selalu bertetangga Delaunay dengan site itu sendiri
+    atau salah satu dari m tetangga terdekatnya, jadi pencarian hanya mengunjungi
+    O(k) site per site.
+
+    Returns:
+        Array (n, k) indeks terurut menurut jarak; -1 jika site kurang dari k + 1
+    """
+    n = len(sites)
+    result = np.full((n, k), -1, dtype=np.int64)
+    if k <= 0 or not len(edges):
+        return result
+    offsets, indices = adjacency(n, edges)
+    offsets, indices = offsets.tolist(), indices.tolist()
+    xs, ys = sites[:, 0].tolist(), sites[:, 1].tolist()
+    for i in range(n):
+        x, y = xs[i], ys[i]
+        seen = {i}
+        heap: List[Tuple[float, int]] = []
+        found = []
+        current = i
+        while True:
+            for j in indices[offsets[current]:offsets[current + 1]]:
+                if j not in seen:
+                    seen.add(j)
+                    heapq.heappush(heap, ((xs[j] - x) ** 2 + (ys[j] - y) ** 2, j))
+            if not heap or len(found) == k:
+                break
+            _, current = heapq.heappop(heap)
+            found.append(current)
+        result[i, :len(found)] = found
+    return result
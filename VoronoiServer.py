@@ -0,0 +1,584 @@
+"""
+Service HTTP lokal untuk menghitung diagram Voronoi dengan worker process yang tetap hidup.
+
+Endpoint:
+    POST /compute?format=f64|i32|text&clip=X,Y,W,H&padding=P&timeout=DETIK
+        Body berisi titik dalam format SiteLoader (boleh gzip). Tanpa clip, rectangle
+        clipping adalah bounding box titik ditambah padding. Respons 200 berisi diagram
+        dalam encoding biner DCEL (DiagramCache.encode_diagram) yang dikirim per potongan.
+        Kode error: 400 input tidak valid, 503 antrean penuh (backpressure, dengan
+        header Retry-After), 504 melewati timeout, 500 error lain.
+    GET /stats
+        Counter dan histogram latensi dalam JSON.
+    GET /health
+        "ok" jika service berjalan.
+
+Request kecil (paling banyak batch_max_sites titik) dikumpulkan selama batch_window
+detik dan dikirim ke satu worker sebagai satu batch sehingga overhead IPC per request
+berkurang; request besar langsung dikirim sendiri. Timeout ditegakkan secara kooperatif
+di worker di antara potongan event sweep, sehingga request yang kedaluwarsa tidak
+menahan worker. Jika satu worker process mati (misalnya dibunuh OOM killer), hanya batch
+yang sedang berjalan yang gagal; pool diganti dengan pool baru untuk request berikutnya.
+
+Contoh:
+    python VoronoiServer.py --port 8765 --workers 4
+    curl --data-binary @titik.f64 "http://127.0.0.1:8765/compute?format=f64" -o diagram.vdc
+"""
+
+import argparse
+import gzip
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from bisect import bisect_left
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from DiagramCache import decode_diagram, encode_diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from SiteLoader import FORMATS as INPUT_FORMATS, GZIP_MAGIC, parse_binary, parse_text, to_sites
+
+RESPONSE_CHUNK = 1 << 16
+
+# Batas atas bucket histogram latensi (detik); bucket terakhir tak terbatas
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+class ServiceOverloaded(Exception):
+    """Dilempar saat jumlah request yang sedang diproses sudah mencapai batas."""
+
+
+class RequestTimeout(Exception):
+    """Dilempar saat request melewati deadline-nya."""
+
+
+class WorkerCrashed(RuntimeError):
+    """Dilempar ke request dalam batch yang sedang berjalan saat worker process-nya mati."""
+
+
+@dataclass
+class ComputeRequest:
+    """
+    Satu request perhitungan yang dikirim ke worker process.
+
+    Attributes:
+        body: Data titik mentah (format SiteLoader, boleh gzip)
+        fmt: Format data ("text", "f64", atau "i32")
+        clip: Rectangle clipping (x, y, lebar, tinggi), atau None untuk bounding box titik
+        padding: Padding bounding box jika clip None
+        deadline: Waktu absolut (time.time()) batas request selesai, atau None
+    """
+    body: bytes
+    fmt: str
+    clip: Optional[Tuple[float, float, float, float]] = None
+    padding: float = 20.0
+    deadline: Optional[float] = None
+
+
+def parse_coords(body: bytes, fmt: str) -> np.ndarray:
+    """Mem-parse body request menjadi array koordinat (n, 2)."""
+    if body[:2] == GZIP_MAGIC:
+        body = gzip.decompress(body)
+    if fmt == "text":
+        return parse_text(body)
+    return parse_binary(body, fmt)
+
+
+def _estimate_sites(body: bytes, fmt: str) -> int:
+    """Perkiraan jumlah titik body yang tidak dikompresi: satu titik per baris untuk teks."""
+    if fmt == "text":
+        return body.count(b"\n") + (not body.endswith(b"\n"))
+    return len(body) // (16 if fmt == "f64" else 8)
+
+
+def compute_request(request: ComputeRequest, chunk_events: int = 4096) -> Tuple[bytes, float]:
+    """
+    Menghitung satu request dan mengembalikan diagram dalam encoding biner.
+
+    Returns:
+        Tuple (data diagram, waktu hitung dalam detik)
+
+    Raises:
+        ValueError: Jika data titik tidak valid
+        RequestTimeout: Jika deadline terlewati sebelum sweep selesai
+    """
+    start = time.perf_counter()
+    coords = parse_coords(request.body, request.fmt)
+    diagram = Diagram()
+    if len(coords):
+        sites = to_sites(coords)
+        if request.clip is not None:
+            clipping_rect = Rectangle(*request.clip)
+        else:
+            # Sama dengan CLI dan voronoi.compute
+            clipping_rect = Rectangle.bounding(sites, request.padding)
+        sweep = FortunesAlgo()
+        if sweep.begin(sites, clipping_rect, diagram):
+            while not sweep.advance(chunk_events):
+                if request.deadline is not None and time.time() > request.deadline:
+                    raise RequestTimeout("deadline terlewati saat sweep")
+            sweep.terminate()
+    elapsed = time.perf_counter() - start
+    return encode_diagram(diagram, elapsed), elapsed
+
+
+def _warm_worker() -> None:
+    """Initializer worker process: menjalankan sweep kecil agar modul dan cache siap."""
+    compute_request(ComputeRequest(np.array([[0, 0], [1, 2], [3, 1]], dtype="<f8").tobytes(), "f64"))
+
+
+def _compute_batch(requests: List[ComputeRequest]) -> List[Tuple[str, object]]:
+    """
+    Dijalankan di worker process. Menghitung semua request dalam batch secara berurutan.
+
+    Returns:
+        List (status, nilai) per request: ("ok", (data, waktu)), ("timeout", pesan),
+        ("invalid", pesan), atau ("error", pesan)
+    """
+    results = []
+    for request in requests:
+        if request.deadline is not None and time.time() > request.deadline:
+            results.append(("timeout", "deadline terlewati sebelum diproses"))
+            continue
+        try:
+            results.append(("ok", compute_request(request)))
+        except RequestTimeout as e:
+            results.append(("timeout", str(e)))
+        except ValueError as e:
+            results.append(("invalid", str(e)))
+        except Exception as e:
+            results.append(("error", f"{type(e).__name__}: {e}"))
+    return results
+
+
+class LatencyHistogram:
+    """
+    Histogram latensi dengan bucket tetap (LATENCY_BUCKETS), aman dipakai dari banyak thread.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets, seconds)] += 1
+            self.total += seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Batas atas bucket yang memuat persentil q (0-100), None jika kosong atau tak terbatas."""
+        with self._lock:
+            n = sum(self.counts)
+            if n == 0:
+                return None
+            rank = q / 100 * n
+            seen = 0
+            for i, c in enumerate(self.counts):
+                seen += c
+                if seen >= rank and c:
+                    return self.buckets[i] if i < len(self.buckets) else None
+            return None
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            counts = list(self.counts)
+            total = self.total
+        labels = [f"<={b:g}" for b in self.buckets] + [f">{self.buckets[-1]:g}"]
+        n = sum(counts)
+        return {
+            "count": n,
+            "mean": total / n if n else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+
+class ComputeService:
+    """
+    Pool worker process dengan batching, backpressure, dan timeout per request.
+
+    Attributes:
+        workers: Jumlah worker process
+        max_pending: Jumlah request maksimum yang boleh sedang diproses atau mengantre
+        batch_window: Lama (detik) batcher menunggu request kecil lain sebelum mengirim batch
+        batch_size: Jumlah request maksimum per batch
+        batch_max_sites: Perkiraan jumlah titik maksimum agar request dianggap kecil
+        default_timeout: Timeout request jika klien tidak memberikannya (detik, None = tanpa batas)
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 64, batch_window: float = 0.005,
+                 batch_size: int = 32, batch_max_sites: int = 2000, default_timeout: Optional[float] = 30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.batch_max_sites = batch_max_sites
+        self.default_timeout = default_timeout
+
+        self.latency = LatencyHistogram()
+        self.compute_latency = LatencyHistogram()
+        self.counters = {
+            "requests": 0, "completed": 0, "rejected": 0, "timeouts": 0,
+            "invalid": 0, "errors": 0, "batches": 0, "batched_requests": 0, "pool_restarts": 0,
+        }
+        self._pending = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._batch_queue: "queue.Queue[Optional[Tuple[ComputeRequest, Future]]]" = queue.Queue()
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+        self._batcher = threading.Thread(target=self._run_batcher, name="voronoi-batcher", daemon=True)
+        self._batcher.start()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def submit(self, request: ComputeRequest) -> Future:
+        """
+        Menjadwalkan request dan mengembalikan Future berisi (data diagram, waktu hitung).
+
+        Raises:
+            ServiceOverloaded: Jika max_pending request sudah sedang diproses
+            RuntimeError: Jika service sudah dimatikan
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("service sudah dimatikan")
+            self.counters["requests"] += 1
+            if self._pending >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise ServiceOverloaded(f"{self._pending} request sedang diproses")
+            self._pending += 1
+
+        future: Future = Future()
+        future.add_done_callback(self._release)
+        if request.body[:2] != GZIP_MAGIC and _estimate_sites(request.body, request.fmt) <= self.batch_max_sites:
+            self._batch_queue.put((request, future))
+        else:
+            self._dispatch([(request, future)])
+        return future
+
+    def compute(self, request: ComputeRequest, timeout: Optional[float] = None) -> Tuple[bytes, float]:
+        """
+        Menjalankan request secara blocking.
+
+        Raises:
+            ServiceOverloaded, RequestTimeout, ValueError, RuntimeError
+        """
+        timeout = timeout if timeout is not None else self.default_timeout
+        if timeout is not None and request.deadline is None:
+            request.deadline = time.time() + timeout
+        start = time.perf_counter()
+        future = self.submit(request)
+        try:
+            # Worker menegakkan deadline sendiri; tenggang kecil untuk IPC
+            result = future.result(None if timeout is None else timeout + 1.0)
+        except FutureTimeoutError:
+            self._count("timeouts")
+            raise RequestTimeout("request melewati timeout")
+        except RequestTimeout:
+            self._count("timeouts")
+            raise
+        except ValueError:
+            self._count("invalid")
+            raise
+        except WorkerCrashed:
+            raise  # Sudah dihitung di errors saat batch gagal
+        except Exception:
+            self._count("errors")
+            raise
+        self._count("completed")
+        self.latency.observe(time.perf_counter() - start)
+        self.compute_latency.observe(result[1])
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            pending = self._pending
+        return {
+            "workers": self.workers,
+            "pending": pending,
+            "max_pending": self.max_pending,
+            **counters,
+            "latency": self.latency.to_dict(),
+            "compute_latency": self.compute_latency.to_dict(),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._batch_queue.put(None)
+        self._batcher.join()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> Optional[ProcessPoolExecutor]:
+        """
+        Mengganti pool yang rusak karena worker process mati.
+
+        Returns:
+            Pool yang berlaku sekarang, atau None jika service sudah dimatikan
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            if self._pool is broken:
+                self._pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+                self.counters["pool_restarts"] += 1
+            pool = self._pool
+        broken.shutdown(wait=False, cancel_futures=True)
+        return pool
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _run_batcher(self) -> None:
+        """Mengumpulkan request kecil menjadi batch selama batch_window detik."""
+        while True:
+            item = self._batch_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            closing = False
+            window_end = time.perf_counter() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = window_end - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._batch_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if closing:
+                return
+
+    def _dispatch(self, batch: List[Tuple[ComputeRequest, Future]]) -> None:
+        """Mengirim batch ke pool dan meneruskan hasil per request ke Future masing-masing."""
+        self._count("batches")
+        self._count("batched_requests", len(batch))
+        requests = [request for request, _ in batch]
+        with self._lock:
+            pool = self._pool
+        try:
+            try:
+                pool_future = pool.submit(_compute_batch, requests)
+            except BrokenProcessPool:
+                # Worker mati sebelum batch ini dikirim; batch belum berjalan, jadi kirim ulang ke pool baru
+                pool = self._replace_pool(pool)
+                if pool is None:
+                    raise RuntimeError("service sudah dimatikan")
+                pool_future = pool.submit(_compute_batch, requests)
+        except RuntimeError as e:  # Pool sudah dimatikan (shutdown) atau pool baru juga rusak
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        def deliver(done: Future) -> None:
+            error = done.exception()
+            if isinstance(error, BrokenProcessPool):
+                # Hanya batch yang sedang berjalan yang gagal; request berikutnya memakai pool baru
+                self._replace_pool(pool)
+                self._count("errors", len(batch))
+                for _, future in batch:
+                    future.set_exception(WorkerCrashed(f"worker process mati: {error}"))
+                return
+            for i, (_, future) in enumerate(batch):
+                if error is not None:
+                    future.set_exception(RuntimeError(f"worker gagal: {error}"))
+                    continue
+                status, value = done.result()[i]
+                if status == "ok":
+                    future.set_result(value)
+                elif status == "timeout":
+                    future.set_exception(RequestTimeout(value))
+                elif status == "invalid":
+                    future.set_exception(ValueError(value))
+                else:
+                    future.set_exception(RuntimeError(value))
+
+        pool_future.add_done_callback(deliver)
+
+
+class VoronoiRequestHandler(BaseHTTPRequestHandler):
+    """Handler HTTP untuk ComputeService (service diambil dari server.service)."""
+
+    server_version = "VoronoiServer/1"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/plain; charset=utf-8",
+              headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        view = memoryview(body)
+        for offset in range(0, len(view), RESPONSE_CHUNK):
+            self.wfile.write(view[offset:offset + RESPONSE_CHUNK])
+
+    def do_GET(self):
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/health":
+            self._send(200, b"ok\n")
+        elif path == "/stats":
+            self._send(200, json.dumps(self.server.service.stats(), indent=1).encode(), "application/json")
+        else:
+            self._send(404, b"not found\n")
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if url.path != "/compute":
+            self._send(404, b"not found\n")
+            return
+
+        service: ComputeService = self.server.service
+        try:
+            params = dict(urllib.parse.parse_qsl(url.query))
+            fmt = params.get("format", "f64")
+            if fmt not in INPUT_FORMATS or fmt == "auto":
+                raise ValueError(f"format tidak dikenal: {fmt}")
+            clip = None
+            if "clip" in params:
+                clip = tuple(float(v) for v in params["clip"].split(","))
+                if len(clip) != 4:
+                    raise ValueError("clip harus berisi X,Y,W,H")
+            padding = float(params.get("padding", 20.0))
+            timeout = float(params["timeout"]) if "timeout" in params else None
+            data, elapsed = service.compute(ComputeRequest(body, fmt, clip, padding), timeout)
+        except ServiceOverloaded as e:
+            self._send(503, f"{e}\n".encode(), headers={"Retry-After": "1"})
+        except RequestTimeout as e:
+            self._send(504, f"{e}\n".encode())
+        except ValueError as e:
+            self._send(400, f"{e}\n".encode())
+        except Exception as e:
+            self._send(500, f"{e}\n".encode())
+        else:
+            self._send(200, data, "application/octet-stream",
+                       headers={"X-Compute-Time": f"{elapsed:.6f}"})
+
+
+class VoronoiHTTPServer(ThreadingHTTPServer):
+    """Server HTTP multi-thread; backlog diperbesar agar lonjakan koneksi ditolak dengan 503, bukan reset."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8765,
+                service: Optional[ComputeService] = None) -> VoronoiHTTPServer:
+    """Membuat server HTTP (belum dijalankan); port 0 memilih port bebas."""
+    server = VoronoiHTTPServer((host, port), VoronoiRequestHandler)
+    server.service = service if service is not None else ComputeService()
+    return server
+
+
+def compute_remote(url: str, coords: np.ndarray, clip: Optional[Tuple[float, float, float, float]] = None,
+                   timeout: Optional[float] = None) -> Diagram:
+    """
+    Klien sederhana: mengirim titik ke service dan men-decode diagram hasilnya.
+
+    Args:
+        url: Alamat dasar service, misalnya "http://127.0.0.1:8765"
+        coords: Array koordinat (n, 2)
+        clip: Rectangle clipping (x, y, lebar, tinggi), None untuk bounding box titik
+        timeout: Timeout request (detik)
+
+    Raises:
+        ServiceOverloaded, RequestTimeout, ValueError, RuntimeError sesuai kode status
+    """
+    params = {"format": "f64"}
+    if clip is not None:
+        params["clip"] = ",".join(repr(float(v)) for v in clip)
+    if timeout is not None:
+        params["timeout"] = repr(float(timeout))
+    body = np.ascontiguousarray(coords, dtype="<f8").tobytes()
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/compute?{urllib.parse.urlencode(params)}", data=body,
+        headers={"Content-Type": "application/octet-stream"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=None if timeout is None else timeout + 5.0) as response:
+            data = response.read()
+    except urllib.error.HTTPError as e:
+        message = e.read().decode(errors="replace").strip()
+        if e.code == 503:
+            raise ServiceOverloaded(message) from None
+        if e.code == 504:
+            raise RequestTimeout(message) from None
+        if e.code == 400:
+            raise ValueError(message) from None
+        raise RuntimeError(f"HTTP {e.code}: {message}") from None
+    return decode_diagram(data)[0]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Service HTTP lokal untuk perhitungan diagram Voronoi")
+    parser.add_argument("--host", default="127.0.0.1", help="Alamat bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765, 0 = bebas)")
+    parser.add_argument("--workers", type=int, help="Jumlah worker process (default: jumlah CPU)")
+    parser.add_argument("--max-pending", type=int, default=64,
+                        help="Request maksimum yang diproses sebelum request baru ditolak dengan 503")
+    parser.add_argument("--batch-window", type=float, default=0.005,
+                        help="Lama menunggu request kecil lain sebelum batch dikirim (detik)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout default per request (detik)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mencetak log setiap request")
+    args = parser.parse_args(argv)
+
+    service = ComputeService(args.workers, args.max_pending, args.batch_window, default_timeout=args.timeout)
+    server = make_server(args.host, args.port, service)
+    server.verbose = args.verbose
+    host, port = server.server_address[:2]
+    print(f"voronoi-server: mendengarkan di http://{host}:{port} dengan {service.workers} worker",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
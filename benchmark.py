@@ -0,0 +1,262 @@
+"""
+Benchmark skala end-to-end untuk FortunesAlgo.
+
+Setiap kasus (distribusi, n) menjalankan pipeline lengkap seperti CLI:
+load file titik -> sweep -> terminate/clip -> export, di proses terpisah agar
+puncak memori dan state GC tidak saling memengaruhi. Hasilnya ditambahkan ke
+history JSON, dibandingkan dengan baseline, dan eksponen skala waktu terhadap n
+di-fit per distribusi sehingga regresi kuadratik langsung terlihat.
+
+Contoh penggunaan:
+    python benchmark.py --sizes 100 1000 10000 --distributions uniform clusters
+    python benchmark.py --baseline bench_baseline.json --max-seconds 30
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, List, Optional
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_DISTRIBUTIONS = ["uniform", "clusters", "grid", "rings", "rows", "near-duplicates"]
+
+# Kotak tempat titik dibangkitkan, sama dengan ukuran canvas VoronoiApp
+BOX = (0, 1440, 0, 720)
+
+
+def run_case(distribution: str, n: int, seed: int, integer: bool, export_format: str, workdir: str) -> Dict:
+    """
+    Menjalankan satu kasus benchmark. Dipanggil di proses anak yang baru.
+
+    Returns:
+        Dict berisi waktu per fase, jumlah event, puncak memori, dan ukuran hasil
+    """
+    from Diagram import Diagram
+    from FortunesAlgo import FortunesAlgo
+    from Rectangle import Rectangle
+    from SiteLoader import load_sites, to_sites
+    from SweepStats import SweepStats
+    from input_generator import generate_points, write_points
+    from voronoi_cli import WRITERS, peak_memory_bytes
+
+    result = {"distribution": distribution, "n": n, "seed": seed, "integer": integer}
+    try:
+        path = os.path.join(workdir, f"{distribution}-{n}.txt")
+        write_points(generate_points(n, distribution, *BOX, seed=seed, integer=integer), path)
+        rss_before = peak_memory_bytes()
+
+        t_start = time.perf_counter()
+        sites = to_sites(load_sites(path))
+        t_load = time.perf_counter()
+
+        stats = SweepStats()
+        algo = FortunesAlgo(stats)
+        diagram = Diagram()
+        algo.compute(set(sites), diagram, Rectangle.bounding(sites, 20.0))
+        t_compute = time.perf_counter()
+
+        out_path = os.path.join(workdir, f"{distribution}-{n}.{export_format}")
+        with open(out_path, "w") as out:
+            WRITERS[export_format](diagram, out)
+        t_export = time.perf_counter()
+
+        terminate_s = stats.complete_time + stats.clip_time
+        sweep_s = t_compute - t_load - terminate_s
+        result.update({
+            "status": "ok",
+            "load_s": t_load - t_start,
+            "sweep_s": sweep_s,
+            "terminate_s": terminate_s,
+            "export_s": t_export - t_compute,
+            "total_s": t_export - t_start,
+            "events": algo.current_step,
+            "events_per_s": algo.current_step / sweep_s if sweep_s > 0 else None,
+            "peak_rss_bytes": peak_memory_bytes(),
+            "rss_before_bytes": rss_before,
+            "cells": len(diagram.cells),
+            "vertices": len(diagram.vertices),
+            "edges": sum(1 for _ in diagram.iter_edges()),
+            "export_bytes": os.path.getsize(out_path),
+            "stats": {k: v for k, v in stats.to_dict().items() if k != "samples"},
+        })
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    return result
+
+
+def run_isolated(*args) -> Dict:
+    """Menjalankan run_case di proses anak baru (spawn) dan menunggu hasilnya."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(run_case, *args).result()
+
+
+def fit_exponent(cases: List[Dict], key: str = "total_s") -> Optional[float]:
+    """
+    Mem-fit eksponen k pada model waktu = c * n^k dengan least squares di skala log-log.
+
+    Args:
+        cases: Kasus-kasus berstatus ok dari satu distribusi
+        key: Field waktu yang di-fit
+
+    Returns:
+        Eksponen k, atau None jika titik data kurang dari dua
+    """
+    points = [(math.log(c["n"]), math.log(c[key])) for c in cases if c.get(key, 0) > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx if sxx > 0 else None
+
+
+def compare_to_baseline(cases: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Membandingkan kasus-kasus dengan run baseline.
+
+    Returns:
+        Daftar pesan deviasi (waktu di luar toleransi atau ukuran hasil berubah)
+    """
+    reference = {(c["distribution"], c["n"]): c for c in baseline.get("cases", []) if c.get("status") == "ok"}
+    messages = []
+    for case in cases:
+        base = reference.get((case["distribution"], case["n"]))
+        if base is None or case.get("status") != "ok":
+            continue
+        ratio = case["total_s"] / base["total_s"] if base["total_s"] > 0 else float("inf")
+        label = f"{case['distribution']} n={case['n']}"
+        if ratio > 1 + tolerance:
+            messages.append(f"LEBIH LAMBAT {label}: {ratio:.2f}x baseline ({base['total_s']:.3f}s -> {case['total_s']:.3f}s)")
+        elif ratio < 1 - tolerance:
+            messages.append(f"lebih cepat {label}: {ratio:.2f}x baseline ({base['total_s']:.3f}s -> {case['total_s']:.3f}s)")
+        for key in ("cells", "vertices", "edges"):
+            if case[key] != base[key]:
+                messages.append(f"HASIL BERUBAH {label}: {key} {base[key]} -> {case[key]}")
+    return messages
+
+
+def git_revision() -> Optional[str]:
+    """Mengembalikan hash commit git saat ini, atau None jika tidak tersedia."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_run(path: str) -> Dict:
+    """Memuat satu run dari file JSON; jika file berisi history, diambil run terakhir."""
+    with open(path) as f:
+        data = json.load(f)
+    return data[-1] if isinstance(data, list) else data
+
+
+def append_history(path: str, run: Dict) -> None:
+    """Menambahkan run ke file history JSON (list of runs)."""
+    history = []
+    if os.path.exists(path):
+        with open(path) as f:
+            history = json.load(f)
+    history.append(run)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=1)
+
+
+def format_case(case: Dict) -> str:
+    label = f"{case['distribution']:>16} {case['n']:>9}"
+    if case["status"] != "ok":
+        return f"{label}  {case['status']}: {case.get('error', '')}"
+    peak = case["peak_rss_bytes"]
+    peak_str = f"{peak / (1024 * 1024):8.1f} MiB" if peak is not None else "     n/a"
+    return (
+        f"{label}  total {case['total_s']:9.3f}s  load {case['load_s']:7.3f}s  sweep {case['sweep_s']:9.3f}s  "
+        f"term {case['terminate_s']:7.3f}s  export {case['export_s']:7.3f}s  "
+        f"{case['events_per_s'] or 0:10.0f} ev/s  peak {peak_str}  "
+        f"{case['cells']} cell, {case['vertices']} vertex, {case['edges']} edge"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark skala end-to-end FortunesAlgo")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Jumlah titik per kasus (default: 100 .. 1000000)")
+    parser.add_argument("--distributions", nargs="+", default=DEFAULT_DISTRIBUTIONS,
+                        help="Distribusi titik, lihat input_generator.DISTRIBUTIONS")
+    parser.add_argument("--seed", type=int, default=12, help="Seed generator titik (default: 12)")
+    parser.add_argument("--integer", action="store_true", help="Gunakan koordinat integer seperti input GUI")
+    parser.add_argument("--export-format", choices=("json", "text"), default="json",
+                        help="Format export yang diukur (default: json)")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="Lewati ukuran lebih besar dari satu distribusi jika satu kasus melewati batas ini")
+    parser.add_argument("--history", default="bench_history.json",
+                        help="File history JSON tempat run ditambahkan (default: bench_history.json)")
+    parser.add_argument("--baseline", help="File baseline (run atau history) untuk pembanding")
+    parser.add_argument("--save-baseline", help="Simpan run ini sebagai baseline ke file ini")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Deviasi relatif waktu yang masih dianggap normal (default: 0.25)")
+    parser.add_argument("--max-exponent", type=float, default=1.5,
+                        help="Peringatkan jika eksponen skala melebihi nilai ini (default: 1.5)")
+    args = parser.parse_args(argv)
+
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "integer": args.integer,
+        "cases": [],
+        "exponents": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="voronoi-bench-") as workdir:
+        for distribution in args.distributions:
+            skip_reason = None
+            for n in sorted(args.sizes):
+                if skip_reason:
+                    case = {"distribution": distribution, "n": n, "status": "skipped", "error": skip_reason}
+                else:
+                    case = run_isolated(distribution, n, args.seed, args.integer, args.export_format, workdir)
+                    if case["status"] != "ok":
+                        skip_reason = f"kasus n={n} gagal"
+                    elif case["total_s"] > args.max_seconds:
+                        skip_reason = f"kasus n={n} melewati {args.max_seconds:g}s"
+                run["cases"].append(case)
+                print(format_case(case), flush=True)
+
+            ok_cases = [c for c in run["cases"] if c["distribution"] == distribution and c["status"] == "ok"]
+            exponent = fit_exponent(ok_cases)
+            run["exponents"][distribution] = exponent
+            if exponent is not None:
+                warning = "  <-- SUPERLINEAR" if exponent > args.max_exponent else ""
+                print(f"{distribution:>16} eksponen skala waktu ~ n^{exponent:.2f}{warning}", flush=True)
+
+    if args.baseline:
+        run["baseline_deviations"] = compare_to_baseline(run["cases"], load_run(args.baseline), args.tolerance)
+        for message in run["baseline_deviations"]:
+            print(message)
+        if not run["baseline_deviations"]:
+            print("Tidak ada deviasi terhadap baseline")
+
+    if args.history:
+        append_history(args.history, run)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(run, f, indent=1)
+
+    regressed = any(m.startswith(("LEBIH LAMBAT", "HASIL BERUBAH")) for m in run.get("baseline_deviations", []))
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
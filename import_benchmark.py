@@ -0,0 +1,101 @@
+"""
+Benchmark waktu impor (cold start) paket voronoi dan runner voronoi_cli.
+
+Setiap skenario dijalankan di interpreter baru beberapa kali; yang dilaporkan
+adalah median waktu wall clock dikurangi median interpreter kosong, ditambah
+modul berat (NumPy, SciPy, tkinter) yang ikut termuat. Skrip keluar dengan
+status 1 jika salah satu skenario melewati anggarannya atau memuat modul berat
+yang tidak seharusnya.
+
+Contoh penggunaan:
+    python import_benchmark.py
+    python import_benchmark.py --runs 21 --json import_times.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+HEAVY_MODULES = ("numpy", "scipy", "tkinter")
+
+# (nama, kode, anggaran ms di atas interpreter kosong, modul berat yang boleh termuat)
+SCENARIOS = (
+    ("import", "import voronoi", 15.0, ()),
+    ("core", "import voronoi; voronoi.Diagram; voronoi.Rectangle", 100.0, ()),
+    ("compute", "import voronoi; voronoi.compute([(0, 0), (30, 10), (10, 40)])", 150.0, ()),
+    ("snapshot", "import voronoi; voronoi.DiagramSnapshot", 500.0, ("numpy",)),
+    # Runner per-request: input teks kecil, output json, tanpa NumPy
+    ("cli", "import os, sys, voronoi_cli; "
+            "voronoi_cli.main(['input.txt', '-q', '-o', os.devnull])", 150.0, ()),
+)
+
+# Dicetak oleh setiap subprocess setelah kode skenario dijalankan
+_PROBE = "import sys; print(','.join(m for m in {heavy!r} if m in sys.modules))"
+
+
+def run_once(code: str) -> Dict:
+    """Menjalankan kode di interpreter baru; mengembalikan waktu (detik) dan modul berat yang termuat."""
+    script = f"{code}\n{_PROBE.format(heavy=HEAVY_MODULES)}" if code else "pass"
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    loaded = [m for m in result.stdout.strip().split(",") if m] if code else []
+    return {"seconds": elapsed, "heavy": loaded}
+
+
+def measure(code: str, runs: int) -> Dict:
+    """Median waktu beberapa run, plus modul berat dari run terakhir."""
+    samples = [run_once(code) for _ in range(runs)]
+    return {"seconds": statistics.median(s["seconds"] for s in samples), "heavy": samples[-1]["heavy"]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark waktu impor paket voronoi")
+    parser.add_argument("--runs", type=int, default=11, help="Run per skenario, diambil median (default: 11)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Pengali anggaran untuk mesin yang lebih lambat (default: 1.0)")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+
+    # Impor pertama menulis cache bytecode; jangan ikut diukur
+    subprocess.run([sys.executable, "-c", "import voronoi; voronoi.compute([])"],
+                   cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+
+    baseline = measure("", args.runs)["seconds"]
+    print(f"{'interpreter':>10}  {baseline * 1000:7.1f} ms")
+    results = []
+    failed = False
+    for name, code, budget_ms, allowed in SCENARIOS:
+        measured = measure(code, args.runs)
+        cost_ms = max(0.0, measured["seconds"] - baseline) * 1000
+        budget_ms *= args.budget_scale
+        unexpected = [m for m in measured["heavy"] if m not in allowed]
+        problems = []
+        if cost_ms > budget_ms:
+            problems.append(f"melewati anggaran {budget_ms:.0f} ms")
+        if unexpected:
+            problems.append("memuat " + ", ".join(unexpected))
+        failed = failed or bool(problems)
+        status = "  <-- " + "; ".join(problems) if problems else ""
+        print(f"{name:>10}  {cost_ms:+7.1f} ms  (anggaran {budget_ms:.0f} ms)  "
+              f"modul berat: {', '.join(measured['heavy']) or '-'}{status}")
+        results.append({"scenario": name, "ms": cost_ms, "budget_ms": budget_ms,
+                        "heavy": measured["heavy"], "ok": not problems})
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"interpreter_ms": baseline * 1000, "scenarios": results}, f, indent=1)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,223 @@
-import random
+import gzip
 import argparse
+import numpy as np
+from SiteLoader import BINARY_DTYPES, detect_format
 
-def generate_random_points(num_points, min_x=0, max_x=1400, min_y=0, max_y=720, filename="input.txt"):
+DISTRIBUTIONS = ("uniform", "clusters", "grid", "rings", "rows", "near-duplicates")
+
+# Distributions whose structure (co-circular rings, sub-unit offsets) does not survive
+# rounding; they are always generated with float coordinates
+FLOAT_DISTRIBUTIONS = ("rings", "near-duplicates")
+
+OUTPUT_FORMATS = ("auto", "text", "f64", "i32")
+
+
+def _sample_uniform(rng, size, min_x, max_x, min_y, max_y):
+    """Points spread uniformly over the whole box."""
+    x = rng.uniform(min_x, max_x, size)
+    y = rng.uniform(min_y, max_y, size)
+    return np.column_stack((x, y))
+
+
+def _sample_clusters(rng, size, min_x, max_x, min_y, max_y, num_clusters=16, spread=0.02):
+    """Gaussian blobs around a few random centers; most of the box stays empty."""
+    width, height = max_x - min_x, max_y - min_y
+    centers = _sample_uniform(rng, num_clusters, min_x, max_x, min_y, max_y)
+    points = centers[rng.integers(0, num_clusters, size)]
+    points = points + rng.normal(0.0, 1.0, (size, 2)) * (spread * width, spread * height)
+    np.clip(points[:, 0], min_x, max_x, out=points[:, 0])
+    np.clip(points[:, 1], min_y, max_y, out=points[:, 1])
+    return points
+
+
+def _sample_rings(rng, size, min_x, max_x, min_y, max_y, points_per_ring=64):
+    """
+    Concentric circles with evenly spaced points, so many quadruples are co-circular.
+    Every call places a fresh set of rings with random radii around the box center.
+    """
+    num_rings = max(1, -(-size // points_per_ring))
+    cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+    max_radius = min(max_x - min_x, max_y - min_y) / 2
+    radii = rng.uniform(0.05, 1.0, num_rings) * max_radius
+    angles = np.arange(points_per_ring) * (2 * np.pi / points_per_ring)
+    x = (cx + radii[:, None] * np.cos(angles)).ravel()
+    y = (cy + radii[:, None] * np.sin(angles)).ravel()
+    return np.column_stack((x, y))[:size]
+
+
+def _sample_rows(rng, size, min_x, max_x, min_y, max_y, num_lines=32):
+    """Half the points share a few rows (same y), the other half a few columns (same x)."""
+    rows = rng.uniform(min_y, max_y, num_lines)
+    cols = rng.uniform(min_x, max_x, num_lines)
+    half = size // 2
+    on_rows = np.column_stack((rng.uniform(min_x, max_x, half), rows[rng.integers(0, num_lines, half)]))
+    on_cols = np.column_stack((cols[rng.integers(0, num_lines, size - half)], rng.uniform(min_y, max_y, size - half)))
+    return np.concatenate((on_rows, on_cols))
+
+
+def _sample_near_duplicates(rng, size, min_x, max_x, min_y, max_y, offset=1e-6):
+    """Uniform points where every second point is a tiny offset of the previous one."""
+    base = _sample_uniform(rng, -(-size // 2), min_x, max_x, min_y, max_y)
+    scale = offset * max(max_x - min_x, max_y - min_y)
+    twins = base + rng.uniform(-scale, scale, base.shape)
+    return np.stack((base, twins), axis=1).reshape(-1, 2)[:size]
+
+
+SAMPLERS = {
+    "uniform": _sample_uniform,
+    "clusters": _sample_clusters,
+    "rings": _sample_rings,
+    "rows": _sample_rows,
+    "near-duplicates": _sample_near_duplicates,
+}
+
+
+def _grid(num_points, min_x, max_x, min_y, max_y):
+    """A perfect rectangular grid with roughly the same spacing along both axes."""
+    width, height = max_x - min_x, max_y - min_y
+    cols = max(1, int(np.ceil(np.sqrt(num_points * width / height)))) if height > 0 else num_points
+    rows = -(-num_points // cols)
+    xs = np.linspace(min_x, max_x, cols)
+    ys = np.linspace(min_y, max_y, rows)
+    gx, gy = np.meshgrid(xs, ys)
+    return np.column_stack((gx.ravel(), gy.ravel()))[:num_points]
+
+
+def _sorted_unique_keys(keys):
+    """Sort keys in place and drop repeats (cheaper than the hash-based np.unique)."""
+    keys.sort()
+    distinct = np.empty(len(keys), dtype=bool)
+    distinct[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+    return keys[distinct]
+
+
+def _unique_sorted(points, integer, min_x, min_y, span_y):
+    """
+    Deduplicate points and sort them by x then y in a single vectorized pass.
+    Integer points are packed into one int64 key; float points are viewed as complex numbers,
+    which numpy orders by real part first.
+    """
+    if integer:
+        keys = (points[:, 0].astype(np.int64) - min_x) * span_y + (points[:, 1].astype(np.int64) - min_y)
+        keys = _sorted_unique_keys(keys)
+        return np.column_stack((keys // span_y + min_x, keys % span_y + min_y)).astype(np.float64)
+    keys = _sorted_unique_keys(np.ascontiguousarray(points + 0.0).view(np.complex128).ravel())
+    return keys.view(np.float64).reshape(-1, 2)
+
+
+def generate_points(num_points, distribution="uniform", min_x=0, max_x=1400, min_y=0, max_y=720,
+                    seed=None, integer=True, max_rounds=64):
+    """
+    Generate unique points in a box following one of the benchmark distributions.
+
+    Points are drawn in vectorized batches; each batch is merged with the points collected
+    so far and deduplicated until enough unique points exist. Any surplus is dropped at random.
+
+    Args:
+        num_points (int): Number of unique points to generate
+        distribution (str): One of DISTRIBUTIONS (default: "uniform")
+        min_x, max_x, min_y, max_y: Bounding box of the points
+        seed (int): Seed for reproducible output (default: None, fresh entropy)
+        integer (bool): Round coordinates to integers (default: True); ignored for
+            FLOAT_DISTRIBUTIONS, which are always floats
+        max_rounds (int): Maximum number of sampling batches before giving up
+
+    Returns:
+        numpy.ndarray: Array of shape (num_points, 2), sorted by x then y
+
+    Raises:
+        ValueError: If the arguments are invalid or not enough unique points can be drawn
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    if max_x < min_x or max_y < min_y:
+        raise ValueError("Maximum coordinates must not be smaller than minimum coordinates")
+    if distribution in FLOAT_DISTRIBUTIONS:
+        integer = False
+    if integer:
+        min_x, max_x, min_y, max_y = int(min_x), int(max_x), int(min_y), int(max_y)
+        if num_points > (max_x - min_x + 1) * (max_y - min_y + 1):
+            raise ValueError(f"Cannot fit {num_points} unique integer points in the given box")
+
+    rng = np.random.default_rng(seed)
+    box = (min_x, max_x, min_y, max_y)
+    points = np.empty((0, 2))
+    for _ in range(max_rounds):
+        missing = num_points - len(points)
+        if missing <= 0:
+            break
+        if distribution == "grid":
+            batch = _grid(num_points, *box)
+        else:
+            # Oversample a little so a single batch is usually enough
+            batch = SAMPLERS[distribution](rng, missing + missing // 8 + 16, *box)
+        if integer:
+            batch = np.rint(batch)
+        points = _unique_sorted(np.concatenate((points, batch)), integer, min_x, min_y, max_y - min_y + 1)
+    if len(points) < num_points:
+        raise ValueError(
+            f"Could only generate {len(points)} unique points for distribution '{distribution}'"
+        )
+
+    if len(points) > num_points:
+        keep = np.sort(rng.choice(len(points), num_points, replace=False))
+        points = points[keep]
+    return points
+
+
+def write_points(points, filename, fmt="auto", chunk_size=1_000_000):
+    """
+    Stream points to a file in chunks, so the whole output never sits in memory as text.
+
+    Args:
+        points (numpy.ndarray): Array of shape (n, 2)
+        filename (str): Output filename; a ".gz" suffix compresses the output
+        fmt (str): "text", "f64", "i32" or "auto" to guess from the extension (default: "auto")
+        chunk_size (int): Number of points formatted per write (default: 1,000,000)
+    """
+    if fmt == "auto":
+        fmt = detect_format(filename)
+    integer = np.array_equal(points, np.rint(points))
+    if fmt == "i32" and not integer:
+        raise ValueError("The i32 format requires integer coordinates")
+
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(filename, "wb") as f:
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start:start + chunk_size]
+            if fmt == "text":
+                if integer:
+                    line_format, values = "%d %d\n", chunk.astype(np.int64)
+                else:
+                    line_format, values = "%r %r\n", chunk
+                f.write(((line_format * len(chunk)) % tuple(values.ravel().tolist())).encode())
+            else:
+                f.write(chunk.astype(BINARY_DTYPES[fmt]).tobytes())
+
+
+def generate_random_points(num_points, min_x=0, max_x=1400, min_y=0, max_y=720, filename="input.txt",
+                           distribution="uniform", seed=None, integer=True, fmt="auto", chunk_size=1_000_000):
     """
     Generate random points for a Voronoi diagram and save them to a file.
-    
+
     Args:
         num_points (int): Number of points to generate
         min_x (int): Minimum x coordinate (default: 0)
-        max_x (int): Maximum x coordinate (default: 500)
+        max_x (int): Maximum x coordinate (default: 1400)
         min_y (int): Minimum y coordinate (default: 0)
-        max_y (int): Maximum y coordinate (default: 500)
+        max_y (int): Maximum y coordinate (default: 720)
         filename (str): Output filename (default: "input.txt")
+        distribution (str): One of DISTRIBUTIONS (default: "uniform")
+        seed (int): Seed for reproducible output (default: None)
+        integer (bool): Round coordinates to integers (default: True); ignored for
+            FLOAT_DISTRIBUTIONS
+        fmt (str): Output format, see write_points (default: "auto")
+        chunk_size (int): Number of points written per chunk (default: 1,000,000)
     """
-    # Generate unique random points
-    points = set()
-    while len(points) < num_points:
-        x = random.randint(min_x, max_x)
-        y = random.randint(min_y, max_y)
-        points.add((x, y))
-    
-    # Sort points for consistent output
-    sorted_points = sorted(points)
-    
-    # Write points to file
-    with open(filename, 'w') as f:
-        for x, y in sorted_points:
-            f.write(f"{x} {y}\n")
-    
+    points = generate_points(num_points, distribution, min_x, max_x, min_y, max_y, seed, integer)
+    write_points(points, filename, fmt, chunk_size)
+
     print(f"Generated {num_points} points and saved to {filename}")
 
 if __name__ == "__main__":
@@ -39,10 +229,20 @@ if __name__ == "__main__":
     parser.add_argument('--min-y', type=int, default=50, help='Minimum y coordinate (default: 50)')
     parser.add_argument('--max-y', type=int, default=700, help='Maximum y coordinate (default: 700)')
     parser.add_argument('--output', type=str, default='input.txt', help='Output filename (default: input.txt)')
-    
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform',
+                        help='Point distribution (default: uniform)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible output')
+    parser.add_argument('--float', action='store_true',
+                        help='Keep floating-point coordinates instead of integers '
+                             '(always on for ' + ', '.join(FLOAT_DISTRIBUTIONS) + ')')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='auto',
+                        help='Output format (default: auto, guessed from the file extension)')
+    parser.add_argument('--chunk-size', type=int, default=1_000_000,
+                        help='Number of points written per chunk (default: 1000000)')
+
     # Parse arguments
     args = parser.parse_args()
-    
+
     # Generate points with provided arguments
     generate_random_points(
         num_points=args.num_points,
@@ -50,5 +250,10 @@ if __name__ == "__main__":
         max_x=args.max_x,
         min_y=args.min_y,
         max_y=args.max_y,
-        filename=args.output
+        filename=args.output,
+        distribution=args.distribution,
+        seed=args.seed,
+        integer=not args.float,
+        fmt=args.format,
+        chunk_size=args.chunk_size
     )
@@ -0,0 +1,441 @@
+"""
+Micro-benchmark untuk primitif geometri yang dipakai di dalam sweep.
+
+Setiap primitif diukur terpisah pada beberapa aliran argumen:
+- realistic: argumen yang direkam dari sweep FortunesAlgo sungguhan
+- random: argumen acak yang valid
+- degenerate: kasus-kasus batas (fokus sejajar, titik kolinear, titik di pojok, dll.)
+
+Yang dilaporkan per kombinasi primitif/aliran:
+- ns/call: waktu per panggilan (terbaik dari beberapa pengulangan, dikurangi overhead loop)
+- peak B/call: puncak memori sementara yang dialokasikan satu panggilan (tracemalloc)
+- blocks/call: blok memori yang masih tertahan setelah panggilan (mendeteksi kebocoran)
+
+CPython tidak menyediakan penghitung alokasi kumulatif, sehingga puncak memori
+sementara per panggilan dipakai sebagai ukuran alokasi.
+
+Contoh penggunaan:
+    python micro_benchmark.py
+    python micro_benchmark.py --primitives lb_clip circle_from_three_points --calls 50000
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import FortunesAlgo as fortunes_module
+from Beachline import Arc
+from Circle import Circle
+from FortunesAlgo import FortunesAlgo
+from LiangBarsky import lb_clip
+from LineSegment import LineSegment
+from Parabola import Parabola
+from Rectangle import Rectangle
+from Site import Site, Vector2D
+from Diagram import Diagram
+
+STREAMS = ("realistic", "random", "degenerate")
+
+RECT = Rectangle(0, 0, 1440, 720)
+
+Args = Tuple
+
+
+def _site(rng: random.Random) -> Site:
+    return Site(rng.uniform(RECT.x, RECT.x + RECT.width), rng.uniform(RECT.y, RECT.y + RECT.height))
+
+
+def _boundary_point(rng: random.Random) -> Site:
+    """Titik acak pada salah satu sisi RECT."""
+    side = rng.randrange(4)
+    if side == 0:
+        return Site(rng.uniform(RECT.x, RECT.x + RECT.width), RECT.y)
+    if side == 1:
+        return Site(RECT.x + RECT.width, rng.uniform(RECT.y, RECT.y + RECT.height))
+    if side == 2:
+        return Site(rng.uniform(RECT.x, RECT.x + RECT.width), RECT.y + RECT.height)
+    return Site(RECT.x, rng.uniform(RECT.y, RECT.y + RECT.height))
+
+
+def _arcs(left: Optional[Site], mid: Site, right: Optional[Site]) -> Tuple[Optional[Arc], Arc, Optional[Arc]]:
+    """Membuat tiga arc yang saling terhubung seperti di beachline."""
+    mid_arc = Arc(point=mid)
+    left_arc = Arc(point=left) if left is not None else None
+    right_arc = Arc(point=right) if right is not None else None
+    if left_arc:
+        left_arc.next, mid_arc.prev = mid_arc, left_arc
+    if right_arc:
+        mid_arc.next, right_arc.prev = right_arc, mid_arc
+    return left_arc, mid_arc, right_arc
+
+
+def _check_circle_event(algo: FortunesAlgo, sweep_line_y: float, left, mid, right):
+    """check_circle_event membaca posisi sweep line dari state algoritma."""
+    algo.sweep_line_y = sweep_line_y
+    return algo.check_circle_event(left, mid, right)
+
+
+# ---------------------------------------------------------------------------
+# Aliran argumen random dan degenerate
+# ---------------------------------------------------------------------------
+
+def _random_parabola(rng, n):
+    args = []
+    for _ in range(n):
+        a, b = _site(rng), _site(rng)
+        directrix = max(a.y, b.y) + rng.uniform(1, 100)
+        args.append((Parabola(a, directrix), Parabola(b, directrix)))
+    return args
+
+
+def _degenerate_parabola(rng, n):
+    args = []
+    for i in range(n):
+        a, b = _site(rng), _site(rng)
+        if i % 3 == 0:
+            b = Site(b.x, a.y)  # fokus dengan y sama
+            directrix = a.y + rng.uniform(1, 100)
+        elif i % 3 == 1:
+            directrix = a.y  # fokus kiri tepat di direktriks
+        else:
+            directrix = max(a.y, b.y) + 1e-9  # hampir di direktriks
+        args.append((Parabola(a, directrix), Parabola(b, directrix)))
+    return args
+
+
+def _random_bounds(rng, n):
+    args = []
+    for _ in range(n):
+        left, mid, right = _site(rng), _site(rng), _site(rng)
+        args.append((_arcs(left, mid, right)[1], max(left.y, mid.y, right.y) + rng.uniform(1, 100)))
+    return args
+
+
+def _degenerate_bounds(rng, n):
+    args = []
+    for i in range(n):
+        mid = _site(rng)
+        if i % 3 == 0:
+            arc = _arcs(None, mid, None)[1]  # arc tunggal tanpa tetangga
+        elif i % 3 == 1:
+            arc = _arcs(Site(mid.x - 10, mid.y), mid, Site(mid.x + 10, mid.y))[1]  # fokus sejajar
+        else:
+            arc = _arcs(mid, _site(rng), mid)[1]  # arc yang sama di kiri dan kanan
+        args.append((arc, mid.y + (i % 2) * rng.uniform(1, 100)))
+    return args
+
+
+def _random_circle(rng, n):
+    return [(_site(rng), _site(rng), _site(rng)) for _ in range(n)]
+
+
+def _degenerate_circle(rng, n):
+    args = []
+    for i in range(n):
+        a, b = _site(rng), _site(rng)
+        if i % 2 == 0:
+            c = Site(2 * b.x - a.x, 2 * b.y - a.y)  # kolinear
+        else:
+            c = Site(2 * b.x - a.x + 1e-7, 2 * b.y - a.y)  # hampir kolinear
+        args.append((a, b, c))
+    return args
+
+
+def _random_check(rng, n):
+    algo = FortunesAlgo()
+    args = []
+    for _ in range(n):
+        left, mid, right = _arcs(_site(rng), _site(rng), _site(rng))
+        args.append((algo, rng.uniform(RECT.y, RECT.y + RECT.height), left, mid, right))
+    return args
+
+
+def _degenerate_check(rng, n):
+    algo = FortunesAlgo()
+    args = []
+    for i in range(n):
+        a, b = _site(rng), _site(rng)
+        if i % 3 == 0:
+            left, mid, right = _arcs(None, a, b)  # tanpa tetangga kiri
+        elif i % 3 == 1:
+            left, mid, right = _arcs(a, b, a)  # site yang sama di kiri dan kanan
+        else:
+            left, mid, right = _arcs(a, b, Site(2 * b.x - a.x, 2 * b.y - a.y))  # kolinear
+        args.append((algo, max(a.y, b.y), left, mid, right))
+    return args
+
+
+def _random_clip(rng, n):
+    clipper = RECT.to_clipper()
+    args = []
+    for _ in range(n):
+        a = Site(rng.uniform(-500, 1940), rng.uniform(-500, 1220))
+        b = Site(rng.uniform(-500, 1940), rng.uniform(-500, 1220))
+        args.append((LineSegment(a, b), clipper))
+    return args
+
+
+def _degenerate_clip(rng, n):
+    clipper = RECT.to_clipper()
+    args = []
+    for i in range(n):
+        a = _site(rng)
+        if i % 3 == 0:
+            segment = LineSegment(a, a)  # panjang nol
+        elif i % 3 == 1:
+            segment = LineSegment(Site(RECT.x, a.y), Site(RECT.x, a.y + 10))  # menempel di sisi kiri
+        else:
+            segment = LineSegment(Site(-100, a.y), Site(-50, a.y))  # sejajar dan di luar
+        args.append((segment, clipper))
+    return args
+
+
+def _random_intersection(rng, n):
+    args = []
+    for _ in range(n):
+        direction = Vector2D(rng.uniform(-1, 1), rng.uniform(-1, 1))
+        args.append((RECT, _site(rng), direction))
+    return args
+
+
+def _degenerate_intersection(rng, n):
+    directions = [Vector2D(1, 0), Vector2D(-1, 0), Vector2D(0, 1), Vector2D(0, -1), Vector2D(1, 1)]
+    corners = [RECT.tl, RECT.tr, RECT.bl, RECT.br]
+    args = []
+    for i in range(n):
+        origin = corners[i % 4] if i % 2 else _boundary_point(rng)
+        args.append((RECT, origin, directions[i % len(directions)]))
+    return args
+
+
+def _random_polyline(rng, n):
+    return [(RECT, _boundary_point(rng), _boundary_point(rng)) for _ in range(n)]
+
+
+def _degenerate_polyline(rng, n):
+    corners = [RECT.tl, RECT.tr, RECT.bl, RECT.br]
+    args = []
+    for i in range(n):
+        p = _boundary_point(rng)
+        if i % 3 == 0:
+            args.append((RECT, corners[i % 4], corners[(i + 1) % 4]))  # pojok ke pojok
+        elif i % 3 == 1:
+            args.append((RECT, p, p))  # titik yang sama
+        else:
+            args.append((RECT, p, _site(rng)))  # titik akhir tidak di sisi
+    return args
+
+
+# ---------------------------------------------------------------------------
+# Aliran realistic: argumen direkam dari sweep sungguhan
+# ---------------------------------------------------------------------------
+
+def capture_realistic(num_sites: int, seed: int) -> Dict[str, List[Args]]:
+    """
+    Menjalankan FortunesAlgo pada titik acak dan merekam argumen setiap primitif.
+
+    Args:
+        num_sites: Jumlah titik untuk sweep
+        seed: Seed titik acak
+
+    Returns:
+        Dict nama primitif -> list argumen yang siap dipakai ulang
+    """
+    rng = random.Random(seed)
+    captured: Dict[str, List[Args]] = {name: [] for name in PRIMITIVES}
+    algo = FortunesAlgo()
+    replay_algo = FortunesAlgo()
+
+    # Diambil dari __dict__ agar classmethod dipulihkan apa adanya
+    originals = {
+        "intersection_x": Parabola.__dict__["intersection_x"],
+        "bounds": Arc.__dict__["bounds"],
+        "from_three_points": Circle.__dict__["from_three_points"],
+        "check_circle_event": algo.check_circle_event,
+        "lb_clip": fortunes_module.lb_clip,
+        "intersection": Rectangle.__dict__["intersection"],
+        "polyline": Rectangle.__dict__["get_rect_polyline_for_ccw"],
+    }
+
+    def intersection_x(self, parabola):
+        captured["parabola_intersection_x"].append((Parabola(self.focus, self.directrix_y),
+                                                    Parabola(parabola.focus, parabola.directrix_y)))
+        return originals["intersection_x"](self, parabola)
+
+    def bounds(self, directrix_y):
+        left = self.prev.point if self.prev else None
+        right = self.next.point if self.next else None
+        captured["arc_bounds"].append((_arcs(left, self.point, right)[1], directrix_y))
+        return originals["bounds"](self, directrix_y)
+
+    def from_three_points(p1, p2, p3):
+        captured["circle_from_three_points"].append((p1, p2, p3))
+        return originals["from_three_points"].__func__(Circle, p1, p2, p3)
+
+    def check_circle_event(left, mid, right):
+        arcs = _arcs(left.point if left else None, mid.point, right.point if right else None)
+        captured["check_circle_event"].append((replay_algo, algo.sweep_line_y) + arcs)
+        return originals["check_circle_event"](left, mid, right)
+
+    def clip(line, clipper):
+        captured["lb_clip"].append((LineSegment(line.a, line.b), clipper))
+        return originals["lb_clip"](line, clipper)
+
+    def intersection(self, origin, direction):
+        captured["rect_intersection"].append((Rectangle(self.x, self.y, self.width, self.height), origin, direction))
+        return originals["intersection"](self, origin, direction)
+
+    def polyline(self, start, end):
+        captured["rect_polyline_for_ccw"].append((Rectangle(self.x, self.y, self.width, self.height), start, end))
+        return originals["polyline"](self, start, end)
+
+    Parabola.intersection_x = intersection_x
+    Arc.bounds = bounds
+    Circle.from_three_points = staticmethod(from_three_points)
+    algo.check_circle_event = check_circle_event
+    fortunes_module.lb_clip = clip
+    Rectangle.intersection = intersection
+    Rectangle.get_rect_polyline_for_ccw = polyline
+    try:
+        sites = {_site(rng) for _ in range(num_sites)}
+        algo.compute(sites, Diagram(), RECT)
+    finally:
+        Parabola.intersection_x = originals["intersection_x"]
+        Arc.bounds = originals["bounds"]
+        Circle.from_three_points = originals["from_three_points"]
+        del algo.check_circle_event
+        fortunes_module.lb_clip = originals["lb_clip"]
+        Rectangle.intersection = originals["intersection"]
+        Rectangle.get_rect_polyline_for_ccw = originals["polyline"]
+    return captured
+
+
+# Nama primitif -> (fungsi yang diukur, pembangkit aliran random, pembangkit aliran degenerate)
+PRIMITIVES: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    "parabola_intersection_x": (Parabola.intersection_x, _random_parabola, _degenerate_parabola),
+    "arc_bounds": (Arc.bounds, _random_bounds, _degenerate_bounds),
+    "circle_from_three_points": (Circle.from_three_points, _random_circle, _degenerate_circle),
+    "check_circle_event": (_check_circle_event, _random_check, _degenerate_check),
+    "lb_clip": (lb_clip, _random_clip, _degenerate_clip),
+    "rect_intersection": (Rectangle.intersection, _random_intersection, _degenerate_intersection),
+    "rect_polyline_for_ccw": (Rectangle.get_rect_polyline_for_ccw, _random_polyline, _degenerate_polyline),
+}
+
+
+# ---------------------------------------------------------------------------
+# Pengukuran
+# ---------------------------------------------------------------------------
+
+def _noop(*args):
+    return None
+
+
+def _time_loop(func: Callable, args: List[Args], repeat: int) -> int:
+    """Mengembalikan waktu terbaik (ns) untuk memanggil func pada semua args."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for a in args:
+            func(*a)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+def measure(func: Callable, args: List[Args], calls: int, repeat: int, memory_samples: int) -> Dict:
+    """
+    Mengukur satu primitif pada satu aliran argumen.
+
+    Args:
+        func: Fungsi yang diukur
+        args: Aliran argumen; diulang sampai mencapai jumlah calls
+        calls: Jumlah panggilan per pengulangan
+        repeat: Jumlah pengulangan pengukuran waktu
+        memory_samples: Jumlah panggilan yang diukur memorinya
+
+    Returns:
+        Dict berisi calls, ns_per_call, peak_bytes_per_call, dan retained_blocks_per_call
+    """
+    stream = (args * (calls // len(args) + 1))[:calls]
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        elapsed = _time_loop(func, stream, repeat) - _time_loop(_noop, stream, repeat)
+
+        blocks_before = sys.getallocatedblocks()
+        for a in stream:
+            func(*a)
+        retained = sys.getallocatedblocks() - blocks_before
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        for a in stream[:memory_samples]:
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            func(*a)
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "ns_per_call": max(elapsed, 0) / calls,
+        "peak_bytes_per_call": peak_total / min(memory_samples, len(stream)),
+        "retained_blocks_per_call": retained / calls,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark primitif geometri FortunesAlgo")
+    parser.add_argument("--primitives", nargs="+", choices=list(PRIMITIVES), default=list(PRIMITIVES),
+                        help="Primitif yang diukur (default: semua)")
+    parser.add_argument("--streams", nargs="+", choices=STREAMS, default=list(STREAMS),
+                        help="Aliran argumen (default: semua)")
+    parser.add_argument("--calls", type=int, default=20_000, help="Panggilan per pengukuran (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Pengulangan, diambil yang terbaik (default: 5)")
+    parser.add_argument("--memory-samples", type=int, default=1_000,
+                        help="Panggilan yang diukur memorinya (default: 1000)")
+    parser.add_argument("--sites", type=int, default=300, help="Jumlah titik untuk aliran realistic (default: 300)")
+    parser.add_argument("--seed", type=int, default=7, help="Seed aliran argumen (default: 7)")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+
+    realistic = capture_realistic(args.sites, args.seed) if "realistic" in args.streams else {}
+    results = []
+    print(f"{'primitif':>26} {'aliran':>11} {'ns/call':>10} {'peak B/call':>12} {'blocks/call':>12}")
+    for name in args.primitives:
+        func, random_stream, degenerate_stream = PRIMITIVES[name]
+        for stream_name in args.streams:
+            rng = random.Random(args.seed)
+            if stream_name == "realistic":
+                stream = realistic[name]
+            elif stream_name == "random":
+                stream = random_stream(rng, 1_000)
+            else:
+                stream = degenerate_stream(rng, 1_000)
+            if not stream:
+                continue
+            result = {"primitive": name, "stream": stream_name}
+            result.update(measure(func, stream, args.calls, args.repeat, args.memory_samples))
+            results.append(result)
+            print(f"{name:>26} {stream_name:>11} {result['ns_per_call']:10.0f} "
+                  f"{result['peak_bytes_per_call']:12.0f} {result['retained_blocks_per_call']:12.3f}", flush=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
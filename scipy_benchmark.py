@@ -0,0 +1,227 @@
+"""
+Benchmark diferensial FortunesAlgo terhadap scipy.spatial.Voronoi (Qhull).
+
+Setiap kasus (distribusi, n) menjalankan kedua implementasi pada titik yang sama,
+lalu membandingkan:
+- vertex: setiap vertex Voronoi satu implementasi harus punya pasangan pada
+  implementasi lain dalam jarak toleransi (duplikat dari titik kosirkular diabaikan)
+- ketetanggaan cell: pasangan site yang dipisahkan edge lebih panjang dari
+  toleransi di satu implementasi harus juga bertetangga di implementasi lain
+  (edge nol dari titik kosirkular boleh ada atau tidak)
+- rasio waktu: waktu FortunesAlgo.compute dibagi waktu scipy.spatial.Voronoi
+
+Secara default setiap distribusi dijalankan dengan koordinat integer (seperti input
+GUI) dan float, karena degenerasi grid, rings, dan near-duplicates hanya muncul pada
+koordinat float. rings dan near-duplicates selalu float (input_generator.FLOAT_DISTRIBUTIONS)
+sehingga hanya dijalankan sekali.
+
+Toleransi relatif terhadap diagonal kotak titik. SciPy adalah dependensi opsional
+khusus benchmark ini dan hanya diimpor di sini.
+
+Contoh penggunaan:
+    python scipy_benchmark.py
+    python scipy_benchmark.py --sizes 100 1000 --distributions grid rings --coords float
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from Diagram import Diagram
+from FortunesAlgo import FortunesAlgo
+from Rectangle import Rectangle
+from Site import Site
+from input_generator import DISTRIBUTIONS, FLOAT_DISTRIBUTIONS, generate_points
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+# Mode koordinat yang dijalankan untuk setiap --coords
+COORD_MODES = {"both": (True, False), "integer": (True,), "float": (False,)}
+
+# Kotak tempat titik dibangkitkan, sama dengan benchmark.py
+BOX = (0, 1440, 0, 720)
+
+Pair = Tuple[int, int]
+
+
+def _pair(i: int, j: int) -> Pair:
+    return (i, j) if i < j else (j, i)
+
+
+def fortune_adjacency(diagram: Diagram, index: Dict[Tuple[float, float], int],
+                      tolerance: float) -> Tuple[Set[Pair], Set[Pair]]:
+    """
+    Ketetanggaan cell dari DCEL FortunesAlgo.
+
+    Returns:
+        (pasangan dengan edge > tolerance, semua pasangan termasuk edge nol)
+    """
+    strong, every = set(), set()
+    for cell in diagram.cells:
+        i = index[(cell.site.x, cell.site.y)]
+        first = he = cell.outer_component
+        while he is not None:
+            twin = he.twin
+            face = twin.incident_face if twin is not None else None
+            if face is not None and he.origin is not None and he.destination is not None:
+                pair = _pair(i, index[(face.site.x, face.site.y)])
+                every.add(pair)
+                if math.hypot(he.destination.x - he.origin.x, he.destination.y - he.origin.y) > tolerance:
+                    strong.add(pair)
+            he = he.next
+            if he is first:
+                break
+    return strong, every
+
+
+def scipy_adjacency(vor, tolerance: float) -> Tuple[Set[Pair], Set[Pair]]:
+    """Ketetanggaan cell dari ridge scipy; ridge tak hingga dianggap panjang."""
+    strong, every = set(), set()
+    vertices = vor.vertices
+    for (i, j), (a, b) in zip(vor.ridge_points.tolist(), vor.ridge_vertices):
+        pair = _pair(i, j)
+        every.add(pair)
+        if a < 0 or b < 0 or math.hypot(*(vertices[a] - vertices[b])) > tolerance:
+            strong.add(pair)
+    return strong, every
+
+
+def unmatched_vertices(source: np.ndarray, target: np.ndarray, tolerance: float) -> int:
+    """Jumlah vertex source yang tidak punya vertex target dalam jarak tolerance."""
+    from scipy.spatial import cKDTree
+
+    if not len(source):
+        return 0
+    if not len(target):
+        return len(source)
+    distances, _ = cKDTree(target).query(source, k=1)
+    return int(np.count_nonzero(distances > tolerance))
+
+
+def run_case(distribution: str, n: int, seed: int, integer: bool, rel_tolerance: float) -> Dict:
+    """
+    Menjalankan satu kasus perbandingan.
+
+    Returns:
+        Dict berisi waktu kedua implementasi, rasio, dan jumlah ketidaksesuaian
+    """
+    from scipy.spatial import Voronoi
+
+    integer = integer and distribution not in FLOAT_DISTRIBUTIONS
+    result = {"distribution": distribution, "n": n, "seed": seed, "integer": integer}
+    coords = generate_points(n, distribution, *BOX, seed=seed, integer=integer)
+    tolerance = rel_tolerance * math.hypot(BOX[1] - BOX[0], BOX[3] - BOX[2])
+    result["tolerance"] = tolerance
+
+    start = time.perf_counter()
+    vor = Voronoi(coords)
+    result["scipy_s"] = time.perf_counter() - start
+
+    sites = [Site(x, y) for x, y in coords.tolist()]
+    try:
+        diagram = Diagram()
+        start = time.perf_counter()
+        FortunesAlgo().compute(sites, diagram, Rectangle.bounding(sites, 20.0))
+        result["fortune_s"] = time.perf_counter() - start
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+        return result
+    result["ratio"] = result["fortune_s"] / result["scipy_s"] if result["scipy_s"] > 0 else None
+
+    ours = np.array([(v.x, v.y) for v in diagram.vertices], dtype=np.float64).reshape(-1, 2)
+    result["vertices"] = len(ours)
+    result["scipy_vertices"] = len(vor.vertices)
+    result["missing_vertices"] = unmatched_vertices(vor.vertices, ours, tolerance)
+    result["extra_vertices"] = unmatched_vertices(ours, vor.vertices, tolerance)
+
+    index = {(x, y): i for i, (x, y) in enumerate(coords.tolist())}
+    our_strong, our_every = fortune_adjacency(diagram, index, tolerance)
+    scipy_strong, scipy_every = scipy_adjacency(vor, tolerance)
+    result["adjacencies"] = len(scipy_strong)
+    result["missing_adjacencies"] = len(scipy_strong - our_every)
+    result["extra_adjacencies"] = len(our_strong - scipy_every)
+    result["cells"] = len(diagram.cells)
+
+    mismatched = (result["missing_vertices"] or result["extra_vertices"] or
+                  result["missing_adjacencies"] or result["extra_adjacencies"] or result["cells"] != n)
+    result["status"] = "mismatch" if mismatched else "ok"
+    return result
+
+
+def format_case(case: Dict) -> str:
+    label = f"{case['distribution']:>16} {'int' if case['integer'] else 'float':>5} n={case['n']:>8}"
+    if case["status"] == "error":
+        return f"{label}  ERROR {case['error']}"
+    ratio = f"{case['ratio']:8.1f}x" if case.get("ratio") is not None else "      n/a"
+    flag = "  <-- TIDAK SESUAI" if case["status"] == "mismatch" else ""
+    return (
+        f"{label}  fortune {case['fortune_s']:8.3f}s  scipy {case['scipy_s']:7.3f}s  rasio {ratio}  "
+        f"vertex -{case['missing_vertices']}/+{case['extra_vertices']} dari {case['scipy_vertices']}  "
+        f"tetangga -{case['missing_adjacencies']}/+{case['extra_adjacencies']} dari {case['adjacencies']}  "
+        f"cell {case['cells']}{flag}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark diferensial FortunesAlgo terhadap scipy.spatial.Voronoi")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Jumlah titik per kasus (default: 100 1000 10000)")
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS),
+                        help="Distribusi titik, lihat input_generator.DISTRIBUTIONS")
+    parser.add_argument("--seed", type=int, default=12, help="Seed generator titik (default: 12)")
+    parser.add_argument("--coords", choices=sorted(COORD_MODES), default="both",
+                        help="Koordinat integer, float, atau keduanya (default: both)")
+    parser.add_argument("--float", dest="coords", action="store_const", const="float",
+                        help="Sama dengan --coords float")
+    parser.add_argument("--tolerance", type=float, default=1e-7,
+                        help="Toleransi relatif terhadap diagonal kotak titik (default: 1e-7)")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="Lewati ukuran lebih besar dari satu distribusi jika FortunesAlgo melewati batas ini")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        import scipy.spatial  # noqa: F401
+    except ImportError:
+        print("scipy_benchmark.py membutuhkan scipy (pip install scipy)", file=sys.stderr)
+        return 2
+
+    cases = []
+    modes = COORD_MODES[args.coords]
+    for integer in modes:
+        for distribution in args.distributions:
+            # Distribusi float-only sudah dijalankan pada mode float
+            if integer and distribution in FLOAT_DISTRIBUTIONS and False in modes:
+                continue
+            skip_reason = None
+            for n in sorted(args.sizes):
+                if skip_reason:
+                    case = {"distribution": distribution, "n": n, "integer": integer,
+                            "status": "skipped", "error": skip_reason}
+                    print(f"{distribution:>16} {'int' if integer else 'float':>5} n={n:>8}  dilewati: {skip_reason}",
+                          flush=True)
+                else:
+                    case = run_case(distribution, n, args.seed, integer, args.tolerance)
+                    print(format_case(case), flush=True)
+                    if case["status"] == "error":
+                        skip_reason = f"kasus n={n} gagal"
+                    elif case["fortune_s"] > args.max_seconds:
+                        skip_reason = f"kasus n={n} melewati {args.max_seconds:g}s"
+                cases.append(case)
+
+    failed = [c for c in cases if c["status"] in ("error", "mismatch")]
+    print(f"{len(cases)} kasus, {len(failed)} gagal atau tidak sesuai", flush=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"coords": args.coords, "tolerance": args.tolerance, "cases": cases}, f, indent=1)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Facade untuk memakai diagram Voronoi sebagai library.
+
+Contoh:
+    import voronoi
+    diagram = voronoi.compute([(0, 0), (30, 10), (10, 40)])
+    for cell in diagram.cells:
+        print(cell.site, cell.hull_vertices_ccw())
+
+Modul implementasi tetap berupa modul top-level di direktori repositori
+(FortunesAlgo, Diagram, ...) agar skrip dan impor yang sudah ada tidak berubah.
+Paket ini berada di direktori yang sama, sehingga modul-modul tersebut ikut
+dapat diimpor setiap kali paket ini dapat diimpor.
+
+Impor paket tidak memuat modul lain sama sekali. Setiap nama publik dimuat saat
+pertama kali diakses; compute() hanya memuat inti sweep murni Python. NumPy
+(cache, snapshot, export, viewport, server) dan tkinter (GUI) baru dimuat jika
+fitur yang memakainya diakses. Lihat import_benchmark.py untuk anggaran waktu impor.
+"""
+
+from importlib import import_module
+
+# typing sengaja tidak diimpor (memakan sebagian besar waktu impor paket);
+# anotasi ditulis sebagai string dan tidak pernah dievaluasi
+
+# Nama publik -> (modul, atribut), dimuat saat pertama diakses
+_LAZY = {
+    # Inti (murni Python)
+    "Diagram": ("Diagram", "Diagram"),
+    "Cell": ("Diagram", "Cell"),
+    "HalfEdge": ("Diagram", "HalfEdge"),
+    "Rectangle": ("Rectangle", "Rectangle"),
+    "Site": ("Site", "Site"),
+    "FortunesAlgo": ("FortunesAlgo", "FortunesAlgo"),
+    "SweepStats": ("SweepStats", "SweepStats"),
+    "stream_cells": ("StreamingVoronoi", "stream_cells"),
+    # Fitur berbasis NumPy
+    "EventTrace": ("EventTrace", "EventTrace"),
+    "load_sites": ("SiteLoader", "load_sites"),
+    "DiagramCache": ("DiagramCache", "DiagramCache"),
+    "DiagramSnapshot": ("DiagramSnapshot", "DiagramSnapshot"),
+    "SnapshotPublisher": ("DiagramSnapshot", "SnapshotPublisher"),
+    "SiteIndex": ("ViewportVoronoi", "SiteIndex"),
+    "compute_viewport": ("ViewportVoronoi", "compute_viewport"),
+    "compute_periodic": ("PeriodicVoronoi", "compute_periodic"),
+    "SlidingWindowVoronoi": ("SlidingWindowVoronoi", "SlidingWindowVoronoi"),
+    "delaunay_edges": ("VoronoiGraphs", "delaunay_edges"),
+    "delaunay_from_sites": ("VoronoiGraphs", "delaunay_from_sites"),
+    "gabriel_graph": ("VoronoiGraphs", "gabriel_graph"),
+    "relative_neighbourhood_graph": ("VoronoiGraphs", "relative_neighbourhood_graph"),
+    "euclidean_mst": ("VoronoiGraphs", "euclidean_mst"),
+    "nearest_neighbours": ("VoronoiGraphs", "nearest_neighbours"),
+    "k_nearest_neighbours": ("VoronoiGraphs", "k_nearest_neighbours"),
+    "compute_async": ("AsyncCompute", "compute"),
+    "compute_many_async": ("AsyncCompute", "compute_many"),
+    "ComputeService": ("VoronoiServer", "ComputeService"),
+    # GUI (tkinter)
+    "MainWindow": ("VoronoiApp", "MainWindow"),
+}
+
+__all__ = ["compute", *_LAZY]
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), attribute)
+    # Disimpan di namespace paket agar akses berikutnya tidak melewati __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def compute(sites: "Iterable[Union[Site, Tuple[float, float]]]", clipping_rect: "Optional[Rectangle]" = None,
+            padding: float = 20.0, lazy: bool = False) -> "Diagram":
+    """
+    Menghitung diagram Voronoi dari kumpulan titik.
+
+    Args:
+        sites: Titik-titik input sebagai Site atau pasangan (x, y)
+        clipping_rect: Rectangle clipping; None memakai bounding box titik ditambah padding
+        padding: Jarak tambahan ke setiap sisi bounding box jika clipping_rect None
+        lazy: Jika True, cell dilengkapi dan dipotong saat pertama diakses
+              (lihat Diagram.finalize_all())
+
+    Returns:
+        Diagram Voronoi
+    """
+    from Diagram import Diagram
+    from FortunesAlgo import FortunesAlgo
+    from Rectangle import Rectangle
+    from Site import Site
+
+    points = [site if isinstance(site, Site) else Site(float(site[0]), float(site[1])) for site in sites]
+    if clipping_rect is None:
+        clipping_rect = Rectangle.bounding(points, padding)
+    diagram = Diagram()
+    FortunesAlgo(lazy=lazy).compute(points, diagram, clipping_rect)
+    return diagram
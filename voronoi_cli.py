@@ -0,0 +1,212 @@
+"""
+Runner command-line tanpa GUI untuk menghitung diagram Voronoi.
+
+Modul ini sengaja tidak mengimpor tkinter maupun scipy sehingga bisa
+dijalankan di server atau sebagai subprocess per-request. NumPy hanya dimuat oleh
+jalur yang membutuhkannya (input biner/besar, --cache-dir, --trace); input teks
+biasa dengan output json/text tidak memuatnya.
+
+Contoh penggunaan:
+    python voronoi_cli.py input.txt --format json -o hasil.json
+    cat input.txt | python voronoi_cli.py - --clip 0 0 1440 720
+    python voronoi_cli.py input.txt -f geojson --precision 3 -o hasil.geojson
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional, TextIO
+
+from FortunesAlgo import FortunesAlgo
+from Diagram import Diagram
+from DiagramExport import DEFAULT_LAYERS, LAYERS
+from Rectangle import Rectangle
+from SiteLoader import FORMATS as INPUT_FORMATS, load_site_list
+from SweepStats import SweepStats
+
+try:
+    import resource
+except ImportError:  # Windows tidak memiliki modul resource
+    resource = None
+
+OUTPUT_FORMATS = ("json", "text", "svg", "geojson", "wkb", "flat")
+BINARY_FORMATS = ("wkb", "flat")
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """
+    Mengembalikan puncak resident memory proses ini dalam byte,
+    atau None jika platform tidak mendukung.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan dalam kilobyte, macOS dalam byte
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_json(diagram: Diagram, out: TextIO) -> None:
+    """Menulis cell, vertex, dan edge diagram dalam format JSON."""
+    result = {
+        "cells": [
+            {
+                "site": [cell.site.x, cell.site.y],
+                "vertices": [[v.x, v.y] for v in cell.hull_vertices_ccw()]
+            }
+            for cell in diagram.cells
+        ],
+        "vertices": [[v.x, v.y] for v in diagram.vertices],
+        "edges": [[e.a.x, e.a.y, e.b.x, e.b.y] for e in diagram.iter_edges()]
+    }
+    json.dump(result, out)
+    out.write("\n")
+
+
+def write_text(diagram: Diagram, out: TextIO) -> None:
+    """
+    Menulis diagram dalam format teks berbasis baris:
+        c <site_x> <site_y> <x1> <y1> <x2> <y2> ...   (cell beserta vertex-nya)
+        v <x> <y>                                     (vertex Voronoi)
+        e <x1> <y1> <x2> <y2>                         (edge)
+    """
+    for cell in diagram.cells:
+        coords = " ".join(f"{v.x!r} {v.y!r}" for v in cell.hull_vertices_ccw())
+        out.write(f"c {cell.site.x!r} {cell.site.y!r} {coords}\n")
+    for v in diagram.vertices:
+        out.write(f"v {v.x!r} {v.y!r}\n")
+    for e in diagram.iter_edges():
+        out.write(f"e {e.a.x!r} {e.a.y!r} {e.b.x!r} {e.b.y!r}\n")
+
+
+WRITERS = {
+    "json": write_json,
+    "text": write_text,
+}
+
+
+def write_output(diagram: Diagram, args: argparse.Namespace) -> None:
+    """Menulis diagram ke args.output dengan writer yang sesuai args.format."""
+    binary = args.format in BINARY_FORMATS
+    if args.format in WRITERS:
+        writer = WRITERS[args.format]
+    else:
+        from DiagramExport import BINARY_WRITERS, TEXT_WRITERS
+
+        if args.format == "flat":
+            def writer(d, out):
+                BINARY_WRITERS["flat"](d, out, precision=args.precision)
+        else:
+            def writer(d, out):
+                (BINARY_WRITERS if binary else TEXT_WRITERS)[args.format](
+                    d, out, precision=args.precision, layers=args.layers
+                )
+
+    if args.output == "-":
+        out = sys.stdout.buffer if binary else sys.stdout
+        writer(diagram, out)
+        out.flush()
+    else:
+        with open(args.output, "wb" if binary else "w") as out:
+            writer(diagram, out)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="voronoi",
+        description="Menghitung diagram Voronoi dengan algoritma Fortune tanpa GUI"
+    )
+    parser.add_argument("input", help="File titik (teks 'x y'/'x,y' per baris atau biner), '-' untuk stdin")
+    parser.add_argument("-i", "--input-format", choices=INPUT_FORMATS, default="auto",
+                        help="Format input (default: auto, ditebak dari ekstensi file)")
+    parser.add_argument("-o", "--output", default="-", help="File output, '-' untuk stdout (default: -)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="json",
+                        help="Format output (default: json); svg/geojson/wkb/flat ditulis secara streaming")
+    parser.add_argument("--precision", type=int, metavar="DIGIT",
+                        help="Kuantisasi koordinat ke sejumlah digit desimal (svg, geojson, wkb, flat)")
+    parser.add_argument("--layers", nargs="+", choices=LAYERS, default=list(DEFAULT_LAYERS),
+                        help="Layer yang diekspor untuk svg, geojson, dan wkb (default: cells vertices)")
+    parser.add_argument("--clip", type=float, nargs=4, metavar=("X", "Y", "WIDTH", "HEIGHT"),
+                        help="Rectangle clipping (default: bounding box titik ditambah padding)")
+    parser.add_argument("--padding", type=float, default=20.0,
+                        help="Padding bounding box jika --clip tidak diberikan (default: 20)")
+    parser.add_argument("--stats", metavar="FILE",
+                        help="Tulis statistik sweep (counter dan waktu per fase) sebagai JSON ke FILE, '-' untuk stderr")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Rekam setiap event sweep ke FILE dalam format biner EventTrace")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="Ambil/simpan diagram di cache disk DIR, dengan key fingerprint titik dan clipping")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Tidak mencetak laporan waktu dan memori ke stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Fungsi utama CLI. Mengembalikan exit code."""
+    args = build_parser().parse_args(argv)
+
+    t_start = time.perf_counter()
+    try:
+        source = sys.stdin.buffer if args.input == "-" else args.input
+        points = load_site_list(source, args.input_format)
+    except (OSError, ValueError) as e:
+        print(f"voronoi: gagal memuat titik-titik: {e}", file=sys.stderr)
+        return 1
+    t_load = time.perf_counter()
+
+    diagram = Diagram()
+    stats = SweepStats() if args.stats else None
+    cache = None
+    if points and args.cache_dir and not (args.stats or args.trace):
+        # Statistik dan trace membutuhkan sweep sungguhan sehingga cache tidak dipakai
+        from DiagramCache import DiagramCache
+
+        cache = DiagramCache(directory=args.cache_dir)
+        clipping_rect = Rectangle(*args.clip) if args.clip else Rectangle.bounding(points, args.padding)
+        diagram = cache.compute(points, clipping_rect)
+    elif points:
+        if args.clip:
+            clipping_rect = Rectangle(*args.clip)
+        else:
+            clipping_rect = Rectangle.bounding(points, args.padding)
+        if args.trace:
+            from EventTrace import EventTrace
+
+            with open(args.trace, "wb") as trace_file:
+                FortunesAlgo(stats, EventTrace(trace_file)).compute(set(points), diagram, clipping_rect)
+        else:
+            FortunesAlgo(stats).compute(set(points), diagram, clipping_rect)
+    t_compute = time.perf_counter()
+
+    try:
+        write_output(diagram, args)
+    except OverflowError as e:
+        print(f"voronoi: gagal menulis output: {e}", file=sys.stderr)
+        return 1
+    t_write = time.perf_counter()
+
+    if stats is not None:
+        if args.stats == "-":
+            print(stats.to_json(), file=sys.stderr)
+        else:
+            with open(args.stats, "w") as f:
+                f.write(stats.to_json(indent=1))
+
+    if not args.quiet:
+        cache_str = ""
+        if cache is not None:
+            cache_str = " (cache hit)" if cache.stats.disk_hits else " (cache miss)"
+        peak = peak_memory_bytes()
+        peak_str = f"{peak / (1024 * 1024):.1f} MiB" if peak is not None else "n/a"
+        print(
+            f"voronoi: {len(points)} titik, {len(diagram.cells)} cell, {len(diagram.vertices)} vertex | "
+            f"load {t_load - t_start:.3f}s, compute {t_compute - t_load:.3f}s{cache_str}, "
+            f"write {t_write - t_compute:.3f}s, total {t_write - t_start:.3f}s | "
+            f"peak memory {peak_str}",
+            file=sys.stderr
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())